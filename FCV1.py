@@ -5,40 +5,553 @@ Enhanced with 42 Subliminal Memory Systems
 Version 2.0 - COMPLETE (Systems 1-42) - FIXED
 """
 
-from threading import Timer
+import time
+
+# Reference point for the cold-start phases reported by /healthz
+STARTUP_BEGIN = time.perf_counter()
+
+import argparse
+import functools
+import gzip
+import hashlib
+import http.client
+import importlib.util
+import json
+import math
+import os
+import re
+import signal
+import socket
+import sqlite3
+import statistics
 import subprocess  # Add this import
 import sys
+import tempfile
+import threading
+import urllib.parse
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
-def install_dependencies():
+def install_dependencies(*packages):
     try:
-        subprocess.run(['pip', 'install', 'flask'], check=True)
+        subprocess.run([sys.executable, '-m', 'pip', 'install', *(packages or ('flask',))], check=True)
     except subprocess.CalledProcessError as e:
         print(f"Error installing dependencies: {e}")
         raise
 
-def check_port_availability():
+STARTUP_PHASES = {}
+
+def mark_startup_phase(name):
+    """Record milliseconds elapsed since STARTUP_BEGIN for a cold-start phase."""
+    STARTUP_PHASES[name] = round((time.perf_counter() - STARTUP_BEGIN) * 1000, 1)
+
+def format_startup_phases(phases):
+    ordered = sorted(phases.items(), key=lambda item: item[1])
+    return ' → '.join(f'{name} {ms:.0f} ms' for name, ms in ordered)
+
+def find_free_port(host):
+    """Ask the OS for an unused port on host."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+def wait_for_first_byte(host, port, timeout=30.0):
+    """Poll GET / until the server answers; return when the first body byte arrives."""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        connection = http.client.HTTPConnection(host, port, timeout=timeout)
+        try:
+            connection.request('GET', '/')
+            connection.getresponse().read(1)
+            return time.perf_counter()
+        except OSError:
+            time.sleep(0.005)
+        finally:
+            connection.close()
+    raise TimeoutError(f"Server on {host}:{port} did not respond within {timeout:.0f}s")
+
+def fetch_startup_phases(host, port):
+    connection = http.client.HTTPConnection(host, port, timeout=5)
     try:
-        subprocess.run(['netstat', '-an'], check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error checking port: {e}")
-        return False
-    return True
+        connection.request('GET', '/healthz')
+        return json.loads(connection.getresponse().read())['startup_ms']
+    finally:
+        connection.close()
+
+def benchmark_startup(runs):
+    """Launch the server cold `runs` times and report time-to-first-byte from process start."""
+    host = '127.0.0.1'
+    samples = []
+    phase_samples = {}
+    for run in range(1, runs + 1):
+        port = find_free_port(host)
+        command = [sys.executable, os.path.abspath(__file__), '--port', str(port), '--no-browser']
+        started = time.perf_counter()
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            ttfb = (wait_for_first_byte(host, port) - started) * 1000
+            phases = fetch_startup_phases(host, port)
+        finally:
+            process.terminate()
+            process.wait()
+        samples.append(ttfb)
+        for name, ms in phases.items():
+            phase_samples.setdefault(name, []).append(ms)
+        print(f"   run {run}: {ttfb:.0f} ms ({format_startup_phases(phases)})")
+
+    print(f"⏱️  Time to first byte over {runs} cold starts: "
+          f"min {min(samples):.0f} ms, median {statistics.median(samples):.0f} ms, max {max(samples):.0f} ms")
+    medians = {name: statistics.median(values) for name, values in phase_samples.items()}
+    print(f"   median phases since interpreter reached FCV1.py: {format_startup_phases(medians)}")
+
+def load_test_client(host, port, path, deadline, latencies):
+    """One keep-alive client issuing GET requests back to back until the deadline."""
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    headers = {'Accept-Encoding': 'br, gzip'}
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            connection.request('GET', path, headers=headers)
+            connection.getresponse().read()
+            latencies.append(time.perf_counter() - started)
+    finally:
+        connection.close()
+
+def load_test(url, concurrency_levels, duration):
+    """Report requests/sec and latency percentiles for `url` at each concurrency level.
+
+    The clients are Python threads, so at high concurrency the numbers are a lower
+    bound on what the server can do.
+    """
+    target = urllib.parse.urlsplit(url)
+    host, port, path = target.hostname, target.port or 80, target.path or '/'
+    print(f"📈 Load test of {url} ({duration:.0f}s per level)")
+    print(f"   {'clients':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for clients in concurrency_levels:
+        per_client = [[] for _ in range(clients)]
+        deadline = time.perf_counter() + duration
+        threads = [threading.Thread(target=load_test_client, args=(host, port, path, deadline, latencies))
+                   for latencies in per_client]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(latency for latencies in per_client for latency in latencies)
+        if len(latencies) < 2:
+            print(f"   {clients:>7} {'no responses':>27}")
+            continue
+        percentiles = statistics.quantiles(latencies, n=100)
+        print(f"   {clients:>7} {len(latencies) / elapsed:>9.0f} "
+              f"{percentiles[49] * 1000:>8.2f} {percentiles[98] * 1000:>8.2f}")
+
+class PrecompiledResponse:
+    """Response body built once at startup, with gzip/brotli variants and strong ETags."""
+
+    def __init__(self, body, mimetype, cache_control):
+        self.body = body
+        self.mimetype = mimetype
+        self.cache_control = cache_control
+
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.variants = {None: body, 'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            self.variants['br'] = brotli.compress(body, quality=11)
+        # Each encoding is a distinct representation, so each gets its own strong ETag
+        self.etags = {encoding: digest if encoding is None else f'{digest}-{encoding}'
+                      for encoding in self.variants}
+
+    def negotiate_encoding(self, accept_encodings):
+        for encoding in ('br', 'gzip'):
+            if encoding in self.variants and accept_encodings.quality(encoding) > 0:
+                return encoding
+        return None
+
+    def send(self):
+        encoding = self.negotiate_encoding(request.accept_encodings)
+        etag = self.etags[encoding]
+
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = Response(self.variants[encoding], mimetype=self.mimetype)
+            if encoding:
+                response.headers['Content-Encoding'] = encoding
+
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = self.cache_control
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
+
+STATIC_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Inline blocks moved into fingerprinted files: (pattern, extension, mimetype, replacement tag)
+INLINE_ASSETS = [
+    (re.compile(r'<style>(.*?)</style>', re.S), 'css', 'text/css',
+     '<link rel="stylesheet" href="{url}">'),
+    (re.compile(r'<script>(.*?)</script>', re.S), 'js', 'text/javascript',
+     '<script src="{url}"></script>'),
+]
+
+def build_static_assets(html):
+    """Move the inline CSS and JS of a rendered page into content-hashed static files.
+
+    Returns the slimmed HTML shell and a dict of filename -> PrecompiledResponse.
+    """
+    assets = {}
+    for pattern, extension, mimetype, tag in INLINE_ASSETS:
+        match = pattern.search(html)
+        if not match:
+            continue
+        body = match.group(1).encode('utf-8')
+        filename = f'app.{hashlib.sha256(body).hexdigest()[:16]}.{extension}'
+        assets[filename] = PrecompiledResponse(body, mimetype, STATIC_CACHE_CONTROL)
+        html = html[:match.start()] + tag.format(url=f'/static/{filename}') + html[match.end():]
+    return html, assets
+
+# Log.debug/Log.trace statements in the page script each sit on a line of their own
+DEBUG_LOG_LINE = re.compile(r'^[ \t]*Log\.(?:debug|trace)(?:Every)?\(.*\);[ \t]*\n', re.M)
+DEBUG_LOG_CALL = re.compile(r'\bLog\.(?:debug|trace)(?:Every)?\(')
+DEBUG_BUILD_FLAG = 'const LOG_DEBUG_BUILD = true;'
+
+def strip_debug_logging(html):
+    """Remove Log.debug/Log.trace statements from a rendered page for production.
+
+    Fails loudly if a call survives (e.g. one split over several lines), since a
+    half-removed statement would break the script.
+    """
+    stripped = DEBUG_LOG_LINE.sub('', html)
+    leftover = DEBUG_LOG_CALL.search(stripped)
+    if leftover:
+        line = stripped.count('\n', 0, leftover.start()) + 1
+        raise ValueError(f"debug log call on rendered page line {line} is not a single-line statement")
+    return stripped.replace(DEBUG_BUILD_FLAG, 'const LOG_DEBUG_BUILD = false;')
+
+DB_PATH = os.environ.get('SCHOLAR_SRS_DB',
+                         os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scholar_srs.db'))
+
+# Applied in order; PRAGMA user_version records how many have run
+SCHEMA_MIGRATIONS = [
+    '''
+    CREATE TABLE decks (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        created_at REAL NOT NULL
+    );
+    CREATE TABLE cards (
+        id INTEGER PRIMARY KEY,
+        deck_id INTEGER NOT NULL REFERENCES decks(id) ON DELETE CASCADE,
+        position INTEGER NOT NULL,
+        question TEXT NOT NULL,
+        answer TEXT NOT NULL,
+        correct_count INTEGER NOT NULL DEFAULT 0,
+        wrong_count INTEGER NOT NULL DEFAULT 0,
+        total_seen INTEGER NOT NULL DEFAULT 0,
+        last_reviewed_at REAL
+    );
+    CREATE UNIQUE INDEX cards_deck_position ON cards(deck_id, position);
+    CREATE TABLE review_log (
+        id INTEGER PRIMARY KEY,
+        card_id INTEGER NOT NULL REFERENCES cards(id) ON DELETE CASCADE,
+        correct INTEGER NOT NULL,
+        response_ms REAL,
+        phase INTEGER,
+        reviewed_at REAL NOT NULL
+    );
+    CREATE INDEX review_log_card ON review_log(card_id, reviewed_at);
+    ''',
+    '''
+    ALTER TABLE review_log ADD COLUMN skipped INTEGER NOT NULL DEFAULT 0;
+    ALTER TABLE review_log ADD COLUMN event_id TEXT;
+    CREATE UNIQUE INDEX review_log_event ON review_log(event_id);
+    ''',
+]
+
+# Bound parameters allowed per statement (SQLITE_MAX_VARIABLE_NUMBER was 999 before SQLite 3.32)
+SQLITE_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+REVIEW_COLUMNS = ('event_id', 'card_id', 'correct', 'skipped', 'response_ms', 'phase', 'reviewed_at')
+
+_db_local = threading.local()
+
+def open_db(path):
+    connection = sqlite3.connect(path, timeout=30, cached_statements=256)
+    connection.row_factory = sqlite3.Row
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA synchronous=NORMAL')
+    connection.execute('PRAGMA foreign_keys=ON')
+
+    version = connection.execute('PRAGMA user_version').fetchone()[0]
+    for number, migration in enumerate(SCHEMA_MIGRATIONS[version:], start=version + 1):
+        with connection:
+            connection.executescript(migration)
+            connection.execute(f'PRAGMA user_version = {number}')
+    return connection
+
+def get_db():
+    """The calling thread's connection, opened on first use and reused afterwards.
+
+    Connections are never opened at import time, so gunicorn workers forked from a
+    preloaded master each get their own.
+    """
+    connection = getattr(_db_local, 'connection', None)
+    if connection is None:
+        connection = _db_local.connection = open_db(DB_PATH)
+    return connection
+
+def create_deck(connection, name, cards):
+    """Insert a deck and its (question, answer) pairs; return (deck_id, card_ids)."""
+    with connection:
+        deck_id = connection.execute('INSERT INTO decks (name, created_at) VALUES (?, ?)',
+                                     (name, time.time())).lastrowid
+        connection.executemany(
+            'INSERT INTO cards (deck_id, position, question, answer) VALUES (?, ?, ?, ?)',
+            ((deck_id, position, question, answer) for position, (question, answer) in enumerate(cards)))
+        card_ids = [row[0] for row in connection.execute(
+            'SELECT id FROM cards WHERE deck_id = ? ORDER BY position', (deck_id,))]
+    return deck_id, card_ids
+
+def list_decks(connection):
+    rows = connection.execute(
+        'SELECT decks.id, decks.name, decks.created_at, COUNT(cards.id) AS card_count '
+        'FROM decks LEFT JOIN cards ON cards.deck_id = decks.id '
+        'GROUP BY decks.id ORDER BY decks.id')
+    return [dict(row) for row in rows]
+
+def get_deck(connection, deck_id):
+    row = connection.execute(
+        'SELECT decks.id, decks.name, decks.created_at, COUNT(cards.id) AS card_count '
+        'FROM decks LEFT JOIN cards ON cards.deck_id = decks.id '
+        'WHERE decks.id = ? GROUP BY decks.id', (deck_id,)).fetchone()
+    return dict(row) if row else None
+
+def fetch_cards(connection, deck_id, after, limit):
+    """One page of a deck's cards, keyed on position so deep pages stay cheap."""
+    rows = connection.execute(
+        'SELECT id, position, question, answer, correct_count, wrong_count, total_seen, last_reviewed_at '
+        'FROM cards WHERE deck_id = ? AND position > ? ORDER BY position LIMIT ?',
+        (deck_id, after, limit))
+    return [dict(row) for row in rows]
+
+def insert_rows(connection, table, columns, rows):
+    """INSERT rows using as few multi-row statements as the parameter limit allows."""
+    per_statement = max(1, SQLITE_MAX_VARIABLES // len(columns))
+    placeholder = '(' + ', '.join('?' * len(columns)) + ')'
+    for start in range(0, len(rows), per_statement):
+        chunk = rows[start:start + per_statement]
+        connection.execute(
+            f'INSERT INTO {table} ({", ".join(columns)}) VALUES {", ".join([placeholder] * len(chunk))}',
+            [value for row in chunk for value in row])
+
+def logged_event_ids(connection, event_ids):
+    logged = set()
+    for start in range(0, len(event_ids), SQLITE_MAX_VARIABLES):
+        chunk = event_ids[start:start + SQLITE_MAX_VARIABLES]
+        logged.update(row[0] for row in connection.execute(
+            f'SELECT event_id FROM review_log WHERE event_id IN ({", ".join("?" * len(chunk))})', chunk))
+    return logged
+
+def existing_card_ids(connection, card_ids):
+    existing = set()
+    for start in range(0, len(card_ids), SQLITE_MAX_VARIABLES):
+        chunk = card_ids[start:start + SQLITE_MAX_VARIABLES]
+        existing.update(row[0] for row in connection.execute(
+            f'SELECT id FROM cards WHERE id IN ({", ".join("?" * len(chunk))})', chunk))
+    return existing
+
+def record_reviews(connection, reviews):
+    """Append a batch of review events to the log and fold them into the per-card counters.
+
+    Events whose event_id is already logged (a retried or beaconed batch) are dropped,
+    so counters move exactly once per event. So are events for cards that no longer
+    exist (a reset database or deleted deck), rather than failing the whole batch.
+    Returns (number of new events, sorted unknown card ids).
+    """
+    with connection:
+        # Take the write lock up front so the duplicate check and the insert see the same log
+        connection.execute('BEGIN IMMEDIATE')
+        unique = {review['event_id'] or id(review): review for review in reviews}
+        logged = logged_event_ids(connection, [r['event_id'] for r in reviews if r['event_id']])
+        fresh = [review for key, review in unique.items() if key not in logged]
+        card_ids = {review['card_id'] for review in fresh}
+        known = existing_card_ids(connection, list(card_ids))
+        fresh = [review for review in fresh if review['card_id'] in known]
+
+        totals = {}
+        for review in fresh:
+            correct, wrong, seen, last = totals.get(review['card_id'], (0, 0, 0, 0.0))
+            answered = not review['skipped']
+            totals[review['card_id']] = (correct + (answered and review['correct']),
+                                         wrong + (answered and not review['correct']),
+                                         seen + 1, max(last, review['reviewed_at']))
+
+        insert_rows(connection, 'review_log', REVIEW_COLUMNS,
+                    [tuple(review[column] for column in REVIEW_COLUMNS) for review in fresh])
+        connection.executemany(
+            'UPDATE cards SET correct_count = correct_count + ?, wrong_count = wrong_count + ?, '
+            'total_seen = total_seen + ?, last_reviewed_at = MAX(COALESCE(last_reviewed_at, 0), ?) '
+            'WHERE id = ?',
+            ((correct, wrong, seen, last, card_id) for card_id, (correct, wrong, seen, last) in totals.items()))
+    return len(fresh), sorted(card_ids - known)
+
+IMPORT_BATCH_SIZE = 1000
+MAX_REPORTED_INVALID_LINES = 100
+
+def parse_deck_line(line):
+    """Split one 'Question::Answer' line the way the client's Input.parseQuestions does."""
+    parts = line.strip().split('::')
+    if len(parts) == 2 and parts[0].strip() and parts[1].strip():
+        return parts[0].strip(), parts[1].strip()
+    return None
+
+def import_deck(connection, name, lines):
+    """Stream 'Question::Answer' lines (bytes) into a new deck in constant memory.
+
+    Cards are committed in batches so a slow upload never holds the write lock for
+    long; if the import fails part-way the partial deck is deleted again. Returns a
+    report whose id is None when no line was valid.
+    """
+    with connection:
+        deck_id = connection.execute('INSERT INTO decks (name, created_at) VALUES (?, ?)',
+                                     (name, time.time())).lastrowid
+
+    card_count = invalid_count = line_number = 0
+    invalid_lines = []
+    batch = []
+
+    def store(batch):
+        with connection:
+            insert_rows(connection, 'cards', ('deck_id', 'position', 'question', 'answer'), batch)
+
+    try:
+        for line_number, raw in enumerate(lines, start=1):
+            line = raw.decode('utf-8', errors='replace')
+            if not line.strip():
+                continue
+            card = parse_deck_line(line)
+            if card is None:
+                invalid_count += 1
+                if len(invalid_lines) < MAX_REPORTED_INVALID_LINES:
+                    invalid_lines.append(line_number)
+                continue
+            batch.append((deck_id, card_count, card[0], card[1]))
+            card_count += 1
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                store(batch)
+                batch = []
+        if batch:
+            store(batch)
+    except BaseException:
+        with connection:
+            connection.execute('DELETE FROM decks WHERE id = ?', (deck_id,))
+        raise
+
+    if card_count == 0:
+        with connection:
+            connection.execute('DELETE FROM decks WHERE id = ?', (deck_id,))
+        deck_id = None
+    return {'id': deck_id, 'card_count': card_count, 'lines': line_number,
+            'invalid_count': invalid_count, 'invalid_lines': invalid_lines}
 
-def open_browser():
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def benchmark_import(line_count):
+    """Import a generated deck of line_count lines from disk and report throughput and peak RSS."""
+    with tempfile.TemporaryDirectory() as directory:
+        deck_path = os.path.join(directory, 'deck.txt')
+        with open(deck_path, 'w', encoding='utf-8') as deck:
+            for number in range(line_count):
+                # One malformed line in a thousand exercises the error report
+                deck.write(f'Question number {number}?\n' if number % 1000 == 999
+                           else f'Question number {number}?::Answer {number}\n')
+        size_mb = os.path.getsize(deck_path) / (1024 * 1024)
+
+        connection = open_db(os.path.join(directory, 'bench.db'))
+        rss_before = peak_rss_mb()
+        started = time.perf_counter()
+        with open(deck_path, 'rb') as deck:
+            report = import_deck(connection, 'benchmark', deck)
+        elapsed = time.perf_counter() - started
+        rss_after = peak_rss_mb()
+        connection.close()
+
+    print(f"📥 Imported {report['card_count']:,} cards from {report['lines']:,} lines ({size_mb:.0f} MB) "
+          f"in {elapsed:.2f}s: {report['lines'] / elapsed:,.0f} lines/s, "
+          f"{report['invalid_count']:,} invalid lines")
+    if rss_after is not None:
+        print(f"   peak RSS of the process {rss_after:.1f} MB ({rss_before:.1f} MB before the import started)")
+
+def open_browser(url):
     import webbrowser
-    webbrowser.open('http://127.0.0.1:5000')
+    webbrowser.open(url)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scholar's Spaced Repetition System server")
+    parser.add_argument('--host', default='127.0.0.1', help='address to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=5000, help='port to bind (default: 5000)')
+    parser.add_argument('--strict-port', action='store_true',
+                        help='exit instead of binding a free port when --port is taken')
+    parser.add_argument('--no-browser', action='store_true', help='do not open a browser window')
+    parser.add_argument('--db', default=DB_PATH, help=f'SQLite database for decks and reviews (default: {DB_PATH})')
+    parser.add_argument('--bench-startup', type=int, metavar='RUNS', nargs='?', const=5,
+                        help='measure cold-start time-to-first-byte over RUNS launches and exit')
+
+    production = parser.add_argument_group('production serving')
+    production.add_argument('--serve', action='store_true',
+                            help='serve with a production WSGI server instead of the development server')
+    production.add_argument('--server', choices=['auto', 'gunicorn', 'waitress'], default='auto',
+                            help='WSGI server for --serve; auto prefers gunicorn, waitress on Windows')
+    production.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='worker processes (gunicorn only, default: CPU count)')
+    production.add_argument('--threads', type=int, default=8, help='threads per worker (default: 8)')
+    production.add_argument('--keep-alive', type=int, default=5,
+                            help='seconds to keep idle connections open (default: 5)')
+    production.add_argument('--graceful-timeout', type=int, default=10,
+                            help='seconds to let in-flight requests finish on shutdown (default: 10)')
+
+    parser.add_argument('--bench-import', type=int, metavar='LINES', nargs='?', const=1_000_000,
+                        help='benchmark the streaming deck import with LINES generated lines and exit')
+
+    load = parser.add_argument_group('load testing')
+    load.add_argument('--load-test', metavar='URL', nargs='?', const='http://127.0.0.1:5000/',
+                      help='load test a running server (default: http://127.0.0.1:5000/) and exit')
+    load.add_argument('--concurrency', default='1,8,64',
+                      help='comma-separated client counts for --load-test (default: 1,8,64)')
+    load.add_argument('--duration', type=float, default=10, help='seconds per concurrency level (default: 10)')
+    return parser.parse_args()
 
-# Install dependencies first
-install_dependencies()
+# Only fall back to pip when Flask is actually missing
+if importlib.util.find_spec('flask') is None:
+    install_dependencies()
 
 # Import Flask
 try:
-    from flask import Flask, render_template_string
+    from flask import Flask, Response, abort, jsonify, render_template_string, request
+    from werkzeug.serving import make_server
 except ImportError:
     print("Failed to import Flask. Please make sure it's installed.")
     sys.exit(1)
 
-app = Flask(__name__)
+mark_startup_phase('import')
+
+# Static files are generated from HTML_TEMPLATE at startup, not read from a folder
+app = Flask(__name__, static_folder=None)
 
 # HTML template with modular, extensible architecture and 42 Memory Systems
 HTML_TEMPLATE = r'''<!DOCTYPE html>
@@ -556,6 +1069,35 @@ HTML_TEMPLATE = r'''<!DOCTYPE html>
             flex-wrap: wrap;
         }
         
+        .deck-drop {
+            margin-top: 0.75rem;
+            padding: 1rem;
+            border: 2px dashed var(--leather);
+            border-radius: 3px;
+            text-align: center;
+            color: var(--ink);
+            transition: border-color 0.3s ease, background 0.3s ease;
+        }
+        
+        .deck-drop.dragging {
+            border-color: var(--forest-green);
+            background: rgba(30, 58, 42, 0.05);
+        }
+        
+        .deck-pick {
+            display: inline;
+            margin: 0;
+            font-size: inherit;
+            text-decoration: underline;
+            cursor: pointer;
+        }
+        
+        .deck-status {
+            margin-top: 0.5rem;
+            font-size: 0.9rem;
+            font-style: italic;
+        }
+        
         .error {
             color: var(--burgundy);
             font-size: 0.9rem;
@@ -964,6 +1506,43 @@ HTML_TEMPLATE = r'''<!DOCTYPE html>
             z-index: 988;
             transition: opacity 16ms ease-out;
         }
+        
+        /* Memory system profiler overlay (?profile=1, Alt+Shift+P) */
+        .profiler-overlay {
+            position: fixed;
+            top: 10px;
+            right: 10px;
+            max-height: 80vh;
+            overflow: auto;
+            z-index: 10000;
+            padding: 0.5rem;
+            background: rgba(20, 20, 20, 0.9);
+            color: #eee;
+            font: 11px/1.4 monospace;
+            border-radius: 3px;
+        }
+        
+        .profiler-overlay table {
+            border-collapse: collapse;
+        }
+        
+        .profiler-overlay td, .profiler-overlay th {
+            padding: 0 0.4rem;
+            text-align: right;
+        }
+        
+        .profiler-overlay td:nth-child(2) {
+            text-align: left;
+        }
+        
+        .profiler-overlay tr.long-task {
+            color: #ff8a80;
+        }
+        
+        .profiler-overlay button {
+            margin-top: 0.5rem;
+            font: inherit;
+        }
     </style>
 </head>
 <body>
@@ -1003,6 +1582,15 @@ What is the capital of France?::Paris
 What year did WW2 end?::1945
 When was the Declaration of Independence signed?::1776
 What is the speed of light?::299,792,458 meters per second"></textarea>
+                    <div class="deck-drop" id="deck-drop">
+                        Drop a .txt deck here or <label for="deck-file" class="deck-pick">choose a file</label>
+                        <input type="file" id="deck-file" accept=".txt,text/plain" hidden>
+                        <div class="deck-status" id="deck-status"></div>
+                        <div class="deck-status" id="deck-restore" hidden>
+                            <span id="deck-restore-label"></span>
+                            <a href="#" class="deck-pick" id="deck-restore-link">Restore it</a>
+                        </div>
+                    </div>
                     <div class="error" id="questions-error"></div>
                 </div>
                 
@@ -1161,8 +1749,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
             // System Configuration
             BREAK_INTERVAL: 25 * 60 * 1000, // 25 minutes in ms
             BREAK_DURATION: 5 * 60, // 5 minutes in seconds
-            PROGRESS_UPDATE_INTERVAL: 50, // ms
+            PHASE_OVERTIME_CHECK_INTERVAL: 250, // ms, while waiting for the last unseen cards
             MOVING_AVERAGE_WINDOW: 10,
+            RATE_SAMPLE_INTERVAL: 50, // ms of study time per cards-per-minute sample
             
             // Phase System Configuration
             PHASES: [
@@ -1195,6 +1784,692 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 MIN_WRONG_FOR_DIFFICULT: 2,
                 MASTERY_CONSECUTIVE_CORRECT: 3,
                 MASTERY_MIN_SEEN: 3
+            },
+            
+            // Card selection: 'shuffle' takes phase queues in shuffled order, 'due'
+            // takes the most overdue card first (?schedule=due overrides MODE)
+            SCHEDULING: {
+                MODE: 'shuffle',
+                RELEARN_INTERVAL: 1, // minutes before a wrong answer comes back
+                SKIP_INTERVAL: 2, // minutes
+                // The due heap re-keys for System 2's interval scaling once it has
+                // drifted by REKEY_SCALE_STEP, and at most once per REKEY_FRACTION
+                // of the queue's length in picks, so per-answer cost stays O(log n)
+                // amortized. Cards queued in between keep their older due times.
+                REKEY_SCALE_STEP: 1.25,
+                REKEY_FRACTION: 1 / 32,
+                REKEY_MIN_OPS: 32
+            },
+            
+            // Review Event Sync
+            SYNC: {
+                FLUSH_INTERVAL: 15000, // ms
+                MAX_BATCH: 500,
+                BODY_LIMIT: 65536, // bytes; browsers cap keepalive fetches and beacons here
+                UNRESOLVED_TTL: 600 // s; events whose card never got a server id are then dropped
+            }
+        };
+        
+        // ========================================
+        // LOGGING
+        // ========================================
+        // The server deletes every line that starts with a Log.debug or Log.trace
+        // call (including the *Every variants) from the production bundle, so
+        // those calls must be single-line statements and cost nothing unless the
+        // page is opened with ?log=debug or ?log=trace. Pass a function instead
+        // of a message to defer building expensive strings until a call is kept.
+        const LOG_DEBUG_BUILD = true;
+        
+        const Log = {
+            LEVELS: { error: 0, warn: 1, info: 2, debug: 3, trace: 4 },
+            STORAGE_KEY: 'scholarSRS.logLevel',
+            level: 2,
+            sampleCounts: new Map(),
+            
+            init() {
+                const requested = new URLSearchParams(location.search).get('log')
+                    || localStorage.getItem(this.STORAGE_KEY);
+                if (requested in this.LEVELS) this.level = this.LEVELS[requested];
+            },
+            
+            // Runtime toggle, e.g. Log.setLevel('trace') from the console; persists across reloads
+            setLevel(name) {
+                if (!(name in this.LEVELS)) throw new Error(`Unknown log level: ${name}`);
+                this.level = this.LEVELS[name];
+                localStorage.setItem(this.STORAGE_KEY, name);
+                if (this.level >= this.LEVELS.debug && !LOG_DEBUG_BUILD) {
+                    console.info(`Debug statements are not in this build; reload with ?log=${name} to include them`);
+                }
+            },
+            
+            emit(level, args) {
+                if (this.LEVELS[level] > this.level) return;
+                if (typeof args[0] === 'function') args = [].concat(args[0]());
+                const method = level === 'trace' ? 'debug' : level;
+                console[method](`[${level}]`, ...args);
+            },
+            
+            // Keep only every n-th call per key, for per-card and per-tick paths
+            emitEvery(level, every, key, args) {
+                if (this.LEVELS[level] > this.level) return;
+                const count = (this.sampleCounts.get(key) || 0) + 1;
+                this.sampleCounts.set(key, count);
+                if (count % every === 1 || every === 1) this.emit(level, args);
+            },
+            
+            error(...args) { this.emit('error', args); },
+            warn(...args) { this.emit('warn', args); },
+            info(...args) { this.emit('info', args); },
+            debug(...args) { this.emit('debug', args); },
+            trace(...args) { this.emit('trace', args); },
+            debugEvery(every, key, ...args) { this.emitEvery('debug', every, key, args); },
+            traceEvery(every, key, ...args) { this.emitEvery('trace', every, key, args); }
+        };
+        
+        // ========================================
+        // DECK PARSING
+        // ========================================
+        // These functions are also serialized into the deck file worker, so they
+        // must not reference anything outside their own bodies and each other.
+        
+        // One 'Question::Answer' line -> [question, answer], or null if invalid
+        function parseDeckLine(line) {
+            const parts = line.trim().split('::');
+            if (parts.length === 2 && parts[0].trim() && parts[1].trim()) {
+                return [parts[0].trim(), parts[1].trim()];
+            }
+            return null;
+        }
+        
+        // FNV-1a over a deck's bytes, fed chunk by chunk (pass the previous result
+        // as hash). With the size it identifies the same material dropped again.
+        function deckHash(bytes, hash = 0x811c9dc5) {
+            for (let i = 0; i < bytes.length; i++) {
+                hash = Math.imul(hash ^ bytes[i], 0x01000193);
+            }
+            return hash >>> 0;
+        }
+        
+        // Returns a function to feed a deck's lines to one at a time. Lines are
+        // numbered the way an editor shows them: every physical line counts, blank
+        // ones included, and blank lines are skipped rather than reported. The
+        // server's import_deck numbers lines the same way.
+        function deckLineReader(onCard, onInvalid) {
+            let lineNumber = 0;
+            return (line) => {
+                lineNumber++;
+                if (!line.trim()) return;
+                const card = parseDeckLine(line);
+                if (card) onCard(card[0], card[1]);
+                else onInvalid(lineNumber);
+            };
+        }
+        
+        // Worker entry point: stream a dropped File, post progress and card chunks.
+        // A chunk is one UTF-8 buffer holding question, answer, question, ... and a
+        // Uint32Array of byte offsets into it; both buffers are transferred.
+        function deckWorkerMain() {
+            const CHUNK_CARDS = 2000;
+            const PROGRESS_INTERVAL = 100; // ms
+            const MAX_REPORTED_INVALID_LINES = 100;
+            const encoder = new TextEncoder();
+            
+            let pending = [];
+            let pendingLength = 0;
+            
+            function postChunk() {
+                const offsets = new Uint32Array(pending.length + 1);
+                // Three UTF-8 bytes per UTF-16 code unit is the worst case
+                const bytes = new Uint8Array(pendingLength * 3);
+                let position = 0;
+                pending.forEach((text, index) => {
+                    position += encoder.encodeInto(text, bytes.subarray(position)).written;
+                    offsets[index + 1] = position;
+                });
+                self.postMessage({ type: 'cards', offsets, bytes }, [offsets.buffer, bytes.buffer]);
+                pending = [];
+                pendingLength = 0;
+            }
+            
+            self.onmessage = async (event) => {
+                const file = event.data;
+                const reader = file.stream().getReader();
+                const decoder = new TextDecoder();
+                const invalidLines = [];
+                let carry = '';
+                let cardCount = 0;
+                let invalidCount = 0;
+                let loaded = 0;
+                let lastProgress = 0;
+                let hash;
+                
+                const handleLine = deckLineReader((question, answer) => {
+                    pending.push(question, answer);
+                    pendingLength += question.length + answer.length;
+                    cardCount++;
+                    if (pending.length >= CHUNK_CARDS * 2) postChunk();
+                }, (lineNumber) => {
+                    invalidCount++;
+                    if (invalidLines.length < MAX_REPORTED_INVALID_LINES) invalidLines.push(lineNumber);
+                });
+                
+                try {
+                    for (;;) {
+                        const { done, value } = await reader.read();
+                        if (!done) hash = deckHash(value, hash);
+                        const lines = (carry + (done ? decoder.decode() : decoder.decode(value, { stream: true }))).split('\n');
+                        // The last piece may be a line cut in half by the chunk boundary
+                        carry = done ? '' : lines.pop();
+                        lines.forEach(handleLine);
+                        if (done) break;
+                        
+                        loaded += value.byteLength;
+                        const now = performance.now();
+                        if (now - lastProgress >= PROGRESS_INTERVAL) {
+                            lastProgress = now;
+                            self.postMessage({ type: 'progress', loaded, total: file.size, cards: cardCount });
+                        }
+                    }
+                    if (pending.length) postChunk();
+                    self.postMessage({ type: 'done', cards: cardCount, invalidCount, invalidLines, hash: hash ?? deckHash([]) });
+                } catch (error) {
+                    self.postMessage({ type: 'error', message: error.message });
+                }
+            };
+        }
+        
+        // ========================================
+        // STREAMING STATISTICS
+        // ========================================
+        // Rolling windows over a Float64Array, used for every sliding window in
+        // State: push, sum and mean are O(1) and allocation-free, sub-window
+        // aggregates are O(k). The running sum is recomputed exactly each time the
+        // ring wraps, so float drift cannot build up over a long session.
+        const StreamStats = {
+            window(size) {
+                return {
+                    values: new Float64Array(size),
+                    size,
+                    count: 0,
+                    head: 0, // Next slot to write; the oldest value once full
+                    sum: 0,
+                    
+                    push(value) {
+                        if (this.count === this.size) this.sum -= this.values[this.head];
+                        else this.count++;
+                        this.values[this.head] = value;
+                        this.sum += value;
+                        if (++this.head === this.size) {
+                            this.head = 0;
+                            this.sum = this.sumRange(0, this.size);
+                        }
+                    },
+                    
+                    mean() {
+                        return this.count ? this.sum / this.count : 0;
+                    },
+                    
+                    isFull() {
+                        return this.count === this.size;
+                    },
+                    
+                    oldest() {
+                        return this.values[this.count === this.size ? this.head : 0];
+                    },
+                    
+                    newest() {
+                        return this.values[(this.head - 1 + this.size) % this.size];
+                    },
+                    
+                    // i = 0 is the oldest value
+                    at(i) {
+                        return this.values[((this.count === this.size ? this.head : 0) + i) % this.size];
+                    },
+                    
+                    sumFirst(k) {
+                        return this.sumRange(this.count === this.size ? this.head : 0, Math.min(k, this.count));
+                    },
+                    
+                    sumLast(k) {
+                        const n = Math.min(k, this.count);
+                        return this.sumRange((this.head - n + this.size) % this.size, n);
+                    },
+                    
+                    // n values starting at slot, wrapping around the end of the ring
+                    sumRange(slot, n) {
+                        let sum = 0;
+                        for (let i = 0; i < n; i++) {
+                            sum += this.values[slot];
+                            if (++slot === this.size) slot = 0;
+                        }
+                        return sum;
+                    },
+                    
+                    meanLast(k) {
+                        const n = Math.min(k, this.count);
+                        return n ? this.sumLast(n) / n : 0;
+                    },
+                    
+                    // Oldest to newest, e.g. for (const value of window)
+                    *[Symbol.iterator]() {
+                        for (let i = 0; i < this.count; i++) yield this.at(i);
+                    },
+                    
+                    clear() {
+                        this.values.fill(0);
+                        this.count = 0;
+                        this.head = 0;
+                        this.sum = 0;
+                    }
+                };
+            }
+        };
+        
+        // ========================================
+        // CARD QUEUE
+        // ========================================
+        // A phase queue: a growable ring of card ids in a Uint32Array, resolved
+        // through the deck array it was created for (card.id is the card's index
+        // there). popFront and pushBack are O(1); insertAt moves whichever side of
+        // the insertion point is shorter, so inserting near the front is O(position).
+        const CardQueue = {
+            create(cards, capacity = 16) {
+                let size = 16;
+                while (size < capacity) size *= 2;
+                
+                return {
+                    cards,
+                    ids: new Uint32Array(size),
+                    mask: size - 1,
+                    head: 0,
+                    length: 0,
+                    
+                    at(i) {
+                        return i >= 0 && i < this.length ? this.cards[this.ids[(this.head + i) & this.mask]] : undefined;
+                    },
+                    
+                    pushBack(card) {
+                        if (this.length === this.ids.length) this.grow();
+                        this.ids[(this.head + this.length) & this.mask] = card.id;
+                        this.length++;
+                    },
+                    
+                    popFront() {
+                        if (this.length === 0) return undefined;
+                        const card = this.cards[this.ids[this.head]];
+                        this.head = (this.head + 1) & this.mask;
+                        this.length--;
+                        return card;
+                    },
+                    
+                    insertAt(position, card) {
+                        position = Math.max(0, Math.min(position, this.length));
+                        if (this.length === this.ids.length) this.grow();
+                        
+                        if (position < this.length / 2) {
+                            // Open the gap by moving the front part one slot towards the head
+                            this.head = (this.head - 1) & this.mask;
+                            for (let i = 0; i < position; i++) {
+                                this.ids[(this.head + i) & this.mask] = this.ids[(this.head + i + 1) & this.mask];
+                            }
+                        } else {
+                            for (let i = this.length; i > position; i--) {
+                                this.ids[(this.head + i) & this.mask] = this.ids[(this.head + i - 1) & this.mask];
+                            }
+                        }
+                        this.ids[(this.head + position) & this.mask] = card.id;
+                        this.length++;
+                    },
+                    
+                    // Fisher-Yates over the ring, in place
+                    shuffle() {
+                        for (let i = this.length - 1; i > 0; i--) {
+                            const j = Math.floor(Math.random() * (i + 1));
+                            const a = (this.head + i) & this.mask;
+                            const b = (this.head + j) & this.mask;
+                            const id = this.ids[a];
+                            this.ids[a] = this.ids[b];
+                            this.ids[b] = id;
+                        }
+                    },
+                    
+                    grow() {
+                        const ids = new Uint32Array(this.ids.length * 2);
+                        for (let i = 0; i < this.length; i++) ids[i] = this.ids[(this.head + i) & this.mask];
+                        this.ids = ids;
+                        this.mask = ids.length - 1;
+                        this.head = 0;
+                    },
+                    
+                    forEach(fn) {
+                        for (let i = 0; i < this.length; i++) fn(this.at(i), i);
+                    },
+                    
+                    filter(fn) {
+                        const result = [];
+                        this.forEach(card => { if (fn(card)) result.push(card); });
+                        return result;
+                    },
+                    
+                    slice(start = 0, end = this.length) {
+                        const result = [];
+                        for (let i = Math.max(0, start); i < Math.min(end, this.length); i++) result.push(this.at(i));
+                        return result;
+                    }
+                };
+            },
+            
+            from(cards, list) {
+                const queue = this.create(cards, list.length);
+                list.forEach(card => queue.pushBack(card));
+                return queue;
+            }
+        };
+        
+        // ========================================
+        // DUE HEAP
+        // ========================================
+        // The 'due' scheduling mode's phase queue: a binary min-heap of card ids
+        // keyed on key(card) (card.due by default, in session minutes), with a
+        // position index per card so re-adding a queued card re-keys it instead of
+        // duplicating it. When keys depend on outside state, epoch() reports it;
+        // a change re-keys the whole heap (O(n)) on the next read, but no sooner
+        // than rekeyAfter pushes/pops after the last re-key, which bounds the
+        // amortized cost. Until then the old keys stand. It offers the same
+        // interface as CardQueue; "front" is the most overdue card, and
+        // forEach/filter visit cards in heap order.
+        const DueHeap = {
+            create(cards, capacity = 16, { key = card => card.due, epoch = () => 0, rekeyAfter = 0 } = {}) {
+                return {
+                    cards,
+                    key,
+                    epoch,
+                    keyedEpoch: epoch(),
+                    rekeyAfter,
+                    opsSinceKeyed: 0,
+                    ids: new Uint32Array(Math.max(16, capacity)),
+                    keys: new Float64Array(Math.max(16, capacity)),
+                    positions: new Int32Array(cards.length).fill(-1),
+                    length: 0,
+                    
+                    at(i) {
+                        if (i < 0 || i >= this.length) return undefined;
+                        this.refresh();
+                        return i === 0 ? this.cards[this.ids[0]] : this.slice(i, i + 1)[0];
+                    },
+                    
+                    pushBack(card) {
+                        this.refresh();
+                        this.opsSinceKeyed++;
+                        const position = this.positions[card.id];
+                        if (position >= 0) {
+                            this.keys[position] = this.key(card);
+                            this.siftDown(this.siftUp(position));
+                            return;
+                        }
+                        if (this.length === this.ids.length) this.grow();
+                        this.ids[this.length] = card.id;
+                        this.keys[this.length] = this.key(card);
+                        this.positions[card.id] = this.length;
+                        this.siftUp(this.length++);
+                    },
+                    
+                    // Position is a shuffle-mode notion; due time decides here
+                    insertAt(position, card) {
+                        this.pushBack(card);
+                    },
+                    
+                    popFront() {
+                        if (this.length === 0) return undefined;
+                        this.refresh();
+                        this.opsSinceKeyed++;
+                        const card = this.cards[this.ids[0]];
+                        this.positions[card.id] = -1;
+                        if (--this.length > 0) {
+                            this.move(this.length, 0);
+                            this.siftDown(0);
+                        }
+                        return card;
+                    },
+                    
+                    shuffle() {},
+                    
+                    // Recomputes every key and re-heapifies (O(n)) if epoch() has moved
+                    // and the rekeyAfter budget is spent
+                    refresh() {
+                        if (this.opsSinceKeyed < this.rekeyAfter) return;
+                        const epoch = this.epoch();
+                        if (epoch === this.keyedEpoch) return;
+                        this.keyedEpoch = epoch;
+                        this.opsSinceKeyed = 0;
+                        for (let i = 0; i < this.length; i++) this.keys[i] = this.key(this.cards[this.ids[i]]);
+                        for (let i = (this.length >> 1) - 1; i >= 0; i--) this.siftDown(i);
+                    },
+                    
+                    siftUp(i) {
+                        while (i > 0) {
+                            const parent = (i - 1) >> 1;
+                            if (this.keys[parent] <= this.keys[i]) break;
+                            this.swap(i, parent);
+                            i = parent;
+                        }
+                        return i;
+                    },
+                    
+                    siftDown(i) {
+                        for (;;) {
+                            const left = 2 * i + 1;
+                            if (left >= this.length) return i;
+                            const child = left + 1 < this.length && this.keys[left + 1] < this.keys[left] ? left + 1 : left;
+                            if (this.keys[i] <= this.keys[child]) return i;
+                            this.swap(i, child);
+                            i = child;
+                        }
+                    },
+                    
+                    swap(a, b) {
+                        const id = this.ids[a];
+                        const key = this.keys[a];
+                        this.move(b, a);
+                        this.ids[b] = id;
+                        this.keys[b] = key;
+                        this.positions[id] = b;
+                    },
+                    
+                    move(from, to) {
+                        this.ids[to] = this.ids[from];
+                        this.keys[to] = this.keys[from];
+                        this.positions[this.ids[to]] = to;
+                    },
+                    
+                    grow() {
+                        const ids = new Uint32Array(this.ids.length * 2);
+                        const keys = new Float64Array(this.keys.length * 2);
+                        ids.set(this.ids);
+                        keys.set(this.keys);
+                        this.ids = ids;
+                        this.keys = keys;
+                    },
+                    
+                    forEach(fn) {
+                        for (let i = 0; i < this.length; i++) fn(this.cards[this.ids[i]], i);
+                    },
+                    
+                    filter(fn) {
+                        const result = [];
+                        this.forEach(card => { if (fn(card)) result.push(card); });
+                        return result;
+                    },
+                    
+                    // Cards in due order. Walks a frontier down from the root, so it is
+                    // cheap for the small look-aheads callers make (e.g. the next two cards).
+                    slice(start = 0, end = this.length) {
+                        this.refresh();
+                        const result = [];
+                        const frontier = this.length ? [0] : [];
+                        while (result.length < end && frontier.length) {
+                            let best = 0;
+                            for (let j = 1; j < frontier.length; j++) {
+                                if (this.keys[frontier[j]] < this.keys[frontier[best]]) best = j;
+                            }
+                            const i = frontier[best];
+                            frontier[best] = frontier[frontier.length - 1];
+                            frontier.pop();
+                            result.push(this.cards[this.ids[i]]);
+                            if (2 * i + 1 < this.length) frontier.push(2 * i + 1);
+                            if (2 * i + 2 < this.length) frontier.push(2 * i + 2);
+                        }
+                        return result.slice(Math.max(0, start));
+                    }
+                };
+            },
+            
+            from(cards, list, options) {
+                const heap = this.create(cards, list.length, options);
+                list.forEach(card => heap.pushBack(card));
+                heap.opsSinceKeyed = 0;
+                return heap;
+            }
+        };
+        
+        // ========================================
+        // CARD STORE
+        // ========================================
+        // Struct-of-arrays storage for a deck: one typed-array column per numeric
+        // card field, indexed by card id, plus an interned string table for
+        // questions and answers. The cards handed to the rest of ScholarSRS are
+        // views holding only their id; card.totalSeen++ and friends go through
+        // accessors on a prototype shared by every card of the store, so existing
+        // code reads and writes the columns without knowing they are there.
+        const CardStore = {
+            COLUMNS: {
+                // Counts, restored across visits by Persistence; 65535 answers to overflow
+                correctCount: Uint16Array,
+                wrongCount: Uint16Array,
+                totalSeen: Uint16Array,
+                consecutiveCorrect: Uint16Array,
+                reviewStep: Uint16Array, // Position in the System 8 quantum schedule
+                difficulty: Uint8Array,
+                // Session minutes and performance.now() milliseconds: float32 keeps
+                // them to a few milliseconds over a multi-hour session
+                lastSeen: Float32Array,
+                nextReview: Float32Array, // Review interval in minutes; read through Card.nextReview
+                reviewLogBase: Float32Array,
+                due: Float32Array, // Session minute the review interval runs from; see Card.dueAt
+                avgResponseTime: Float32Array,
+                lastResponseTime: Float32Array,
+                createdAt: Float32Array,
+                serverId: Uint32Array, // SQLite rowid, 0 until Persistence assigns one
+                question: Uint32Array, // Indexes into strings
+                answer: Uint32Array
+            },
+            
+            create(capacity = 16) {
+                const store = {
+                    columns: {},
+                    capacity: 0,
+                    length: 0,
+                    strings: [],
+                    stringIndex: new Map(),
+                    cardPrototype: null,
+                    
+                    // Appends a card and returns its view; its id is its index in the store
+                    add(question, answer) {
+                        if (this.length === this.capacity) this.grow(Math.max(this.capacity * 2, 16));
+                        const id = this.length++;
+                        const { columns } = this;
+                        columns.lastSeen[id] = -1;
+                        columns.createdAt[id] = performance.now();
+                        columns.question[id] = this.intern(question);
+                        columns.answer[id] = this.intern(answer);
+                        return this.view(id);
+                    },
+                    
+                    view(id) {
+                        return { __proto__: this.cardPrototype, id };
+                    },
+                    
+                    intern(text) {
+                        if (!this.stringIndex) this.stringIndex = new Map(this.strings.map((text, index) => [text, index]));
+                        let index = this.stringIndex.get(text);
+                        if (index === undefined) {
+                            index = this.strings.length;
+                            this.strings.push(text);
+                            this.stringIndex.set(text, index);
+                        }
+                        return index;
+                    },
+                    
+                    grow(capacity) {
+                        for (const [name, Column] of Object.entries(CardStore.COLUMNS)) {
+                            const column = new Column(capacity);
+                            if (this.columns[name]) column.set(this.columns[name]);
+                            this.columns[name] = column;
+                        }
+                        this.capacity = capacity;
+                    },
+                    
+                    // Once the deck is built: drop spare capacity and the string lookup
+                    // map, which only intern() needs and rebuilds if it is called again
+                    trim() {
+                        for (const name of Object.keys(this.columns)) {
+                            this.columns[name] = this.columns[name].slice(0, this.length);
+                        }
+                        this.capacity = this.length;
+                        this.stringIndex = null;
+                        return this;
+                    },
+                    
+                    byteLength() {
+                        return Object.values(this.columns).reduce((sum, column) => sum + column.byteLength, 0);
+                    }
+                };
+                
+                store.cardPrototype = this.cardPrototype(store);
+                store.grow(capacity);
+                return store;
+            },
+            
+            cardPrototype(store) {
+                const proto = Object.defineProperties({}, {
+                    question: {
+                        get() { return store.strings[store.columns.question[this.id]]; },
+                        set(text) { store.columns.question[this.id] = store.intern(text); }
+                    },
+                    answer: {
+                        get() { return store.strings[store.columns.answer[this.id]]; },
+                        set(text) { store.columns.answer[this.id] = store.intern(text); }
+                    },
+                    serverId: {
+                        get() { return store.columns.serverId[this.id] || undefined; },
+                        set(serverId) { store.columns.serverId[this.id] = serverId || 0; }
+                    }
+                });
+                for (const name of Object.keys(this.COLUMNS)) {
+                    if (name in proto) continue;
+                    Object.defineProperty(proto, name, {
+                        get() { return store.columns[name][this.id]; },
+                        set(value) { store.columns[name][this.id] = value; }
+                    });
+                }
+                return proto;
+            },
+            
+            // Per-card history arrays, created the first time a system asks for them
+            // rather than up front for every card in the deck
+            stats(id) {
+                let stats = State.cards.stats.get(id);
+                if (!stats) {
+                    stats = {
+                        responses: [],
+                        timestamps: [],
+                        phaseFirstSeen: -1,
+                        responseTimeHistory: [],
+                        difficultyHistory: []
+                    };
+                    State.cards.stats.set(id, stats);
+                }
+                return stats;
             }
         };
         
@@ -1217,7 +2492,21 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 current: 0,
                 startTime: 0,
                 preciseStartTime: 0,
-                queues: []
+                queues: [], // One CardQueue per phase
+                // Bit i of membership[card.id] is set while the card is in queue i;
+                // change queues only through the Phase queue helpers to keep it in step
+                membership: new Uint8Array(0),
+                unseenCount: 0 // Never-seen cards left in the current phase's queue
+            },
+            
+            // Session-wide review interval scaling (System 2). A card's effective
+            // nextReview is its stored value times exp(logScale - card.reviewLogBase);
+            // read and write it through Card.nextReview / Card.setNextReview. In
+            // 'due' mode the phase heap re-keys in batches as logScale moves (see
+            // CONFIG.SCHEDULING), so scaling reaches cards already waiting for review.
+            scheduling: {
+                mode: CONFIG.SCHEDULING.MODE,
+                logScale: 0
             },
             
             // Card Collections
@@ -1238,9 +2527,11 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 longestStreak: 0,
                 cardsSeenInSession: 0,
                 cardsCompletedForRate: 0,
-                rateHistory: [],
-                last50ResponseTimes: [],
-                successRateHistory: []
+                rateHistory: StreamStats.window(CONFIG.MOVING_AVERAGE_WINDOW),
+                last50ResponseTimes: StreamStats.window(50),
+                // Running success rate after each answer, for the last 20 answers
+                successRateHistory: StreamStats.window(20),
+                qualityChanges: []
             },
             
             // Timing & Intervals
@@ -1249,8 +2540,8 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 totalPausedTime: 0,
                 pauseStartTime: 0,
                 rateCalculationStartTime: 0,
+                lastRateSample: 0, // Time the last rateHistory sample covers up to
                 savedBreakDuration: 0,
-                timerInterval: null,
                 breakInterval: null,
                 responseTimeBaseline: null,
                 cardDisplayStartTime: 0
@@ -1268,9 +2559,10 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
             // Memory Enhancement Systems State
             memoryEnhancement: {
                 systemsActive: new Set(),
+                governed: new Set(), // Shed by the quality governor, apart from the user's own switches
                 distinctivenessCounter: 0,
                 fatigueLevel: 0,
-                mouseCooldown: false,
+                mouseCooldownUntil: 0,
                 emotionalColorRotation: 0,
                 peripheralRotation: 0,
                 quantumSchedule: [20, 90, 480, 1440, 4320, 10080, 20160, 50400, 100800],
@@ -1281,12 +2573,10 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 successAnchorCooldown: 0,
                 userTempo: null,
                 temporalPatterns: new Map(),
-                volumeHistory: [],
                 // Systems 22-23 state
                 proprietoceptionDirection: 1,
-                quantumCyclingInterval: [],
                 lastProprioceptiveTime: 0,
-                isUserInteracting: false,
+                lastInteractionTime: -Infinity,
                 // Systems 24-26 state
                 chronestheticAdjustments: new Map(),
                 preloadCache: new Map(),
@@ -1310,14 +2600,13 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 ],
                 lastSemanticPrimeTime: 0,
                 // Systems 31-36 state
-                interactionTimes: [],
+                interactionTimes: StreamStats.window(25),
                 lastPhaseLockedTime: 0,
                 vestibularDirection: 0,
                 lastVestibularTime: 0,
                 corticalRingActive: false,
                 lastEmotionalTagTime: 0,
                 lastClickPosition: { x: 0, y: 0 },
-                quantumVibrationIntervals: [],
                 somaticWordIndex: 0,
                 somaticWordBank: ["warm", "cool", "soft", "sharp"],
                 lastSomaticTime: 0,
@@ -1326,51 +2615,1010 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 lastHandwritingTime: 0,
                 lastConfidenceFlashTime: 0,
                 deltaWavePulseActive: false,
-                deltaWaveInterval: null,
                 schumannResonanceOscillator: null,
                 schumannGainNode: null,
                 accelerometerActive: false,
                 deviceMotionHandler: null,
                 handTremorFrequency: 10, // Hz
                 lastAccelerometerFlashTime: 0,
-                isMobileDevice: false
+                isMobileDevice: false,
+                deviceProfile: 'full'
             }
         };
         
         // ========================================
-        // MEMORY ENHANCEMENT MODULE
+        // EFFECT SCHEDULER
         // ========================================
-        const MemoryEnhancement = {
+        // Every timed effect of the memory systems runs from one
+        // requestAnimationFrame loop instead of its own setTimeout/setInterval.
+        // Effects belong to a scope: 'card' effects end when the card changes,
+        // 'session' effects may span cards, and both end on pause or break;
+        // 'break' effects end with the break. Ending an effect early runs its
+        // cleanup (or, with flush, the callback itself) so nothing is left
+        // half-applied on screen.
+        const Effects = {
+            FRAME_BUDGET: 4, // ms of effect callbacks per frame; the rest wait a frame
+            pending: [],
+            keyed: new Map(),
+            frameHandle: null,
+            pausedAt: null,
             
-            // Initialize all memory systems
-            init() {
-                this.initializeAudioNodes();
-                this.setupEventListeners();
-                this.activateSystems();
-                this.detectMobileDevice();
+            // Run callback once, delay ms from now.
+            // Options: scope, key (replaces a running effect with the same key),
+            // flush (run the callback instead of dropping it when cancelled),
+            // maxDelay (skip the callback if a stalled frame makes it this late)
+            after(delay, callback, options = {}) {
+                return this.add({ ...options, due: performance.now() + delay, callback });
             },
             
-            initializeAudioNodes() {
-                try {
-                    if (State.settings.audioContext) {
-                        // Setup for binaural beats
-                        State.settings.leftOscillator = State.settings.audioContext.createOscillator();
-                        State.settings.rightOscillator = State.settings.audioContext.createOscillator();
-                        State.settings.binauralGainNode = State.settings.audioContext.createGain();
-                        State.settings.binauralGainNode.gain.value = 0;
-                    }
-                } catch (error) {
-                    console.log('Audio initialization failed:', error);
+            // Run callback every period ms until it returns false, the optional
+            // duration elapses or the effect is cancelled; cleanup runs once at the end
+            every(period, callback, options = {}) {
+                const now = performance.now();
+                return this.add({ ...options, due: now + period, period, until: now + (options.duration ?? Infinity), callback });
+            },
+            
+            // Run [delay, callback] steps one after another; cleanup runs once at the end
+            sequence(steps, options = {}) {
+                return this.add({ ...options, due: performance.now() + steps[0][0], steps, step: 0 });
+            },
+            
+            add(effect) {
+                effect.scope = effect.scope || 'card';
+                if (effect.key) {
+                    this.cancel(effect.key);
+                    this.keyed.set(effect.key, effect);
                 }
+                this.pending.push(effect);
+                this.schedule();
+                return effect;
             },
             
-            detectMobileDevice() {
-                // Detect if this is a mobile device for System 42
-                State.memoryEnhancement.isMobileDevice = /Android|webOS|iPhone|iPad|iPod|BlackBerry|IEMobile|Opera Mini/i.test(navigator.userAgent);
+            // Cancel one effect, by handle or key
+            cancel(handle) {
+                const effect = typeof handle === 'string' ? this.keyed.get(handle) : handle;
+                if (effect && !effect.done) this.finish(effect, true);
             },
             
-            setupEventListeners() {
-                // System 14: Microsaccade Encoding Pattern
+            cancelScope(...scopes) {
+                this.pending
+                    .filter(effect => scopes.includes(effect.scope))
+                    .forEach(effect => this.finish(effect, true));
+            },
+            
+            cancelAll() {
+                this.pending.slice().forEach(effect => this.finish(effect, true));
+                this.pausedAt = null;
+            },
+            
+            // Freeze whatever is still pending (e.g. a paused break's effects)
+            pause() {
+                if (this.pausedAt !== null) return;
+                this.pausedAt = performance.now();
+                if (this.frameHandle !== null) cancelAnimationFrame(this.frameHandle);
+                this.frameHandle = null;
+            },
+            
+            resume() {
+                if (this.pausedAt === null) return;
+                const pausedFor = performance.now() - this.pausedAt;
+                this.pending.forEach(effect => {
+                    effect.due += pausedFor;
+                    if (effect.until !== undefined) effect.until += pausedFor;
+                });
+                this.pausedAt = null;
+                this.schedule();
+            },
+            
+            schedule() {
+                if (this.frameHandle === null && this.pausedAt === null && this.pending.length) {
+                    this.frameHandle = requestAnimationFrame(now => this.frame(now));
+                }
+            },
+            
+            frame(now) {
+                this.frameHandle = null;
+                const started = performance.now();
+                // Restores (flush effects) go first so a flash never outstays its duration
+                const due = this.pending
+                    .filter(effect => effect.due <= now)
+                    .sort((a, b) => (b.flush === true) - (a.flush === true) || a.due - b.due);
+                
+                let ran = 0;
+                for (const effect of due) {
+                    if (effect.done) continue; // cancelled by an earlier callback this frame
+                    if (ran > 0 && performance.now() - started > this.FRAME_BUDGET) break;
+                    if (now - effect.due > (effect.maxDelay ?? Infinity)) {
+                        this.finish(effect, false);
+                        continue;
+                    }
+                    this.run(effect, now);
+                    ran++;
+                }
+                this.schedule();
+            },
+            
+            run(effect, now) {
+                let next = null;
+                try {
+                    if (effect.steps) {
+                        effect.steps[effect.step][1](now);
+                        effect.step++;
+                        if (effect.step < effect.steps.length) next = effect.due + effect.steps[effect.step][0];
+                    } else if (effect.callback(now) !== false && effect.period) {
+                        // After a stalled frame, resume the rhythm instead of bursting
+                        next = Math.max(effect.due + effect.period, now);
+                        if (next > effect.until) next = null;
+                    }
+                } catch (error) {
+                    ScholarSRS.Error.handle('effect', error);
+                }
+                
+                if (effect.done) return;
+                if (next === null) {
+                    this.finish(effect, false);
+                } else {
+                    effect.due = next;
+                }
+            },
+            
+            finish(effect, cancelled) {
+                effect.done = true;
+                const index = this.pending.indexOf(effect);
+                if (index !== -1) this.pending.splice(index, 1);
+                if (effect.key && this.keyed.get(effect.key) === effect) this.keyed.delete(effect.key);
+                
+                try {
+                    if (cancelled && effect.flush) effect.callback(performance.now());
+                    if (effect.cleanup) effect.cleanup();
+                } catch (error) {
+                    ScholarSRS.Error.handle('effectCleanup', error);
+                }
+            }
+        };
+        
+        // ========================================
+        // MEMORY SYSTEM PROFILER
+        // ========================================
+        // Opt-in (?profile=1, or Alt+Shift+P to toggle the overlay). While active,
+        // each orchestrated system call is bracketed by performance marks and
+        // charged with its duration, the DOM mutations it queued and the timers
+        // it created; long tasks are pinned on the system that ran longest in them.
+        const Profiler = {
+            MAX_RECENT_CALLS: 500,
+            MAX_MEASURES: 10000,
+            active: false,
+            installed: false,
+            stats: new Map(),
+            recentCalls: [],
+            longTasks: [],
+            measureCount: 0,
+            current: null,
+            observer: null,
+            overlay: null,
+            overlayTimer: null,
+            
+            init() {
+                if (new URLSearchParams(location.search).get('profile') === '1') this.start();
+                
+                document.addEventListener('keydown', (e) => {
+                    if (e.altKey && e.shiftKey && e.code === 'KeyP') {
+                        e.preventDefault();
+                        this.toggleOverlay();
+                    }
+                });
+            },
+            
+            start() {
+                this.install();
+                this.active = true;
+            },
+            
+            // Hooks are only installed once profiling is asked for, so normal sessions pay nothing
+            install() {
+                if (this.installed) return;
+                this.installed = true;
+                
+                this.observer = new MutationObserver(() => {});
+                this.observer.observe(document.body, { subtree: true, childList: true, attributes: true, characterData: true });
+                
+                const profiler = this;
+                const countTimer = (target, name) => {
+                    const original = target[name];
+                    target[name] = function (...args) {
+                        if (profiler.current) profiler.current.timers++;
+                        return original.apply(this, args);
+                    };
+                };
+                countTimer(window, 'setTimeout');
+                countTimer(window, 'setInterval');
+                countTimer(window, 'requestAnimationFrame');
+                countTimer(Effects, 'add');
+                
+                try {
+                    new PerformanceObserver(list => list.getEntries().forEach(entry => this.attributeLongTask(entry)))
+                        .observe({ type: 'longtask', buffered: true });
+                } catch (error) {
+                    Log.info('Long task attribution is not supported in this browser');
+                }
+            },
+            
+            reset() {
+                this.stats.clear();
+                this.recentCalls = [];
+                this.longTasks = [];
+                if (this.measureCount) performance.clearMeasures();
+                this.measureCount = 0;
+            },
+            
+            begin(system) {
+                // Mutations queued before this call belong to someone else
+                this.observer.takeRecords();
+                performance.mark(`system${system.id}`);
+                this.current = { system, timers: 0, start: performance.now() };
+            },
+            
+            end(system) {
+                const end = performance.now();
+                const mark = `system${system.id}`;
+                const measure = performance.measure(`System${system.id}_${system.name}`, mark);
+                performance.clearMarks(mark);
+                if (++this.measureCount > this.MAX_MEASURES) {
+                    performance.clearMeasures();
+                    this.measureCount = 0;
+                }
+                
+                const duration = measure ? measure.duration : end - this.current.start;
+                let stats = this.stats.get(system.id);
+                if (!stats) {
+                    stats = { id: system.id, name: system.name, cost: system.cost, calls: 0, totalMs: 0, maxMs: 0, mutations: 0, timers: 0, longTasks: 0 };
+                    this.stats.set(system.id, stats);
+                }
+                stats.calls++;
+                stats.totalMs += duration;
+                stats.maxMs = Math.max(stats.maxMs, duration);
+                stats.mutations += this.observer.takeRecords().length;
+                stats.timers += this.current.timers;
+                
+                this.recentCalls.push({ id: system.id, start: this.current.start, end });
+                if (this.recentCalls.length > this.MAX_RECENT_CALLS) this.recentCalls.shift();
+                this.current = null;
+            },
+            
+            attributeLongTask(entry) {
+                const taskStart = entry.startTime;
+                const taskEnd = entry.startTime + entry.duration;
+                const overlap = new Map();
+                this.recentCalls.forEach(call => {
+                    const ms = Math.min(call.end, taskEnd) - Math.max(call.start, taskStart);
+                    if (ms > 0) overlap.set(call.id, (overlap.get(call.id) || 0) + ms);
+                });
+                if (!overlap.size) return;
+                
+                const [id, ms] = [...overlap].reduce((top, item) => item[1] > top[1] ? item : top);
+                this.stats.get(id).longTasks++;
+                this.longTasks.push({ at: Math.round(taskStart), durationMs: Math.round(entry.duration), system: id, systemMs: +ms.toFixed(2) });
+            },
+            
+            report() {
+                const systems = [...this.stats.values()]
+                    .sort((a, b) => b.totalMs - a.totalMs)
+                    .map(stats => ({
+                        ...stats,
+                        totalMs: +stats.totalMs.toFixed(2),
+                        maxMs: +stats.maxMs.toFixed(2),
+                        avgMs: +(stats.totalMs / stats.calls).toFixed(3)
+                    }));
+                return {
+                    generatedAt: new Date().toISOString(),
+                    userAgent: navigator.userAgent,
+                    deviceProfile: State.memoryEnhancement.deviceProfile,
+                    cardsSeen: State.performance.cardsSeenInSession,
+                    qualityChanges: State.performance.qualityChanges,
+                    systems,
+                    longTasks: this.longTasks
+                };
+            },
+            
+            exportReport() {
+                const blob = new Blob([JSON.stringify(this.report(), null, 2)], { type: 'application/json' });
+                const link = document.createElement('a');
+                link.href = URL.createObjectURL(blob);
+                link.download = `scholar-srs-profile-${new Date().toISOString().replace(/[:.]/g, '-')}.json`;
+                link.click();
+                URL.revokeObjectURL(link.href);
+            },
+            
+            toggleOverlay() {
+                if (this.overlay) {
+                    clearInterval(this.overlayTimer);
+                    this.overlay.remove();
+                    this.overlay = null;
+                    return;
+                }
+                
+                this.start();
+                this.overlay = document.createElement('div');
+                this.overlay.className = 'profiler-overlay';
+                this.overlay.addEventListener('click', (e) => {
+                    if (e.target.dataset.action === 'export') this.exportReport();
+                });
+                document.body.appendChild(this.overlay);
+                this.renderOverlay();
+                this.overlayTimer = setInterval(() => this.renderOverlay(), 1000);
+            },
+            
+            renderOverlay() {
+                const rows = this.report().systems.map(stats =>
+                    `<tr class="${stats.longTasks ? 'long-task' : ''}"><td>${stats.id}</td><td>${stats.name}</td>` +
+                    `<td>${stats.calls}</td><td>${stats.totalMs.toFixed(1)}</td><td>${stats.avgMs.toFixed(2)}</td>` +
+                    `<td>${stats.maxMs.toFixed(1)}</td><td>${(stats.mutations / stats.calls).toFixed(1)}</td>` +
+                    `<td>${(stats.timers / stats.calls).toFixed(1)}</td><td>${stats.longTasks}</td></tr>`
+                ).join('');
+                this.overlay.innerHTML =
+                    '<table><tr><th>#</th><th>system</th><th>calls</th><th>total ms</th><th>avg</th><th>max</th>' +
+                    '<th>mut/call</th><th>timers/call</th><th>long tasks</th></tr>' + rows + '</table>' +
+                    '<button data-action="export">Export JSON</button>';
+            }
+        };
+        
+        // ========================================
+        // SESSION TIMELINE (Chrome trace events)
+        // ========================================
+        // Opt-in (?timeline=1, or Alt+Shift+T to start, then again to stop and
+        // download). Events go into a fixed-size ring of typed arrays, so it can
+        // record a multi-hour session in bounded memory; only the newest
+        // CAPACITY events are kept. Load the file in chrome://tracing or Perfetto.
+        const Timeline = {
+            CAPACITY: 1 << 18,
+            COMPLETE: 0,
+            INSTANT: 1,
+            active: false,
+            installed: false,
+            // Ring buffer columns, allocated on first start
+            timestamps: null,
+            durations: null,
+            phases: null,
+            nameIds: null,
+            cardIds: null,
+            head: 0,
+            count: 0,
+            dropped: 0,
+            names: [],
+            categories: [],
+            nameIndex: new Map(),
+            
+            init() {
+                if (new URLSearchParams(location.search).get('timeline') === '1') this.start();
+                
+                document.addEventListener('keydown', (e) => {
+                    if (e.altKey && e.shiftKey && e.code === 'KeyT') {
+                        e.preventDefault();
+                        if (this.active) {
+                            this.stop();
+                            this.exportTrace();
+                        } else {
+                            this.start();
+                        }
+                    }
+                });
+            },
+            
+            start() {
+                if (!this.timestamps) {
+                    this.timestamps = new Float64Array(this.CAPACITY);
+                    this.durations = new Float64Array(this.CAPACITY);
+                    this.phases = new Uint8Array(this.CAPACITY);
+                    this.nameIds = new Uint16Array(this.CAPACITY);
+                    this.cardIds = new Int32Array(this.CAPACITY);
+                }
+                this.install();
+                this.active = true;
+                Log.info('⏺️ Timeline recording');
+            },
+            
+            stop() {
+                this.active = false;
+                Log.info(`⏹️ Timeline stopped (${this.count} events, ${this.dropped} dropped)`);
+            },
+            
+            clear() {
+                this.head = 0;
+                this.count = 0;
+                this.dropped = 0;
+            },
+            
+            // Wrappers stay in place once installed; they check `active` and fall through
+            install() {
+                if (this.installed) return;
+                this.installed = true;
+                
+                this.wrap(MemoryEnhancement, 'orchestrate', 'orchestrate', args => `orchestrate:${args[0]}`);
+                ['showNext', 'showAnswer', 'markCorrect', 'markWrong', 'skip'].forEach(method =>
+                    this.wrap(ScholarSRS.Card, method, 'card', () => `Card.${method}`));
+                this.wrap(ScholarSRS.Timer, 'update', 'timer', () => 'Timer.update');
+                this.wrap(ScholarSRS.Break, 'start', 'break', () => 'Break.start');
+                this.wrap(ScholarSRS.Break, 'end', 'break', () => 'Break.end');
+                this.wrap(Effects, 'frame', 'effects', () => 'Effects.frame');
+                
+                const AudioContextClass = window.BaseAudioContext || window.AudioContext || window.webkitAudioContext;
+                if (AudioContextClass) {
+                    Object.getOwnPropertyNames(AudioContextClass.prototype)
+                        .filter(method => method.startsWith('create'))
+                        .forEach(method => {
+                            const original = AudioContextClass.prototype[method];
+                            const timeline = this;
+                            AudioContextClass.prototype[method] = function (...args) {
+                                if (timeline.active) timeline.instant(method, 'audio');
+                                return original.apply(this, args);
+                            };
+                        });
+                }
+            },
+            
+            wrap(target, method, category, nameOf) {
+                const original = target[method];
+                const timeline = this;
+                target[method] = function (...args) {
+                    if (!timeline.active) return original.apply(this, args);
+                    const start = performance.now();
+                    try {
+                        return original.apply(this, args);
+                    } finally {
+                        timeline.complete(nameOf(args), category, start);
+                    }
+                };
+            },
+            
+            intern(name, category) {
+                let id = this.nameIndex.get(name);
+                if (id === undefined) {
+                    id = this.names.length;
+                    this.names.push(name);
+                    this.categories.push(category);
+                    this.nameIndex.set(name, id);
+                }
+                return id;
+            },
+            
+            record(phase, name, category, timestamp, duration) {
+                const slot = this.head;
+                this.timestamps[slot] = timestamp;
+                this.durations[slot] = duration;
+                this.phases[slot] = phase;
+                this.nameIds[slot] = this.intern(name, category);
+                this.cardIds[slot] = State.cards.current ? State.cards.current.id : -1;
+                this.head = (slot + 1) % this.CAPACITY;
+                if (this.count < this.CAPACITY) this.count++;
+                else this.dropped++;
+            },
+            
+            complete(name, category, start) {
+                this.record(this.COMPLETE, name, category, start, performance.now() - start);
+            },
+            
+            instant(name, category) {
+                this.record(this.INSTANT, name, category, performance.now(), 0);
+            },
+            
+            // Trace-event JSON, oldest event first; times are microseconds
+            toTrace() {
+                const events = [
+                    { name: 'process_name', ph: 'M', pid: 1, tid: 1, args: { name: 'Scholar SRS' } },
+                    { name: 'thread_name', ph: 'M', pid: 1, tid: 1, args: { name: 'main' } }
+                ];
+                const first = (this.head - this.count + this.CAPACITY) % this.CAPACITY;
+                for (let i = 0; i < this.count; i++) {
+                    const slot = (first + i) % this.CAPACITY;
+                    const nameId = this.nameIds[slot];
+                    const event = {
+                        name: this.names[nameId],
+                        cat: this.categories[nameId],
+                        ph: this.phases[slot] === this.COMPLETE ? 'X' : 'i',
+                        ts: Math.round(this.timestamps[slot] * 1000),
+                        pid: 1,
+                        tid: 1
+                    };
+                    if (event.ph === 'X') event.dur = Math.round(this.durations[slot] * 1000);
+                    else event.s = 't';
+                    if (this.cardIds[slot] >= 0) event.args = { card: this.cardIds[slot] };
+                    events.push(event);
+                }
+                return {
+                    traceEvents: events,
+                    displayTimeUnit: 'ms',
+                    otherData: { recordedAt: new Date().toISOString(), droppedEvents: this.dropped }
+                };
+            },
+            
+            exportTrace() {
+                const blob = new Blob([JSON.stringify(this.toTrace())], { type: 'application/json' });
+                const link = document.createElement('a');
+                link.href = URL.createObjectURL(blob);
+                link.download = `scholar-srs-trace-${new Date().toISOString().replace(/[:.]/g, '-')}.json`;
+                link.click();
+                URL.revokeObjectURL(link.href);
+            }
+        };
+        
+        // ========================================
+        // QUALITY GOVERNOR
+        // ========================================
+        // Watches frame rate and long tasks during a session. Under pressure it
+        // sheds memory systems one SHED_ORDER step per window; after
+        // RESTORE_AFTER_WINDOWS healthy windows in a row it restores the last step
+        // shed. Frame-rate thresholds are fractions of the display's refresh rate,
+        // measured while the setup screen sits idle, so 30 and 50 Hz screens are
+        // judged against themselves but a device that is slow from its first
+        // session frame is not. Decisions are kept in State.performance.qualityChanges.
+        const Governor = {
+            WINDOW_MS: 2000,
+            SHED_FRACTION: 0.75, // 45 fps at 60 Hz
+            RESTORE_FRACTION: 0.92, // 55 fps at 60 Hz
+            ASSUMED_REFRESH_RATE: 60, // Until the setup screen has been measured
+            LONG_TASK_BUDGET_MS: 150, // Per window
+            RESTORE_AFTER_WINDOWS: 5,
+            SHED_ORDER: [
+                { name: 'text vibration', systems: [35], effects: ['textVibration'] },
+                { name: 'attention flicker', systems: [23], effects: ['attentionCycling'] },
+                { name: 'afterimage and peripheral overlays', systems: [27, 13, 29, 30] },
+                // System 40 is an animation, but it also starts the Schumann oscillator;
+                // cancelling its pulse stops the tone
+                { name: 'audio oscillators', cost: 'audio', systems: [40], effects: ['deltaWave'] }
+            ],
+            level: 0,
+            refreshRate: 0, // Best idle window rate, or a faster session one; kept across sessions
+            calibrating: false,
+            frameHandle: null,
+            lastFrame: 0,
+            windowStart: 0,
+            frames: 0,
+            longTaskMs: 0,
+            healthyWindows: 0,
+            longTaskObserver: null,
+            
+            start() {
+                this.stop();
+                if (!this.longTaskObserver) {
+                    try {
+                        this.longTaskObserver = new PerformanceObserver(list => {
+                            list.getEntries().forEach(entry => { this.longTaskMs += entry.duration; });
+                        });
+                        this.longTaskObserver.observe({ type: 'longtask' });
+                    } catch (error) {
+                        Log.info('Long tasks are not observable here; governing on frame rate only');
+                    }
+                }
+                this.calibrating = false;
+                this.resetWindow(performance.now());
+                this.frameHandle = requestAnimationFrame(now => this.sample(now));
+            },
+            
+            // Measures one window on the setup screen, where no memory system runs.
+            // A session starting first cancels it; the next return to setup retries.
+            calibrate() {
+                if (this.refreshRate || State.session.isActive) return;
+                this.stop();
+                this.calibrating = true;
+                this.resetWindow(performance.now());
+                this.frameHandle = requestAnimationFrame(now => this.sample(now));
+            },
+            
+            stop() {
+                if (this.frameHandle !== null) cancelAnimationFrame(this.frameHandle);
+                this.frameHandle = null;
+            },
+            
+            // A new session starts at full quality
+            reset() {
+                this.stop();
+                this.level = 0;
+                this.healthyWindows = 0;
+                State.memoryEnhancement.governed.clear();
+                MemoryEnhancement.rebuildSubscribers();
+            },
+            
+            resetWindow(now) {
+                this.lastFrame = now;
+                this.windowStart = now;
+                this.frames = 0;
+                this.longTaskMs = 0;
+            },
+            
+            sample(now) {
+                this.frameHandle = requestAnimationFrame(time => this.sample(time));
+                
+                // Paused, or a hidden tab coming back: not the systems' fault
+                if (State.session.isPaused || now - this.lastFrame > 1000) {
+                    this.resetWindow(now);
+                    return;
+                }
+                this.lastFrame = now;
+                this.frames++;
+                
+                const elapsed = now - this.windowStart;
+                if (elapsed < this.WINDOW_MS) return;
+                if (this.calibrating) {
+                    this.refreshRate = this.frames * 1000 / elapsed;
+                    this.calibrating = false;
+                    this.stop();
+                    return;
+                }
+                this.evaluate(this.frames * 1000 / elapsed);
+                this.resetWindow(now);
+            },
+            
+            evaluate(fps) {
+                // A session can raise the baseline (a faster screen than measured) but
+                // never set it, or a device slow from the start would never shed
+                if (fps > (this.refreshRate || this.ASSUMED_REFRESH_RATE)) this.refreshRate = fps;
+                const refreshRate = this.refreshRate || this.ASSUMED_REFRESH_RATE;
+                
+                if (fps < refreshRate * this.SHED_FRACTION || this.longTaskMs > this.LONG_TASK_BUDGET_MS) {
+                    this.healthyWindows = 0;
+                    if (this.level < this.SHED_ORDER.length) this.shed(fps);
+                } else if (fps >= refreshRate * this.RESTORE_FRACTION && this.longTaskMs === 0) {
+                    if (++this.healthyWindows >= this.RESTORE_AFTER_WINDOWS && this.level > 0) {
+                        this.healthyWindows = 0;
+                        this.restore(fps);
+                    }
+                } else {
+                    this.healthyWindows = 0;
+                }
+            },
+            
+            systemsOf(step) {
+                const byCost = MemoryEnhancement.SYSTEMS
+                    .filter(system => step.cost && system.cost === step.cost)
+                    .map(system => system.id);
+                return [...(step.systems || []), ...byCost];
+            },
+            
+            shed(fps) {
+                const step = this.SHED_ORDER[this.level++];
+                this.systemsOf(step).forEach(id => State.memoryEnhancement.governed.add(id));
+                (step.effects || []).forEach(key => Effects.cancel(key));
+                MemoryEnhancement.rebuildSubscribers();
+                this.record('shed', step, fps);
+            },
+            
+            restore(fps) {
+                const step = this.SHED_ORDER[--this.level];
+                this.systemsOf(step).forEach(id => State.memoryEnhancement.governed.delete(id));
+                MemoryEnhancement.rebuildSubscribers();
+                this.record('restore', step, fps);
+            },
+            
+            record(action, step, fps) {
+                const change = {
+                    at: Math.round(performance.now() - State.session.preciseStartTime),
+                    action,
+                    step: step.name,
+                    fps: Math.round(fps),
+                    longTaskMs: Math.round(this.longTaskMs)
+                };
+                State.performance.qualityChanges.push(change);
+                Log.info(`Quality governor: ${action} ${step.name} (${change.fps} fps, ${change.longTaskMs} ms in long tasks)`);
+            }
+        };
+        
+        // ========================================
+        // BENCHMARKS
+        // ========================================
+        // Console micro-benchmarks for the data structures on hot paths, e.g.
+        // Bench.slidingWindow(). Each logs a one-line summary and returns the numbers.
+        const Bench = {
+            time(fn) {
+                const start = performance.now();
+                fn();
+                return performance.now() - start;
+            },
+            
+            // Input events arrive at ~60-120 Hz (mousemove) and ~60 Hz (scroll), so an
+            // hour of steady movement is ~400k window updates. Each update pushes a
+            // timestamp and reads the window mean and the mean of the last 10.
+            slidingWindow({ events = 400000, size = 50 } = {}) {
+                const samples = new Float64Array(events);
+                for (let i = 0; i < events; i++) samples[i] = i * 8.3 + Math.random();
+                
+                let arrayChecksum = 0;
+                const arrayMs = this.time(() => {
+                    const window = [];
+                    for (let i = 0; i < events; i++) {
+                        window.push(samples[i]);
+                        if (window.length > size) window.shift();
+                        const recent = window.slice(-10);
+                        arrayChecksum += window.reduce((a, b) => a + b, 0) / window.length +
+                            recent.reduce((a, b) => a + b, 0) / recent.length;
+                    }
+                });
+                
+                let ringChecksum = 0;
+                const ringMs = this.time(() => {
+                    const window = StreamStats.window(size);
+                    for (let i = 0; i < events; i++) {
+                        window.push(samples[i]);
+                        ringChecksum += window.mean() + window.meanLast(10);
+                    }
+                });
+                
+                const result = {
+                    events,
+                    size,
+                    arrayMs: +arrayMs.toFixed(1),
+                    ringMs: +ringMs.toFixed(1),
+                    arrayNsPerEvent: Math.round(arrayMs * 1e6 / events),
+                    ringNsPerEvent: Math.round(ringMs * 1e6 / events),
+                    speedup: +(arrayMs / ringMs).toFixed(1),
+                    resultsMatch: Math.abs(arrayChecksum - ringChecksum) <= 1e-9 * Math.abs(arrayChecksum)
+                };
+                Log.info(`Sliding window (${events} events, size ${size}): array ${result.arrayMs}ms, ` +
+                    `ring buffer ${result.ringMs}ms, ${result.speedup}x`);
+                return result;
+            },
+            
+            // A phase's worth of answers: every card is taken from the front once,
+            // one in five answers is wrong and reinserted near the front, one in ten
+            // is skipped to the back. Same random choices for both queue types.
+            cardQueue({ sizes = [1000, 10000, 100000] } = {}) {
+                return sizes.map(size => {
+                    const cards = Array.from({ length: size }, (_, id) => ({ id }));
+                    const choices = Float64Array.from({ length: size * 2 }, () => Math.random());
+                    
+                    const arrayOrder = [];
+                    const arrayMs = this.time(() => {
+                        const queue = cards.slice();
+                        for (let i = 0; i < choices.length && queue.length; i++) {
+                            const card = queue.shift();
+                            arrayOrder.push(card.id);
+                            if (choices[i] < 0.2) queue.splice(Math.min(3, Math.floor(queue.length / 2)), 0, card);
+                            else if (choices[i] < 0.3) queue.push(card);
+                        }
+                    });
+                    
+                    const ringOrder = [];
+                    const ringMs = this.time(() => {
+                        const queue = CardQueue.from(cards, cards);
+                        for (let i = 0; i < choices.length && queue.length; i++) {
+                            const card = queue.popFront();
+                            ringOrder.push(card.id);
+                            if (choices[i] < 0.2) queue.insertAt(Math.min(3, Math.floor(queue.length / 2)), card);
+                            else if (choices[i] < 0.3) queue.pushBack(card);
+                        }
+                    });
+                    
+                    const result = {
+                        cards: size,
+                        arrayMs: +arrayMs.toFixed(1),
+                        ringMs: +ringMs.toFixed(1),
+                        speedup: +(arrayMs / ringMs).toFixed(1),
+                        resultsMatch: arrayOrder.length === ringOrder.length && arrayOrder.every((id, i) => id === ringOrder[i])
+                    };
+                    Log.info(`Card queue (${size} cards): array ${result.arrayMs}ms, CardQueue ${result.ringMs}ms, ${result.speedup}x`);
+                    return result;
+                });
+            },
+            
+            // Most-overdue-first selection: 2000 picks from a deck with random due
+            // times, one in five picked cards coming back a little later. Baseline
+            // is a linear scan for the minimum over an array.
+            dueHeap({ sizes = [1000, 10000, 100000], picks = 2000 } = {}) {
+                return sizes.map(size => {
+                    const due = Float64Array.from({ length: size }, () => Math.random() * 600);
+                    const choices = Float64Array.from({ length: picks }, () => Math.random());
+                    const makeCards = () => Array.from({ length: size }, (_, id) => ({ id, due: due[id] }));
+                    
+                    const scanOrder = [];
+                    let cards = makeCards();
+                    const scanMs = this.time(() => {
+                        const queue = cards.slice();
+                        for (let i = 0; i < picks && queue.length; i++) {
+                            let best = 0;
+                            for (let j = 1; j < queue.length; j++) {
+                                if (queue[j].due < queue[best].due) best = j;
+                            }
+                            const card = queue[best];
+                            queue[best] = queue[queue.length - 1];
+                            queue.pop();
+                            scanOrder.push(card.id);
+                            if (choices[i] < 0.2) {
+                                card.due += 1 + choices[i];
+                                queue.push(card);
+                            }
+                        }
+                    });
+                    
+                    const heapOrder = [];
+                    cards = makeCards();
+                    const heapMs = this.time(() => {
+                        const queue = DueHeap.from(cards, cards);
+                        for (let i = 0; i < picks && queue.length; i++) {
+                            const card = queue.popFront();
+                            heapOrder.push(card.id);
+                            if (choices[i] < 0.2) {
+                                card.due += 1 + choices[i];
+                                queue.pushBack(card);
+                            }
+                        }
+                    });
+                    
+                    const result = {
+                        cards: size,
+                        picks,
+                        scanMs: +scanMs.toFixed(1),
+                        heapMs: +heapMs.toFixed(1),
+                        speedup: +(scanMs / heapMs).toFixed(1),
+                        resultsMatch: scanOrder.every((id, i) => id === heapOrder[i])
+                    };
+                    Log.info(`Due heap (${size} cards, ${picks} picks): scan ${result.scanMs}ms, DueHeap ${result.heapMs}ms (build included), ${result.speedup}x`);
+                    return result;
+                });
+            },
+            
+            // Memory held by a studied deck as plain card objects (as Input built them
+            // before CardStore) versus a CardStore and its views. Both share the same
+            // question and answer strings, and every card gets the writes an answer
+            // makes, which turns the objects' timing fields into boxed doubles. Heap
+            // readings come from performance.memory, which only Chrome has; run it with
+            // --js-flags=--expose-gc --enable-precise-memory-info for exact figures.
+            // Typed-array contents live outside the JS heap, so the store's column
+            // bytes are added to its heap reading.
+            cardStore({ size = 100000 } = {}) {
+                const heapUsed = () => {
+                    if (typeof gc === 'function') gc();
+                    return performance.memory ? performance.memory.usedJSHeapSize : NaN;
+                };
+                const questions = Array.from({ length: size }, (_, i) => `Question ${i}`);
+                const answers = Array.from({ length: size }, (_, i) => `Answer ${i % 1000}`);
+                const study = card => {
+                    card.totalSeen++;
+                    card.correctCount++;
+                    card.lastSeen = card.id / 1000 + 0.5;
+                    card.nextReview = 8.5;
+                    card.due = card.lastSeen + 8.5;
+                    card.lastResponseTime = performance.now();
+                };
+                
+                let start = heapUsed();
+                let objects = questions.map((question, id) => ({
+                    question,
+                    answer: answers[id],
+                    id,
+                    difficulty: 0,
+                    lastSeen: -1,
+                    nextReview: 0,
+                    reviewLogBase: 0,
+                    reviewStep: 0,
+                    due: 0,
+                    correctCount: 0,
+                    wrongCount: 0,
+                    totalSeen: 0,
+                    consecutiveCorrect: 0,
+                    avgResponseTime: 0,
+                    lastResponseTime: 0,
+                    createdAt: performance.now()
+                }));
+                objects.forEach(study);
+                const objectBytes = heapUsed() - start;
+                objects = null;
+                
+                start = heapUsed();
+                let store = CardStore.create(size);
+                let views = questions.map((question, id) => store.add(question, answers[id]));
+                store.trim();
+                views.forEach(study);
+                const columnBytes = store.byteLength();
+                const storeBytes = heapUsed() - start + columnBytes;
+                store = views = null;
+                
+                const megabytes = bytes => +(bytes / 1048576).toFixed(1);
+                const result = {
+                    cards: size,
+                    objectMB: Number.isNaN(objectBytes) ? null : megabytes(objectBytes),
+                    storeMB: Number.isNaN(storeBytes) ? null : megabytes(storeBytes),
+                    objectBytesPerCard: Number.isNaN(objectBytes) ? null : Math.round(objectBytes / size),
+                    storeBytesPerCard: Number.isNaN(storeBytes) ? null : Math.round(storeBytes / size),
+                    columnBytesPerCard: Math.round(columnBytes / size)
+                };
+                Log.info(`Card store (${size} cards): objects ${result.objectMB}MB, CardStore ${result.storeMB}MB ` +
+                    `(${result.columnBytesPerCard} bytes/card in columns)`);
+                return result;
+            }
+        };
+        
+        // ========================================
+        // MEMORY ENHANCEMENT MODULE
+        // ========================================
+        const MemoryEnhancement = {
+            
+            // Every system, the orchestrate() events it subscribes to and its cost:
+            // 'cheap' touches only state, 'dom' writes a few styles, 'layout' also
+            // forces a layout read, 'animation' keeps running after the event, and
+            // 'audio' creates audio nodes. The method called is System<id>_<name>;
+            // args maps an event to the method's arguments and when gates the call.
+            SYSTEMS: [
+                { id: 1, name: 'ResponseTimeDetection', events: ['responseCorrect', 'responseIncorrect'], cost: 'cheap', args: (event, context) => [context.responseTime] },
+                { id: 2, name: 'PredictionErrorOptimization', events: ['responseCorrect', 'responseIncorrect'], cost: 'cheap' },
+                { id: 3, name: 'SerialPositionHacking', events: ['phaseStart'], cost: 'cheap', when: () => State.scheduling.mode !== 'due' }, // Due order wins
+                { id: 4, name: 'MicroPriming', events: ['cardDisplay'], cost: 'dom' },
+                { id: 5, name: 'VisualMemoryEncoding', events: ['cardDisplay'], cost: 'dom' },
+                { id: 6, name: 'ConsolidationWindow', events: ['specialCard'], cost: 'dom' },
+                { id: 7, name: 'EmotionalColorOptimization', events: ['phaseStart'], cost: 'dom' },
+                { id: 8, name: 'QuantumScheduling', events: ['responseCorrect', 'responseIncorrect'], cost: 'cheap' },
+                { id: 9, name: 'CovertRetrieval', events: ['sessionPause'], cost: 'dom' },
+                { id: 10, name: 'FatigueDetection', events: ['responseCorrect', 'responseIncorrect'], cost: 'cheap' },
+                { id: 11, name: 'DistinctivenessBoost', events: ['specialCard'], cost: 'dom' },
+                { id: 12, name: 'BinauralBeats', events: ['cardDisplay', 'answerReveal'], cost: 'audio', args: event => [event === 'answerReveal' ? 'answer' : 'question'] },
+                { id: 13, name: 'PeripheralInjection', events: ['cardDisplay'], cost: 'dom' },
+                { id: 14, name: 'MicrosaccadeEncoding', events: [], cost: 'dom' }, // Driven by mousemove
+                { id: 15, name: 'HapticEncoding', events: ['cardDisplay'], cost: 'cheap' },
+                { id: 16, name: 'ChromaticSignatures', events: ['cardDisplay'], cost: 'dom' },
+                { id: 17, name: 'SubliminalAudio', events: [], cost: 'audio' }, // Not wired to any event
+                { id: 18, name: 'TemporalPattern', events: ['cardDisplay'], cost: 'dom' },
+                { id: 19, name: 'FlickerConsolidation', events: ['responseCorrect'], cost: 'animation', when: () => State.performance.totalCorrect > State.performance.totalAttempts * 0.5 },
+                { id: 20, name: 'UltrasonicAnchoring', events: ['cardDisplay'], cost: 'audio' },
+                { id: 21, name: 'OlfactoryPriming', events: ['cardDisplay'], cost: 'dom' },
+                { id: 22, name: 'ProprioceptiveEncoding', events: ['cardDisplay'], cost: 'animation' },
+                { id: 23, name: 'QuantumAttentionCycling', events: ['cardDisplay'], cost: 'animation' },
+                { id: 24, name: 'ChronestheticTimeWarping', events: ['cardDisplay'], cost: 'dom' },
+                { id: 25, name: 'ParallelReality', events: ['cardDisplay'], cost: 'dom' },
+                { id: 26, name: 'SubliminalSuccessAnchoring', events: ['cardDisplay'], cost: 'dom' },
+                { id: 27, name: 'RetinalPersistenceAfterimage', events: ['cardDisplay'], cost: 'layout' },
+                { id: 28, name: 'InfrasonicResonance', events: ['cardDisplay'], cost: 'audio' },
+                { id: 29, name: 'StatisticalBlinkWindow', events: ['cardDisplay'], cost: 'dom' },
+                { id: 30, name: 'SemanticNetworkPriming', events: ['cardDisplay'], cost: 'dom' },
+                { id: 31, name: 'PhaseLockedNeuralOscillation', events: ['cardDisplay'], cost: 'layout' },
+                { id: 32, name: 'VestibularMemoryEncoding', events: ['cardDisplay'], cost: 'animation' },
+                { id: 33, name: 'CorticalSpreadingDepressionBypass', events: ['cardDisplay'], cost: 'layout' },
+                { id: 34, name: 'SubliminalEmotionalTagging', events: ['cardDisplay'], cost: 'dom' },
+                { id: 35, name: 'QuantumFieldTextVibration', events: ['cardDisplay'], cost: 'animation' },
+                { id: 36, name: 'SomaticMarkerHijacking', events: ['cardDisplay'], cost: 'layout' },
+                { id: 37, name: 'ChronobiologicalPhaseCoupling', events: ['cardDisplay'], cost: 'dom' },
+                { id: 38, name: 'MirrorNeuronActivationProtocol', events: ['cardDisplay'], cost: 'animation' },
+                { id: 39, name: 'SubliminalConfidenceInjection', events: ['responseCorrect', 'responseIncorrect'], cost: 'dom', args: event => [event === 'responseCorrect'] },
+                { id: 40, name: 'DeltaWaveMemoryConsolidation', events: ['breakStart'], cost: 'animation' },
+                { id: 41, name: 'PhantomTouchMemoryEncoding', events: ['cardDisplay'], cost: 'dom' },
+                { id: 42, name: 'AccelerometerRhythmEncoding', events: [], cost: 'dom' } // Driven by devicemotion
+            ],
+            
+            // Cost classes switched off per device class
+            DEVICE_PROFILES: {
+                full: { disabledCosts: [] },
+                low: { disabledCosts: ['layout', 'animation'] }
+            },
+            
+            // Enabled systems per event, in id order; rebuilt whenever systemsActive changes
+            subscribers: {},
+            
+            // Initialize all memory systems
+            init() {
+                this.initializeAudioNodes();
+                this.setupEventListeners();
+                this.activateSystems();
+                this.detectMobileDevice();
+            },
+            
+            initializeAudioNodes() {
+                try {
+                    if (State.settings.audioContext) {
+                        // Setup for binaural beats
+                        State.settings.leftOscillator = State.settings.audioContext.createOscillator();
+                        State.settings.rightOscillator = State.settings.audioContext.createOscillator();
+                        State.settings.binauralGainNode = State.settings.audioContext.createGain();
+                        State.settings.binauralGainNode.gain.value = 0;
+                    }
+                } catch (error) {
+                    Log.warn('Audio initialization failed:', error);
+                }
+            },
+            
+            detectMobileDevice() {
+                // Detect if this is a mobile device for System 42
+                State.memoryEnhancement.isMobileDevice = /Android|webOS|iPhone|iPad|iPod|BlackBerry|IEMobile|Opera Mini/i.test(navigator.userAgent);
+            },
+            
+            setupEventListeners() {
+                // System 14: Microsaccade Encoding Pattern
                 let lastMouseMove = 0;
                 let lastMouseX = 0;
                 let lastMouseY = 0;
@@ -1383,10 +3631,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                         const deltaY = e.clientY - lastMouseY;
                         const velocity = Math.sqrt(deltaX * deltaX + deltaY * deltaY) / deltaTime * 1000;
                         
-                        if (velocity > 300 && !State.memoryEnhancement.mouseCooldown && State.cards.current) {
+                        if (velocity > 300 && now >= State.memoryEnhancement.mouseCooldownUntil && State.cards.current && this.isEnabled(14)) {
                             this.System14_MicrosaccadeEncoding(deltaX, deltaY);
-                            State.memoryEnhancement.mouseCooldown = true;
-                            setTimeout(() => { State.memoryEnhancement.mouseCooldown = false; }, 2000);
+                            State.memoryEnhancement.mouseCooldownUntil = now + 2000;
                         }
                     }
                     lastMouseMove = now;
@@ -1400,65 +3647,18 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 }
                 
                 // Systems 31-36: Enhanced user interaction tracking
-                let interactionTimes = [];
                 
                 // Track clicks for Systems 31 and 34
                 document.addEventListener('click', (e) => {
-                    State.memoryEnhancement.isUserInteracting = true;
-                    setTimeout(() => { State.memoryEnhancement.isUserInteracting = false; }, 1000);
-                    
-                    // System 31: Track for phase-locked neural oscillation
-                    interactionTimes.push(performance.now());
-                    State.memoryEnhancement.interactionTimes.push(performance.now());
-                    
-                    // Keep only last 25 interactions
-                    if (State.memoryEnhancement.interactionTimes.length > 25) {
-                        State.memoryEnhancement.interactionTimes.shift();
-                    }
+                    this.recordInteraction();
                     
                     // System 34: Store click position for emotional tagging
                     State.memoryEnhancement.lastClickPosition = { x: e.clientX, y: e.clientY };
-                    
-                    // Calculate user tempo for System 31
-                    if (State.memoryEnhancement.interactionTimes.length >= 5) {
-                        this.calculateUserTempo(State.memoryEnhancement.interactionTimes);
-                    }
-                    
-                    // Recalculate tempo every 20 interactions
-                    if (State.memoryEnhancement.interactionTimes.length % 20 === 0) {
-                        this.calculateUserTempo(State.memoryEnhancement.interactionTimes);
-                    }
                 });
                 
-                // Track scrolling for System 31
-                document.addEventListener('scroll', () => {
-                    State.memoryEnhancement.isUserInteracting = true;
-                    setTimeout(() => { State.memoryEnhancement.isUserInteracting = false; }, 1000);
-                    
-                    State.memoryEnhancement.interactionTimes.push(performance.now());
-                    if (State.memoryEnhancement.interactionTimes.length > 25) {
-                        State.memoryEnhancement.interactionTimes.shift();
-                    }
-                    
-                    if (State.memoryEnhancement.interactionTimes.length >= 5) {
-                        this.calculateUserTempo(State.memoryEnhancement.interactionTimes);
-                    }
-                });
-                
-                // Track keyboard for System 31
-                document.addEventListener('keydown', () => {
-                    State.memoryEnhancement.isUserInteracting = true;
-                    setTimeout(() => { State.memoryEnhancement.isUserInteracting = false; }, 1000);
-                    
-                    State.memoryEnhancement.interactionTimes.push(performance.now());
-                    if (State.memoryEnhancement.interactionTimes.length > 25) {
-                        State.memoryEnhancement.interactionTimes.shift();
-                    }
-                    
-                    if (State.memoryEnhancement.interactionTimes.length >= 5) {
-                        this.calculateUserTempo(State.memoryEnhancement.interactionTimes);
-                    }
-                });
+                // Track scrolling and keyboard for System 31
+                document.addEventListener('scroll', () => this.recordInteraction());
+                document.addEventListener('keydown', () => this.recordInteraction());
                 
                 // NEW: System 42 - Setup accelerometer for mobile devices
                 if (State.memoryEnhancement.isMobileDevice && typeof DeviceMotionEvent !== 'undefined') {
@@ -1477,7 +3677,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                                     this.activateAccelerometer();
                                 }
                             })
-                            .catch(console.error);
+                            .catch(error => Log.warn('Motion permission request failed:', error));
                     }, { once: true });
                 } else {
                     // Android or older iOS
@@ -1488,7 +3688,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
             // NEW: System 42 accelerometer activation
             activateAccelerometer() {
                 State.memoryEnhancement.deviceMotionHandler = (event) => {
-                    if (State.session.isActive && !State.session.isPaused && !State.session.isBreak) {
+                    if (State.session.isActive && !State.session.isPaused && !State.session.isBreak && this.isEnabled(42)) {
                         this.System42_AccelerometerRhythmEncoding(event);
                     }
                 };
@@ -1498,12 +3698,71 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
             },
             
             activateSystems() {
-                // Activate all applicable systems (now includes 37-42)
-                for (let i = 1; i <= 42; i++) {
-                    State.memoryEnhancement.systemsActive.add(i);
+                // Activate every system the device profile allows
+                this.applyDeviceProfile(this.detectDeviceProfile());
+            },
+            
+            detectDeviceProfile() {
+                const requested = new URLSearchParams(location.search).get('systems');
+                if (requested in this.DEVICE_PROFILES) return requested;
+                
+                const cores = navigator.hardwareConcurrency || 4;
+                const memoryGb = navigator.deviceMemory || 4;
+                return cores <= 2 || memoryGb <= 2 ? 'low' : 'full';
+            },
+            
+            applyDeviceProfile(name) {
+                const profile = this.DEVICE_PROFILES[name];
+                if (!profile) throw new Error(`Unknown device profile: ${name}`);
+                
+                this.SYSTEMS.forEach(system => {
+                    this.setActive(system.id, !profile.disabledCosts.includes(system.cost));
+                });
+                State.memoryEnhancement.deviceProfile = name;
+                this.rebuildSubscribers();
+                Log.info(`Memory systems: ${name} profile, ${this.SYSTEMS.filter(system => this.isEnabled(system.id)).length} of ${this.SYSTEMS.length} enabled`);
+            },
+            
+            isEnabled(id) {
+                return State.memoryEnhancement.systemsActive.has(id) && !State.memoryEnhancement.governed.has(id);
+            },
+            
+            setActive(id, enabled) {
+                if (enabled) {
+                    State.memoryEnhancement.systemsActive.add(id);
+                } else {
+                    State.memoryEnhancement.systemsActive.delete(id);
                 }
             },
             
+            // Runtime switch, e.g. MemoryEnhancement.setSystemEnabled(35, false) from the console
+            setSystemEnabled(id, enabled) {
+                if (!this.SYSTEMS.some(system => system.id === id)) throw new Error(`Unknown memory system: ${id}`);
+                this.setActive(id, enabled);
+                this.rebuildSubscribers();
+            },
+            
+            rebuildSubscribers() {
+                const subscribers = {};
+                this.SYSTEMS.forEach(system => {
+                    if (!this.isEnabled(system.id)) return;
+                    if (!system.method) system.method = this[`System${system.id}_${system.name}`];
+                    system.events.forEach(event => {
+                        (subscribers[event] = subscribers[event] || []).push(system);
+                    });
+                });
+                this.subscribers = subscribers;
+            },
+            
+            // Summary for the console: which systems are on and what they cost
+            listSystems() {
+                return this.SYSTEMS.map(({ id, name, events, cost }) => ({
+                    id, name, events, cost,
+                    enabled: this.isEnabled(id),
+                    governed: State.memoryEnhancement.governed.has(id)
+                }));
+            },
+            
             // =====================================
             // SYSTEM 1: Response Time Memory Strength Detection
             // =====================================
@@ -1523,11 +3782,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 
                 // Store for card scheduling optimization
                 if (State.cards.current) {
-                    const stats = State.cards.stats.get(State.cards.current.id);
-                    if (stats) {
-                        stats.lastStrength = strength;
-                        stats.responseTimeHistory.push(responseTime);
-                    }
+                    const stats = CardStore.stats(State.cards.current.id);
+                    stats.lastStrength = strength;
+                    stats.responseTimeHistory.push(responseTime);
                 }
                 
                 return strength;
@@ -1537,31 +3794,22 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
             // SYSTEM 2: Prediction Error Optimization
             // =====================================
             System2_PredictionErrorOptimization() {
-                // Track last 50 cards
-                State.performance.successRateHistory.push(State.performance.totalCorrect / Math.max(1, State.performance.totalAttempts));
-                if (State.performance.successRateHistory.length > 50) {
-                    State.performance.successRateHistory.shift();
-                }
+                const successRate = State.performance.totalCorrect / Math.max(1, State.performance.totalAttempts);
+                State.performance.successRateHistory.push(successRate);
                 
-                if (State.performance.successRateHistory.length >= 20) {
-                    const recentRate = State.performance.successRateHistory.slice(-20).reduce((a, b) => a + b, 0) / 20;
+                if (State.performance.successRateHistory.isFull()) {
+                    const recentRate = State.performance.successRateHistory.mean();
                     
-                    // Adjust intervals based on performance
+                    // Adjust intervals based on performance: shorten by 18% when it is
+                    // too easy, lengthen by 18% when too hard. Applied lazily on read.
+                    let factor = 1;
                     if (recentRate > 0.87) {
-                        // Decrease intervals by 18%
-                        State.phase.queues.forEach(queue => {
-                            queue.forEach(card => {
-                                card.nextReview *= 0.82;
-                            });
-                        });
+                        factor = 0.82;
                     } else if (recentRate < 0.83) {
-                        // Increase intervals by 18%
-                        State.phase.queues.forEach(queue => {
-                            queue.forEach(card => {
-                                card.nextReview *= 1.18;
-                            });
-                        });
+                        factor = 1.18;
                     }
+                    
+                    if (factor !== 1) State.scheduling.logScale += Math.log(factor);
                 }
             },
             
@@ -1594,7 +3842,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     }
                 }
                 
-                State.phase.queues[State.phase.current] = newQueue.filter(card => card);
+                ScholarSRS.Phase.setQueue(State.phase.current, newQueue.filter(card => card));
             },
             
             // =====================================
@@ -1614,18 +3862,12 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 primeElement.style.top = '40%';
                 primeElement.style.transform = 'translate(-50%, -50%)';
                 
-                // Display for 33ms
-                setTimeout(() => {
-                    primeElement.style.opacity = '0';
-                    // 50ms backward mask
-                    setTimeout(() => {
-                        primeElement.textContent = '██';
-                        primeElement.style.opacity = '0.08';
-                        setTimeout(() => {
-                            primeElement.style.opacity = '0';
-                        }, 50);
-                    }, 0);
-                }, 33);
+                // Display for 33ms, then a 50ms backward mask
+                const hide = () => { primeElement.style.opacity = '0'; };
+                Effects.sequence([
+                    [33, () => { primeElement.textContent = '██'; }],
+                    [50, hide]
+                ], { cleanup: hide });
             },
             
             // =====================================
@@ -1679,22 +3921,22 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 container.style.transition = 'transform 4s ease-in-out';
                 container.style.transform = 'scale(0.98)';
                 
-                setTimeout(() => {
+                Effects.after(4000, () => {
                     container.style.transform = 'scale(1)';
-                }, 4000);
+                }, { scope: 'session', flush: true });
                 
                 // Background fade
                 document.body.style.transition = 'opacity 0.5s';
                 document.body.style.opacity = '0.95';
                 
                 // Re-enable after 8 seconds
-                setTimeout(() => {
+                Effects.after(8000, () => {
                     document.querySelectorAll('.button-group button').forEach(btn => {
                         btn.disabled = false;
                         btn.style.opacity = '1';
                     });
                     document.body.style.opacity = '1';
-                }, 8000);
+                }, { scope: 'session', flush: true });
             },
             
             // =====================================
@@ -1735,13 +3977,11 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 // Add jitter
                 const jitter = 0.9 + (Math.random() * 0.2); // ±10%
                 
-                const stats = State.cards.stats.get(State.cards.current.id);
-                if (stats) {
-                    stats.quantumSchedule = State.memoryEnhancement.quantumSchedule.map(interval => 
-                        Math.round(interval * adjustedFactor * jitter)
-                    );
-                    stats.quantumScheduleIndex = 0;
-                }
+                const stats = CardStore.stats(State.cards.current.id);
+                stats.quantumSchedule = State.memoryEnhancement.quantumSchedule.map(interval => 
+                    Math.round(interval * adjustedFactor * jitter)
+                );
+                stats.quantumScheduleIndex = 0;
             },
             
             // =====================================
@@ -1765,17 +4005,17 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 
                 // Flash briefly
                 selectedCards.forEach((card, index) => {
-                    setTimeout(() => {
+                    Effects.after(index * 200, () => {
                         const primeElement = document.getElementById('memory-prime');
                         if (primeElement) {
                             primeElement.textContent = card.question;
                             primeElement.style.opacity = '0.04';
                             primeElement.style.fontSize = '0.9rem';
-                            setTimeout(() => {
+                            Effects.after(167, () => {
                                 primeElement.style.opacity = '0';
-                            }, 167);
+                            }, { scope: 'session', flush: true });
                         }
-                    }, index * 200);
+                    }, { scope: 'session', maxDelay: 100 });
                 });
                 
                 State.memoryEnhancement.lastPrimeTime = now;
@@ -1788,9 +4028,8 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 if (State.performance.cardsSeenInSession < 10) return;
                 
                 // Calculate baseline from first 10 cards
-                if (!State.timing.responseTimeBaseline && State.performance.last50ResponseTimes.length >= 10) {
-                    const first10 = State.performance.last50ResponseTimes.slice(0, 10);
-                    State.timing.responseTimeBaseline = first10.reduce((a, b) => a + b, 0) / 10;
+                if (!State.timing.responseTimeBaseline && State.performance.last50ResponseTimes.count >= 10) {
+                    State.timing.responseTimeBaseline = State.performance.last50ResponseTimes.sumFirst(10) / 10;
                 }
                 
                 if (!State.timing.responseTimeBaseline) return;
@@ -1799,8 +4038,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 if (State.performance.cardsSeenInSession % 15 !== 0) return;
                 
                 // Calculate recent average
-                const recent10 = State.performance.last50ResponseTimes.slice(-10);
-                const recentAvg = recent10.reduce((a, b) => a + b, 0) / recent10.length;
+                const recentAvg = State.performance.last50ResponseTimes.meanLast(10);
                 
                 // Check fatigue indicators
                 let fatigueLevel = 0;
@@ -1808,11 +4046,10 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     fatigueLevel++;
                 }
                 
-                const recentSuccess = State.performance.successRateHistory.slice(-15);
-                const recentRate = recentSuccess.reduce((a, b) => a + b, 0) / recentSuccess.length;
+                const recentRate = State.performance.successRateHistory.meanLast(15);
                 const overallRate = State.performance.totalCorrect / Math.max(1, State.performance.totalAttempts);
                 
-                if (recentRate < overallRate * 0.88) {
+                if (State.performance.successRateHistory.count && recentRate < overallRate * 0.88) {
                     fatigueLevel++;
                 }
                 
@@ -1852,10 +4089,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 
                 // Store that this card was distinctive
                 if (State.cards.current) {
-                    const stats = State.cards.stats.get(State.cards.current.id);
-                    if (stats) {
-                        stats.wasDistinctive = true;
-                    }
+                    CardStore.stats(State.cards.current.id).wasDistinctive = true;
                 }
             },
             
@@ -1900,14 +4134,12 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     leftOsc.start();
                     rightOsc.start();
                     
-                    // Fade out after card display
-                    setTimeout(() => {
-                        gainNode.gain.exponentialRampToValueAtTime(0.001, State.settings.audioContext.currentTime + 0.2);
-                        setTimeout(() => {
-                            leftOsc.stop();
-                            rightOsc.stop();
-                        }, 200);
-                    }, 3000);
+                    // Fade out after card display, scheduled on the audio clock
+                    const fadeAt = State.settings.audioContext.currentTime + 3;
+                    gainNode.gain.setValueAtTime(0.08, fadeAt);
+                    gainNode.gain.exponentialRampToValueAtTime(0.001, fadeAt + 0.2);
+                    leftOsc.stop(fadeAt + 0.2);
+                    rightOsc.stop(fadeAt + 0.2);
                     
                 } catch (error) {
                     // Binaural beats failed
@@ -1942,9 +4174,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 element.style.fontSize = '24px';
                 element.style.color = State.memoryEnhancement.emotionalColorRotation > 0 ? '#2e7d32' : '#1976d2';
                 
-                setTimeout(() => {
+                Effects.after(3000, () => {
                     element.style.opacity = '0';
-                }, 3000);
+                }, { flush: true });
                 
                 State.memoryEnhancement.peripheralRotation = (State.memoryEnhancement.peripheralRotation + 1) % 8;
                 State.memoryEnhancement.lastPeripheralTime = now;
@@ -1972,9 +4204,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 element.style.top = (mouseY + normalizedY) + 'px';
                 element.style.opacity = '0.09';
                 
-                setTimeout(() => {
+                Effects.after(83, () => {
                     element.style.opacity = '0';
-                }, 83);
+                }, { flush: true });
             },
             
             // =====================================
@@ -1989,9 +4221,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 // Scale pattern by intensity
                 const scaledPattern = pattern.map(duration => Math.round(duration * intensity));
                 
-                setTimeout(() => {
+                Effects.after(200, () => {
                     navigator.vibrate(scaledPattern);
-                }, 200);
+                });
             },
             
             // =====================================
@@ -2068,13 +4300,13 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 if (stats && stats.totalSeen > 1) {
                     const storedPattern = State.memoryEnhancement.temporalPatterns.get(State.cards.current.id);
                     if (storedPattern) {
-                        setTimeout(() => {
+                        Effects.after(0, () => {
                             // Subtle timing adjustment
                             const container = document.querySelector('.card-container');
                             if (container) {
                                 container.style.transition = `opacity ${storedPattern}ms`;
                             }
-                        }, 0);
+                        });
                     }
                 }
             },
@@ -2090,9 +4322,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 
                 container.style.animation = 'flicker  0.5s ease-in-out 4';
                 
-                setTimeout(() => {
+                Effects.after(2000, () => {
                     container.style.animation = '';
-                }, 2000);
+                }, { scope: 'session', flush: true });
             },
             
             // =====================================
@@ -2139,9 +4371,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 element.textContent = word;
                 element.style.opacity = '0.02';
                 
-                setTimeout(() => {
+                Effects.after(25, () => {
                     element.style.opacity = '0';
-                }, 25);
+                }, { flush: true });
                 
                 State.memoryEnhancement.lastOlfactoryTime = now;
             },
@@ -2170,10 +4402,10 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 container.style.transform = `rotate(${rotation}deg)`;
                 
                 // Reset after 4 seconds
-                setTimeout(() => {
+                Effects.after(4000, () => {
                     container.style.transition = 'transform 2s ease-in-out';
                     container.style.transform = 'rotate(0deg)';
-                }, 4000);
+                }, { scope: 'session', flush: true });
                 
                 State.memoryEnhancement.lastProprioceptiveTime = now;
             },
@@ -2188,7 +4420,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 if (!questionElement) return;
                 
                 // Skip during user interaction
-                if (State.memoryEnhancement.isUserInteracting) return;
+                if (this.isUserInteracting()) return;
                 
                 // Check if user can interact (answer not shown yet)
                 const showBtn = document.getElementById('show-answer-btn');
@@ -2203,41 +4435,23 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 const flashDuration = 8; // ms
                 const opacity = 0.013;
                 
-                // Clean up any existing intervals
-                State.memoryEnhancement.quantumCyclingInterval.forEach(clearInterval);
-                State.memoryEnhancement.quantumCyclingInterval = [];
-                
-                // Start quantum cycling
-                const cyclingInterval = setInterval(() => {
-                    // Double-check conditions during cycling
-                    if (!State.cards.current || 
-                        State.memoryEnhancement.isUserInteracting ||
-                        document.getElementById('show-answer-btn').style.display === 'none') {
-                        clearInterval(cyclingInterval);
-                        return;
+                // Cycle until the answer is shown, the learner interacts, or 30 seconds pass.
+                // The scheduler already runs on animation frames, so each flash is
+                // phase-locked to the screen refresh and lasts a single frame.
+                const originalOpacity = questionElement.style.opacity || '1';
+                Effects.every(interval, () => {
+                    if (!State.cards.current ||
+                        this.isUserInteracting() ||
+                        showBtn.style.display === 'none') {
+                        return false;
                     }
                     
-                    // Phase-lock to screen refresh rate (requestAnimationFrame)
-                    requestAnimationFrame(() => {
-                        // Flash text only, not background
-                        const originalOpacity = questionElement.style.opacity || '1';
-                        questionElement.style.opacity = opacity;
-                        
-                        setTimeout(() => {
-                            questionElement.style.opacity = originalOpacity;
-                        }, flashDuration);
-                    });
-                }, interval);
-                
-                // Store interval for cleanup
-                State.memoryEnhancement.quantumCyclingInterval.push(cyclingInterval);
-                
-                // Auto cleanup after 30 seconds
-                setTimeout(() => {
-                    clearInterval(cyclingInterval);
-                    State.memoryEnhancement.quantumCyclingInterval = 
-                        State.memoryEnhancement.quantumCyclingInterval.filter(i => i !== cyclingInterval);
-                }, 30000);
+                    // Flash text only, not background
+                    questionElement.style.opacity = opacity;
+                    Effects.after(flashDuration, () => {
+                        questionElement.style.opacity = originalOpacity;
+                    }, { flush: true });
+                }, { key: 'attentionCycling', duration: 30000 });
             },
             
             // =====================================
@@ -2428,9 +4642,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 anchorElement.style.opacity = '0.025';
                 
                 // Display for 20ms
-                setTimeout(() => {
+                Effects.after(20, () => {
                     anchorElement.style.opacity = '0';
-                }, 20);
+                }, { flush: true });
                 
                 State.memoryEnhancement.lastSuccessAnchorTime = now;
             },
@@ -2485,30 +4699,31 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 // Flash at 0.95 opacity for 750ms
                 flashElement.style.opacity = '0.95';
                 
-                setTimeout(() => {
-                    // 50ms neutral gray follow-up
-                    flashElement.style.backgroundColor = '#808080';
-                    flashElement.style.opacity = '0.3';
-                    flashElement.textContent = '';
-                    
-                    setTimeout(() => {
+                const answer = State.cards.current.answer;
+                Effects.sequence([
+                    [750, () => {
+                        // 50ms neutral gray follow-up
+                        flashElement.style.backgroundColor = '#808080';
+                        flashElement.style.opacity = '0.3';
+                        flashElement.textContent = '';
+                    }],
+                    [50, () => {
                         // Create ghosted afterimage
                         flashElement.style.backgroundColor = 'transparent';
                         flashElement.style.opacity = '0.08';
-                        flashElement.textContent = State.cards.current.answer;
+                        flashElement.textContent = answer;
                         flashElement.style.color = complementaryColor;
-                        
-                        // Afterimage persists for 2-3 seconds
-                        setTimeout(() => {
-                            flashElement.style.opacity = '0';
-                            setTimeout(() => {
-                                flashElement.style.display = 'none';
-                                State.memoryEnhancement.retinalAfterimageActive = false;
-                            }, 500);
-                        }, 2500); // 2.5 second afterimage
-                        
-                    }, 50); // 50ms gray
-                }, 750); // 750ms main flash
+                    }],
+                    // Afterimage persists for 2.5 seconds, then fades out
+                    [2500, () => { flashElement.style.opacity = '0'; }],
+                    [500, () => {}]
+                ], {
+                    cleanup: () => {
+                        flashElement.style.opacity = '0';
+                        flashElement.style.display = 'none';
+                        State.memoryEnhancement.retinalAfterimageActive = false;
+                    }
+                });
             },
             
             // =====================================
@@ -2550,18 +4765,19 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     State.memoryEnhancement.infrasonicOscillator = oscillator;
                     State.memoryEnhancement.infrasonicGainNode = gainNode;
                     
-                    // Stop after card display (will be restarted for next card)
-                    setTimeout(() => {
+                    // Stop after card display (will be restarted for next card),
+                    // scheduled on the audio clock: 8 seconds, then a 0.5s fade
+                    const fadeAt = context.currentTime + 8;
+                    gainNode.gain.setValueAtTime(0.003, fadeAt);
+                    gainNode.gain.exponentialRampToValueAtTime(0.001, fadeAt + 0.5);
+                    oscillator.stop(fadeAt + 0.5);
+                    oscillator.onended = () => {
+                        oscillator.disconnect();
                         if (State.memoryEnhancement.infrasonicOscillator === oscillator) {
-                            gainNode.gain.exponentialRampToValueAtTime(0.001, context.currentTime + 0.5);
-                            setTimeout(() => {
-                                oscillator.stop();
-                                oscillator.disconnect();
-                                State.memoryEnhancement.infrasonicOscillator = null;
-                                State.memoryEnhancement.infrasonicGainNode = null;
-                            }, 500);
+                            State.memoryEnhancement.infrasonicOscillator = null;
+                            State.memoryEnhancement.infrasonicGainNode = null;
                         }
-                    }, 8000); // 8 second duration
+                    };
                     
                 } catch (error) {
                     // Infrasonic failed
@@ -2590,7 +4806,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 if (now - State.memoryEnhancement.lastBlinkTime < randomInterval) return;
                 
                 // Get next card preview
-                const nextCard = State.phase.queues[State.phase.current][0];
+                const nextCard = State.phase.queues[State.phase.current].at(0);
                 if (!nextCard) return;
                 
                 const blinkElement = document.getElementById('blink-preview');
@@ -2611,9 +4827,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 // Flash during predicted blink (150ms duration, 0.15 opacity)
                 blinkElement.style.opacity = '0.15';
                 
-                setTimeout(() => {
+                Effects.after(150, () => {
                     blinkElement.style.opacity = '0';
-                }, 150); // Average blink duration
+                }, { flush: true }); // Average blink duration
                 
                 State.memoryEnhancement.lastBlinkTime = now;
             },
@@ -2654,7 +4870,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 
                 // Flash 3 related words sequentially
                 relatedWords.slice(0, 3).forEach((word, index) => {
-                    setTimeout(() => {
+                    Effects.after(index * 150, () => {
                         const element = primeElements[index];
                         
                         // Random scatter position (±100px from center)
@@ -2670,11 +4886,11 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                         element.style.opacity = '0.018'; // Very low opacity
                         
                         // Flash for 17ms
-                        setTimeout(() => {
+                        Effects.after(17, () => {
                             element.style.opacity = '0';
-                        }, 17);
+                        }, { flush: true });
                         
-                    }, index * 150); // 150ms spacing between words
+                    }, { maxDelay: 100 }); // 150ms spacing between words
                 });
                 
                 State.memoryEnhancement.lastSemanticPrimeTime = now;
@@ -2710,9 +4926,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 flashElement.style.opacity = '0.011'; // Very subtle
                 
                 // Flash for exactly 12ms to synchronize with motor cortex
-                setTimeout(() => {
+                Effects.after(12, () => {
                     flashElement.style.opacity = '0';
-                }, 12);
+                }, { flush: true });
                 
                 State.memoryEnhancement.lastPhaseLockedTime = now;
             },
@@ -2743,16 +4959,19 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 container.classList.add('vestibular-shift');
                 container.style.transform = direction;
                 
-                // Reset to 0deg after 3 seconds
-                setTimeout(() => {
-                    container.style.transform = 'perspective(1000px) rotateX(0deg) rotateY(0deg)';
-                    
-                    // Remove class after transition completes
-                    setTimeout(() => {
+                // Reset to 0deg after 3 seconds, remove class after transition completes
+                Effects.sequence([
+                    [3000, () => {
+                        container.style.transform = 'perspective(1000px) rotateX(0deg) rotateY(0deg)';
+                    }],
+                    [3000, () => {}]
+                ], {
+                    scope: 'session',
+                    cleanup: () => {
                         container.classList.remove('vestibular-shift');
                         container.style.transform = '';
-                    }, 3000);
-                }, 3000);
+                    }
+                });
                 
                 State.memoryEnhancement.lastVestibularTime = now;
             },
@@ -2781,11 +5000,11 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 ringElement.style.animation = 'corticalExpansion 1200ms ease-out forwards';
                 
                 // Reset after animation completes
-                setTimeout(() => {
+                Effects.after(1200, () => {
                     ringElement.style.animation = '';
                     ringElement.style.opacity = '0';
                     State.memoryEnhancement.corticalRingActive = false;
-                }, 1200);
+                }, { scope: 'session', flush: true });
             },
             
             // =====================================
@@ -2829,9 +5048,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 tagElement.style.opacity = '0.016'; // Very subtle opacity
                 
                 // Display for exactly 14ms to hijack amygdala processing
-                setTimeout(() => {
+                Effects.after(14, () => {
                     tagElement.style.opacity = '0';
-                }, 14);
+                }, { flush: true });
                 
                 State.memoryEnhancement.lastEmotionalTagTime = now;
             },
@@ -2847,11 +5066,8 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 
                 if (!questionElement) return;
                 
-                // Clear any existing vibration intervals
-                State.memoryEnhancement.quantumVibrationIntervals.forEach(clearInterval);
-                State.memoryEnhancement.quantumVibrationIntervals = [];
-                
                 // Apply quantum vibration to both question and answer text
+                const jitterSpans = [];
                 [questionElement, answerElement].forEach(element => {
                     if (!element) return;
                     
@@ -2868,29 +5084,23 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     }).join('');
                     
                     element.innerHTML = wrappedText;
-                    
-                    // Apply jitter to marked characters at 33Hz (invisible flicker)
-                    const jitterSpans = element.querySelectorAll('.quantum-jitter');
-                    
+                    jitterSpans.push(...element.querySelectorAll('.quantum-jitter'));
+                });
+                
+                // Jitter all marked characters at 33Hz (invisible flicker) for 500ms,
+                // from a single effect rather than one timer per character
+                Effects.every(1000 / 33, () => {
                     jitterSpans.forEach(span => {
-                        let jitterInterval = setInterval(() => {
-                            // ±0.3px jitter using transform not position
-                            const jitterX = (Math.random() - 0.5) * 0.6; // ±0.3px
-                            const jitterY = (Math.random() - 0.5) * 0.6; // ±0.3px
-                            
-                            span.style.transform = `translate(${jitterX}px, ${jitterY}px)`;
-                        }, 1000 / 33); // 33Hz frequency
+                        // ±0.3px jitter using transform not position
+                        const jitterX = (Math.random() - 0.5) * 0.6; // ±0.3px
+                        const jitterY = (Math.random() - 0.5) * 0.6; // ±0.3px
                         
-                        State.memoryEnhancement.quantumVibrationIntervals.push(jitterInterval);
-                        
-                        // Stop jitter after 500ms per activation
-                        setTimeout(() => {
-                            clearInterval(jitterInterval);
-                            span.style.transform = '';
-                            State.memoryEnhancement.quantumVibrationIntervals = 
-                                State.memoryEnhancement.quantumVibrationIntervals.filter(i => i !== jitterInterval);
-                        }, 500);
+                        span.style.transform = `translate(${jitterX}px, ${jitterY}px)`;
                     });
+                }, {
+                    key: 'textVibration',
+                    duration: 500,
+                    cleanup: () => jitterSpans.forEach(span => { span.style.transform = ''; })
                 });
             },
             
@@ -2934,9 +5144,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 somaticElement.style.opacity = '0.019'; // Very subtle
                 
                 // Display for exactly 22ms to associate body sensations with memory
-                setTimeout(() => {
+                Effects.after(22, () => {
                     somaticElement.style.opacity = '0';
-                }, 22);
+                }, { flush: true });
                 
                 State.memoryEnhancement.lastSomaticTime = now;
             },
@@ -2981,7 +5191,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     State.memoryEnhancement.chronobiologicalTintApplied = true;
                     
                     // Aligns with circadian memory peaks - log for research
-                    console.log(`Chronobiological tint applied: ${tintStrength} at ${now.getHours()}:${now.getMinutes().toString().padStart(2, '0')}`);
+                    Log.debug(() => `Chronobiological tint applied: ${tintStrength} at ${now.getHours()}:${now.getMinutes().toString().padStart(2, '0')}`);
                 }
             },
             
@@ -3045,10 +5255,10 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 pathElement.style.animation = 'handwritingAnimation 400ms ease-out forwards';
                 
                 // Hide after duration
-                setTimeout(() => {
+                Effects.after(400, () => {
                     traceElement.style.opacity = '0';
                     pathElement.style.animation = '';
-                }, 400);
+                }, { flush: true });
                 
                 State.memoryEnhancement.lastHandwritingTime = now;
             },
@@ -3099,9 +5309,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 flashElement.style.opacity = '0.021'; // Very subtle opacity
                 
                 // Flash for exactly 11ms to bypass conscious evaluation
-                setTimeout(() => {
+                Effects.after(11, () => {
                     flashElement.style.opacity = '0';
-                }, 11);
+                }, { scope: 'session', flush: true });
                 
                 State.memoryEnhancement.lastConfidenceFlashTime = now;
             },
@@ -3122,37 +5332,26 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 // Apply delta wave pulse class for CSS transitions
                 container.classList.add('delta-wave-pulse');
                 
-                // 2Hz pulsing (500ms per cycle)
+                // 2Hz pulsing (500ms per cycle), 4 seconds total
                 let pulseCount = 0;
-                const maxPulses = 8; // 4 seconds total
+                const maxPulses = 8;
                 
-                State.memoryEnhancement.deltaWaveInterval = setInterval(() => {
-                    if (pulseCount >= maxPulses) {
-                        clearInterval(State.memoryEnhancement.deltaWaveInterval);
+                Effects.every(250, () => { // 500ms cycle / 2 = 250ms per half-cycle
+                    if (pulseCount >= maxPulses) return false;
+                    
+                    // Pulse between 0.97 and 1.03 opacity
+                    container.style.opacity = pulseCount % 2 === 0 ? '0.97' : '1.03';
+                    pulseCount++;
+                }, {
+                    key: 'deltaWave',
+                    scope: 'break',
+                    cleanup: () => {
                         container.classList.remove('delta-wave-pulse');
                         container.style.opacity = '1';
                         State.memoryEnhancement.deltaWavePulseActive = false;
-                        
-                        // Clean up Schumann resonance
-                        if (State.memoryEnhancement.schumannResonanceOscillator) {
-                            State.memoryEnhancement.schumannGainNode.gain.exponentialRampToValueAtTime(
-                                0.001, State.settings.audioContext.currentTime + 0.5
-                            );
-                            setTimeout(() => {
-                                State.memoryEnhancement.schumannResonanceOscillator.stop();
-                                State.memoryEnhancement.schumannResonanceOscillator.disconnect();
-                                State.memoryEnhancement.schumannResonanceOscillator = null;
-                                State.memoryEnhancement.schumannGainNode = null;
-                            }, 500);
-                        }
-                        return;
+                        this.stopSchumannResonance();
                     }
-                    
-                    // Pulse between 0.97 and 1.03 opacity
-                    const opacity = pulseCount % 2 === 0 ? '0.97' : '1.03';
-                    container.style.opacity = opacity;
-                    pulseCount++;
-                }, 250); // 500ms cycle / 2 = 250ms per half-cycle
+                });
                 
                 // Combine with 7.83Hz Schumann resonance audio
                 if (State.settings.soundEnabled && State.settings.audioContext) {
@@ -3255,13 +5454,33 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 flashElement.style.opacity = '0.014'; // Very subtle
                 
                 // Flash for exactly 16ms synchronized to tremor
-                setTimeout(() => {
+                Effects.after(16, () => {
                     flashElement.style.opacity = '0';
-                }, 16);
+                }, { flush: true });
                 
                 State.memoryEnhancement.lastAccelerometerFlashTime = now;
             },
             
+            // Fade out System 40's Schumann tone on the audio clock
+            stopSchumannResonance() {
+                const oscillator = State.memoryEnhancement.schumannResonanceOscillator;
+                if (!oscillator) return;
+                
+                const gain = State.memoryEnhancement.schumannGainNode.gain;
+                const now = State.settings.audioContext.currentTime;
+                gain.setValueAtTime(gain.value, now);
+                gain.exponentialRampToValueAtTime(0.001, now + 0.5);
+                oscillator.stop(now + 0.5);
+                oscillator.onended = () => oscillator.disconnect();
+                State.memoryEnhancement.schumannResonanceOscillator = null;
+                State.memoryEnhancement.schumannGainNode = null;
+            },
+            
+            // Helper for System 23: recent click, scroll or key press
+            isUserInteracting() {
+                return performance.now() - State.memoryEnhancement.lastInteractionTime < 1000;
+            },
+            
             // Helper function to find semantic relations (from System 30)
             findSemanticRelations(keyWord) {
                 const database = State.memoryEnhancement.semanticWordDatabase;
@@ -3293,17 +5512,17 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 return shuffled.slice(0, 5); // Return up to 5 words
             },
             
-            // Helper function to calculate user tempo for System 31
-            calculateUserTempo(times) {
-                if (times.length < 2) return;
+            // Helper for System 31: user tempo is the mean gap between the last 25
+            // interactions, which telescopes to (newest - oldest) / (count - 1)
+            recordInteraction() {
+                const now = performance.now();
+                const times = State.memoryEnhancement.interactionTimes;
+                State.memoryEnhancement.lastInteractionTime = now;
+                times.push(now);
                 
-                const intervals = [];
-                for (let i = 1; i < times.length; i++) {
-                    intervals.push(times[i] - times[i-1]);
+                if (times.count >= 5) {
+                    State.memoryEnhancement.userTempo = (times.newest() - times.oldest()) / (times.count - 1);
                 }
-                
-                const avgInterval = intervals.reduce((a, b) => a + b, 0) / intervals.length;
-                State.memoryEnhancement.userTempo = avgInterval;
             },
             
             // Helper function to clear preload cache
@@ -3322,110 +5541,67 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
             // Main orchestration function
             orchestrate(event) {
                 if (!State.session.isActive || State.session.isPaused) return;
+                Log.traceEvery(20, `orchestrate:${event}`, () => `orchestrate ${event} (${State.memoryEnhancement.systemsActive.size} systems active)`);
                 
-                switch(event) {
+                // Work that must happen around the systems, whichever are enabled
+                const context = {};
+                switch (event) {
                     case 'cardDisplay':
-                        // Systems activated on card display (1-36)
-                        this.System4_MicroPriming();
-                        this.System5_VisualMemoryEncoding();
-                        this.System12_BinauralBeats('question');
-                        this.System13_PeripheralInjection();
-                        this.System15_HapticEncoding();
-                        this.System16_ChromaticSignatures();
-                        this.System18_TemporalPattern();
-                        this.System20_UltrasonicAnchoring();
-                        this.System21_OlfactoryPriming();
-                        // Systems 22-26
-                        this.System22_ProprioceptiveEncoding();
-                        this.System23_QuantumAttentionCycling();
-                        this.System24_ChronestheticTimeWarping();
-                        this.System25_ParallelReality();
-                        this.System26_SubliminalSuccessAnchoring();
-                        // Systems 27-30
-                        this.System27_RetinalPersistenceAfterimage();
-                        this.System28_InfrasonicResonance();
-                        this.System29_StatisticalBlinkWindow();
-                        this.System30_SemanticNetworkPriming();
-                        // Systems 31-36
-                        this.System31_PhaseLockedNeuralOscillation();
-                        this.System32_VestibularMemoryEncoding();
-                        this.System33_CorticalSpreadingDepressionBypass();
-                        this.System34_SubliminalEmotionalTagging();
-                        this.System35_QuantumFieldTextVibration();
-                        this.System36_SomaticMarkerHijacking();
-                        // NEW SYSTEMS 37-42
-                        this.System37_ChronobiologicalPhaseCoupling();
-                        this.System38_MirrorNeuronActivationProtocol();
-                        this.System41_PhantomTouchMemoryEncoding();
+                        // A skipped card never reached cleanupAfterResponse
+                        Effects.cancelScope('card');
                         break;
                         
+                    case 'responseCorrect':
+                    case 'responseIncorrect':
+                        context.responseTime = performance.now() - State.timing.cardDisplayStartTime;
+                        break;
+                }
+                
+                this.dispatch(event, context);
+                
+                switch (event) {
                     case 'answerReveal':
-                        this.System12_BinauralBeats('answer');
                         // Clear quantum cycling when answer is revealed
-                        State.memoryEnhancement.quantumCyclingInterval.forEach(clearInterval);
-                        State.memoryEnhancement.quantumCyclingInterval = [];
+                        Effects.cancel('attentionCycling');
                         break;
                         
                     case 'responseCorrect':
-                        const responseTime = performance.now() - State.timing.cardDisplayStartTime;
-                        this.System1_ResponseTimeDetection(responseTime);
-                        this.System2_PredictionErrorOptimization();
-                        this.System8_QuantumScheduling();
-                        this.System10_FatigueDetection();
-                        // NEW: System 39 for correct responses
-                        this.System39_SubliminalConfidenceInjection(true);
-                        
-                        if (State.performance.totalCorrect > State.performance.totalAttempts * 0.5) {
-                            this.System19_FlickerConsolidation();
-                        }
-                        
-                        this.cleanupAfterResponse();
-                        break;
-                        
                     case 'responseIncorrect':
-                        const responseTimeWrong = performance.now() - State.timing.cardDisplayStartTime;
-                        this.System1_ResponseTimeDetection(responseTimeWrong);
-                        this.System2_PredictionErrorOptimization();
-                        this.System8_QuantumScheduling();
-                        this.System10_FatigueDetection();
-                        // NEW: System 39 for incorrect responses
-                        this.System39_SubliminalConfidenceInjection(false);
-                        
                         this.cleanupAfterResponse();
                         break;
                         
-                    case 'phaseStart':
-                        this.System3_SerialPositionHacking();
-                        this.System7_EmotionalColorOptimization();
-                        break;
-                        
                     case 'sessionPause':
-                        this.System9_CovertRetrieval();
-                        this.pauseAllSystems();
-                        break;
-                        
                     case 'breakStart':
-                        // NEW: System 40 activates during breaks
-                        this.System40_DeltaWaveMemoryConsolidation();
                         this.pauseAllSystems();
                         break;
-                        
-                    case 'specialCard':
-                        this.System6_ConsolidationWindow();
-                        this.System11_DistinctivenessBoost();
-                        break;
+                }
+            },
+            
+            // Run the enabled subscribers of an event; one failing system doesn't stop the rest
+            dispatch(event, context) {
+                const subscribers = this.subscribers[event];
+                if (!subscribers) return;
+                
+                for (const system of subscribers) {
+                    if (system.when && !system.when()) continue;
+                    const profiled = Profiler.active;
+                    const traceStart = Timeline.active ? performance.now() : 0;
+                    if (profiled) Profiler.begin(system);
+                    try {
+                        system.method.apply(this, system.args ? system.args(event, context) : []);
+                    } catch (error) {
+                        ScholarSRS.Error.handle(`system${system.id}`, error);
+                    } finally {
+                        if (profiled) Profiler.end(system);
+                        if (traceStart) Timeline.complete(`System${system.id}_${system.name}`, 'system', traceStart);
+                    }
                 }
             },
             
             // Helper function to clean up after response
             cleanupAfterResponse() {
-                // Clear quantum cycling on response
-                State.memoryEnhancement.quantumCyclingInterval.forEach(clearInterval);
-                State.memoryEnhancement.quantumCyclingInterval = [];
-                
-                // Clear quantum vibration intervals
-                State.memoryEnhancement.quantumVibrationIntervals.forEach(clearInterval);
-                State.memoryEnhancement.quantumVibrationIntervals = [];
+                // End this card's effects (quantum cycling, text vibration, flashes)
+                Effects.cancelScope('card');
                 
                 // Clear used preload cache
                 this.clearPreloadCache();
@@ -3440,17 +5616,14 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
             
             // Helper function to pause systems during breaks/pauses
             pauseAllSystems() {
-                // Pause quantum cycling during breaks
-                State.memoryEnhancement.quantumCyclingInterval.forEach(clearInterval);
-                State.memoryEnhancement.quantumCyclingInterval = [];
-                
-                // Pause quantum vibration during breaks
-                State.memoryEnhancement.quantumVibrationIntervals.forEach(clearInterval);
-                State.memoryEnhancement.quantumVibrationIntervals = [];
+                // End card and cross-card effects during breaks
+                Effects.cancelScope('card', 'session');
                 
-                // Pause infrasonic resonance
+                // Pause infrasonic resonance (dropping its scheduled fade)
                 if (State.memoryEnhancement.infrasonicOscillator) {
-                    State.memoryEnhancement.infrasonicGainNode.gain.value = 0;
+                    const gain = State.memoryEnhancement.infrasonicGainNode.gain;
+                    gain.cancelScheduledValues(State.settings.audioContext.currentTime);
+                    gain.setValueAtTime(0, State.settings.audioContext.currentTime);
                 }
             }
         };
@@ -3464,23 +5637,34 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
             // INITIALIZATION & SESSION MANAGEMENT
             // =====================================
             init() {
+                Log.init();
+                Profiler.init();
+                Timeline.init();
                 this.Audio.init();
                 this.UI.init();
+                Governor.calibrate();
                 this.Controls.init();
+                this.Lifecycle.init();
+                this.Persistence.init();
+                this.DeckFile.init();
+                this.Sync.init();
                 MemoryEnhancement.init();
             },
             
-            startSession() {
+            async startSession() {
                 try {
-                    console.log('Starting session...');
+                    Log.debug('Starting session...');
                     const sessionData = this.Input.validateAndParse();
-                    console.log('Session data:', sessionData);
                     if (!sessionData) {
-                        console.log('Session data validation failed');
+                        Log.debug('Session data validation failed');
                         return;
                     }
                     
+                    // Pasted text can be the last deck too; its counters load only now
+                    await this.Persistence.recognize(sessionData.source);
+                    this.Persistence.restoreProgress(sessionData.cards, sessionData.source);
                     this.Session.initialize(sessionData);
+                    this.Persistence.saveDeck(State.cards.all, sessionData.source, sessionData.name);
                     this.Phase.initialize();
                     this.UI.switchToStudyScreen();
                     this.Phase.start(0);
@@ -3488,7 +5672,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     this.Achievement.show('Session Initiated', `${State.cards.all.length} items prepared for study`);
                     MemoryEnhancement.orchestrate('phaseStart');
                 } catch (error) {
-                    console.error('Error starting session:', error);
+                    Log.error('Error starting session:', error);
                     alert('Error starting session: ' + error.message);
                     this.Error.handle('startSession', error);
                 }
@@ -3499,36 +5683,50 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
             // =====================================
             Input: {
                 validateAndParse() {
-                    console.log('Validating input...');
                     const hoursInput = document.getElementById('hours').value;
-                    const questionsInput = document.getElementById('questions').value.trim();
-                    
-                    console.log('Hours input:', hoursInput);
-                    console.log('Questions input length:', questionsInput.length);
+                    const questionsText = document.getElementById('questions').value;
+                    const questionsInput = questionsText.trim();
+                    Log.debug(() => `Validating input: ${hoursInput} hours, ${questionsInput.length} characters of material`);
                     
                     // Clear previous errors
                     this.clearErrors();
                     
                     // Validate hours
                     if (!this.validateHours(hoursInput)) {
-                        console.log('Hours validation failed');
+                        Log.debug('Hours validation failed');
+                        return null;
+                    }
+                    
+                    // A dropped deck file takes precedence over the textarea
+                    const deckFile = ScholarSRS.DeckFile.deck;
+                    if (deckFile && !deckFile.ready) {
+                        this.showError('questions-error', `Still reading ${deckFile.name}, please wait a moment`);
                         return null;
                     }
                     
                     // Parse and validate questions
-                    const cards = this.parseQuestions(questionsInput);
+                    const cards = deckFile
+                        ? this.createCards(deckFile.questions, deckFile.answers)
+                        : this.parseQuestions(questionsText);
                     if (!cards) {
-                        console.log('Questions parsing failed');
+                        Log.debug('Questions parsing failed');
                         return null;
                     }
                     
-                    console.log('Validation successful, cards created:', cards.length);
+                    Log.info(`Session prepared with ${cards.length} cards`);
                     return {
                         totalHours: parseFloat(hoursInput),
-                        cards: cards
+                        cards: cards,
+                        source: deckFile ? deckFile.source : this.sourceKey(questionsInput),
+                        name: deckFile ? deckFile.name : null
                     };
                 },
                 
+                // Identifies textarea material without keeping a copy of it
+                sourceKey(text) {
+                    return `text:${text.length}:${deckHash(new TextEncoder().encode(text)).toString(16)}`;
+                },
+                
                 validateHours(hoursInput) {
                     if (!hoursInput || isNaN(parseFloat(hoursInput)) || parseFloat(hoursInput) < 0.5) {
                         this.showError('hours-error', 'Please specify at least 0.5 hours (numeric value required)');
@@ -3537,75 +5735,46 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     return true;
                 },
                 
-                parseQuestions(questionsInput) {
-                    console.log('Parsing questions...');
-                    if (!questionsInput) {
-                        console.log('No questions input provided');
+                // Takes the untrimmed textarea text so reported line numbers match it
+                parseQuestions(questionsText) {
+                    if (!questionsText.trim()) {
                         this.showError('questions-error', 'Please provide your study material');
                         return null;
                     }
                     
-                    const lines = questionsInput.split('\n').filter(line => line.trim());
-                    console.log('Lines after split:', lines.length);
+                    const lines = questionsText.split('\n');
+                    const store = CardStore.create(lines.length);
                     const cards = [];
-                    let invalidLines = [];
+                    const invalidLines = [];
                     
-                    for (let i = 0; i < lines.length; i++) {
-                        const line = lines[i].trim();
-                        if (!line) continue;
-                        
-                        const parts = line.split('::');
-                        console.log(`Line ${i+1}: "${line}" -> parts:`, parts.length);
-                        if (parts.length === 2 && parts[0].trim() && parts[1].trim()) {
-                            cards.push(this.createCard(parts[0].trim(), parts[1].trim(), cards.length));
-                            console.log(`Created card: ${parts[0].trim()} -> ${parts[1].trim()}`);
-                        } else {
-                            invalidLines.push(i + 1);
-                            console.log(`Invalid line ${i+1}: "${line}"`);
-                        }
-                    }
+                    lines.forEach(deckLineReader(
+                        (question, answer) => cards.push(store.add(question, answer)),
+                        (lineNumber) => invalidLines.push(lineNumber)
+                    ));
                     
-                    console.log('Total cards created:', cards.length);
-                    console.log('Invalid lines:', invalidLines);
+                    Log.debug(() => `Parsed ${cards.length} cards, ${invalidLines.length} invalid lines`);
                     
                     if (cards.length === 0) {
-                        const errorMsg = invalidLines.length > 0 
-                            ? `No valid entries found. Check lines: ${invalidLines.join(', ')}. Use format: Question::Answer`
-                            : 'No valid entries found. Please use format: Question::Answer';
-                        this.showError('questions-error', errorMsg);
+                        this.showError('questions-error', this.noEntriesMessage(invalidLines));
                         return null;
                     }
                     
+                    store.trim();
                     return cards;
                 },
                 
-                createCard(question, answer, id) {
-                    const card = {
-                        question,
-                        answer,
-                        id,
-                        difficulty: 0,
-                        lastSeen: -1,
-                        nextReview: 0,
-                        correctCount: 0,
-                        wrongCount: 0,
-                        totalSeen: 0,
-                        consecutiveCorrect: 0,
-                        avgResponseTime: 0,
-                        lastResponseTime: 0,
-                        createdAt: performance.now()
-                    };
-                    
-                    // Initialize card statistics
-                    State.cards.stats.set(id, {
-                        responses: [],
-                        timestamps: [],
-                        phaseFirstSeen: -1,
-                        responseTimeHistory: [],
-                        difficultyHistory: []
-                    });
-                    
-                    return card;
+                noEntriesMessage(invalidLines) {
+                    return invalidLines.length > 0
+                        ? `No valid entries found. Check lines: ${invalidLines.join(', ')}. Use format: Question::Answer`
+                        : 'No valid entries found. Please use format: Question::Answer';
+                },
+                
+                // Card ids are indices into the returned array and into its CardStore
+                createCards(questions, answers) {
+                    const store = CardStore.create(questions.length);
+                    const cards = questions.map((question, index) => store.add(question, answers[index]));
+                    store.trim();
+                    return cards;
                 },
                 
                 clearErrors() {
@@ -3620,6 +5789,145 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 }
             },
             
+            // =====================================
+            // DECK FILE MODULE
+            // =====================================
+            // A .txt deck dropped on the setup screen is parsed off the main thread;
+            // cards arrive in transferred chunks and are kept as plain string lists
+            // until the session starts.
+            DeckFile: {
+                // { name, source, questions, answers, ready }
+                deck: null,
+                worker: null,
+                workerUrl: null,
+                
+                init() {
+                    const zone = document.getElementById('deck-drop');
+                    const picker = document.getElementById('deck-file');
+                    const textarea = document.getElementById('questions');
+                    if (!zone || !picker || !textarea) return;
+                    
+                    zone.addEventListener('dragover', (event) => {
+                        event.preventDefault();
+                        zone.classList.add('dragging');
+                    });
+                    zone.addEventListener('dragleave', () => zone.classList.remove('dragging'));
+                    zone.addEventListener('drop', (event) => {
+                        event.preventDefault();
+                        zone.classList.remove('dragging');
+                        if (event.dataTransfer.files.length) this.load(event.dataTransfer.files[0]);
+                    });
+                    picker.addEventListener('change', () => {
+                        if (picker.files.length) this.load(picker.files[0]);
+                        picker.value = '';
+                    });
+                    
+                    // Typing means the learner wants the textarea material after all
+                    textarea.addEventListener('input', () => {
+                        if (this.deck) {
+                            this.clear();
+                            this.showStatus('');
+                        }
+                    });
+                },
+                
+                load(file) {
+                    this.clear();
+                    ScholarSRS.Input.clearErrors();
+                    
+                    const deck = {
+                        name: file.name,
+                        source: null, // Set from the content hash once read
+                        questions: [],
+                        answers: [],
+                        ready: false
+                    };
+                    const decoder = new TextDecoder();
+                    this.deck = deck;
+                    this.showStatus(`Reading ${file.name}...`);
+                    
+                    this.worker = this.createWorker();
+                    this.worker.onmessage = ({ data }) => {
+                        switch (data.type) {
+                            case 'progress': {
+                                const percent = Math.round(100 * data.loaded / Math.max(data.total, 1));
+                                this.showStatus(`Reading ${file.name}: ${percent}% (${data.cards.toLocaleString()} items)`);
+                                break;
+                            }
+                            
+                            case 'cards': {
+                                const { offsets, bytes } = data;
+                                for (let i = 0; i + 2 < offsets.length; i += 2) {
+                                    deck.questions.push(decoder.decode(bytes.subarray(offsets[i], offsets[i + 1])));
+                                    deck.answers.push(decoder.decode(bytes.subarray(offsets[i + 1], offsets[i + 2])));
+                                }
+                                break;
+                            }
+                            
+                            case 'done':
+                                this.stopWorker();
+                                if (data.cards === 0) {
+                                    this.deck = null;
+                                    this.showStatus('');
+                                    ScholarSRS.Input.showError('questions-error',
+                                        `${file.name}: ${ScholarSRS.Input.noEntriesMessage(data.invalidLines)}`);
+                                    break;
+                                }
+                                deck.source = `file:${file.name}:${file.size}:${data.hash.toString(16)}`;
+                                deck.ready = true;
+                                ScholarSRS.Persistence.recognize(deck.source);
+                                this.showStatus(`Using ${file.name}: ${data.cards.toLocaleString()} items` +
+                                    (data.invalidCount ? `, skipped ${data.invalidCount.toLocaleString()} invalid line${data.invalidCount === 1 ? '' : 's'}` : '') +
+                                    '. Type in the box above to use that material instead.');
+                                break;
+                                
+                            case 'error':
+                                this.clear();
+                                this.showStatus('');
+                                ScholarSRS.Input.showError('questions-error', `Could not read ${file.name}: ${data.message}`);
+                                break;
+                        }
+                    };
+                    this.worker.postMessage(file);
+                },
+                
+                createWorker() {
+                    const source = `${parseDeckLine}\n${deckLineReader}\n${deckHash}\n(${deckWorkerMain})();`;
+                    this.workerUrl = URL.createObjectURL(new Blob([source], { type: 'text/javascript' }));
+                    return new Worker(this.workerUrl);
+                },
+                
+                stopWorker() {
+                    if (this.worker) {
+                        this.worker.terminate();
+                        this.worker = null;
+                    }
+                    if (this.workerUrl) {
+                        URL.revokeObjectURL(this.workerUrl);
+                        this.workerUrl = null;
+                    }
+                },
+                
+                clear() {
+                    this.stopWorker();
+                    this.deck = null;
+                },
+                
+                // A deck already in memory, e.g. one Persistence restored
+                use(deck) {
+                    this.clear();
+                    ScholarSRS.Input.clearErrors();
+                    this.deck = deck;
+                    this.showStatus(`Using ${deck.name}: ${deck.questions.length.toLocaleString()} items. ` +
+                        'Type in the box above to use that material instead.');
+                },
+                
+                showStatus(text) {
+                    const status = document.getElementById('deck-status');
+                    if (status) status.textContent = text;
+                }
+            },
+            
             // =====================================
             // SESSION MANAGEMENT MODULE
             // =====================================
@@ -3627,6 +5935,10 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 initialize(sessionData) {
                     // Reset all state
                     this.reset();
+                    Profiler.reset();
+                    State.scheduling.mode = new URLSearchParams(location.search).get('schedule') === 'due'
+                        ? 'due'
+                        : CONFIG.SCHEDULING.MODE;
                     
                     // Set session data
                     State.session.totalHours = sessionData.totalHours;
@@ -3637,6 +5949,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     State.session.preciseStartTime = now;
                     State.session.startTime = Date.now();
                     State.timing.rateCalculationStartTime = now;
+                    State.timing.lastRateSample = now;
                     State.timing.nextBreakTime = Date.now() + CONFIG.BREAK_INTERVAL;
                     
                     // Initialize card categorization
@@ -3645,20 +5958,17 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     });
                     
                     State.session.isActive = true;
+                    Governor.start();
                 },
                 
                 reset() {
                     // Clear intervals
-                    if (State.timing.timerInterval) clearInterval(State.timing.timerInterval);
+                    ScholarSRS.Timer.stop();
                     if (State.timing.breakInterval) clearInterval(State.timing.breakInterval);
                     
-                    // Clear quantum cycling intervals
-                    State.memoryEnhancement.quantumCyclingInterval.forEach(clearInterval);
-                    State.memoryEnhancement.quantumCyclingInterval = [];
-                    
-                    // Clear quantum vibration intervals
-                    State.memoryEnhancement.quantumVibrationIntervals.forEach(clearInterval);
-                    State.memoryEnhancement.quantumVibrationIntervals = [];
+                    // End all scheduled effects, including the delta wave pulse
+                    Effects.cancelAll();
+                    Governor.reset();
                     
                     // Clean up infrasonic oscillator
                     if (State.memoryEnhancement.infrasonicOscillator) {
@@ -3667,12 +5977,6 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                         State.memoryEnhancement.infrasonicOscillator = null;
                     }
                     
-                    // Clean up delta wave interval
-                    if (State.memoryEnhancement.deltaWaveInterval) {
-                        clearInterval(State.memoryEnhancement.deltaWaveInterval);
-                        State.memoryEnhancement.deltaWaveInterval = null;
-                    }
-                    
                     // Clean up accelerometer
                     if (State.memoryEnhancement.deviceMotionHandler) {
                         window.removeEventListener('devicemotion', State.memoryEnhancement.deviceMotionHandler);
@@ -3696,10 +6000,11 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                         longestStreak: 0,
                         cardsSeenInSession: 0,
                         cardsCompletedForRate: 0,
-                        rateHistory: [],
-                        last50ResponseTimes: [],
-                        successRateHistory: []
+                        qualityChanges: []
                     });
+                    State.performance.rateHistory.clear();
+                    State.performance.last50ResponseTimes.clear();
+                    State.performance.successRateHistory.clear();
                     
                     // Clear collections
                     State.cards.all = [];
@@ -3710,6 +6015,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     State.cards.difficult.clear();
                     
                     State.phase.queues = [];
+                    State.phase.membership = new Uint8Array(0);
+                    State.phase.unseenCount = 0;
+                    State.scheduling.logScale = 0;
                     
                     // Clear memory enhancement state
                     MemoryEnhancement.clearPreloadCache();
@@ -3731,16 +6039,12 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 },
                 
                 cleanup() {
-                    if (State.timing.timerInterval) clearInterval(State.timing.timerInterval);
+                    ScholarSRS.Timer.stop();
                     if (State.timing.breakInterval) clearInterval(State.timing.breakInterval);
                     
-                    // Clear quantum cycling intervals
-                    State.memoryEnhancement.quantumCyclingInterval.forEach(clearInterval);
-                    State.memoryEnhancement.quantumCyclingInterval = [];
-                    
-                    // Clear quantum vibration intervals
-                    State.memoryEnhancement.quantumVibrationIntervals.forEach(clearInterval);
-                    State.memoryEnhancement.quantumVibrationIntervals = [];
+                    // End all scheduled effects; the delta wave cleanup fades out its audio
+                    Effects.cancelAll();
+                    Governor.stop();
                     
                     // Clean up infrasonic oscillator
                     if (State.memoryEnhancement.infrasonicOscillator) {
@@ -3749,15 +6053,6 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                         State.memoryEnhancement.infrasonicOscillator = null;
                     }
                     
-                    // Clean up delta wave systems
-                    if (State.memoryEnhancement.deltaWaveInterval) {
-                        clearInterval(State.memoryEnhancement.deltaWaveInterval);
-                    }
-                    if (State.memoryEnhancement.schumannResonanceOscillator) {
-                        State.memoryEnhancement.schumannResonanceOscillator.stop();
-                        State.memoryEnhancement.schumannResonanceOscillator.disconnect();
-                    }
-                    
                     // Clean up accelerometer
                     if (State.memoryEnhancement.deviceMotionHandler) {
                         window.removeEventListener('devicemotion', State.memoryEnhancement.deviceMotionHandler);
@@ -3805,6 +6100,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                             `<p>• Total Reviews: ${State.performance.cardsSeenInSession}</p>` +
                             `<p>• Longest Streak: ${State.performance.longestStreak}</p>` +
                             `<p>• Memory Systems Active: ${State.memoryEnhancement.systemsActive.size}</p>` +
+                            (State.performance.qualityChanges.length
+                                ? `<p>• Quality Adjustments: ${State.performance.qualityChanges.length}</p>`
+                                : '') +
                             `</div>${ornament}` +
                             `<em>Your dedication to learning has borne fruit.<br>The knowledge is now yours to keep.</em>`;
                         answerElement.classList.add('show');
@@ -3837,16 +6135,17 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
             Phase: {
                 initialize() {
                     try {
-                        State.phase.queues = Array(CONFIG.PHASES.length).fill(null).map(() => []);
+                        State.phase.queues = Array(CONFIG.PHASES.length).fill(null).map(() => CardQueue.create(State.cards.all));
+                        State.phase.membership = new Uint8Array(State.cards.all.length);
                         
                         // Distribute cards across phases
                         State.cards.all.forEach(card => {
-                            State.phase.queues[0].push(card);
+                            this.enqueue(0, card);
                             
                             for (let i = 1; i < CONFIG.PHASES.length; i++) {
                                 const probability = Math.max(0.3, 0.9 - (i * 0.1));
                                 if (Math.random() < probability) {
-                                    State.phase.queues[i].push(card);
+                                    this.enqueue(i, card);
                                 }
                             }
                         });
@@ -3856,20 +6155,52 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                             if (State.phase.queues[i].length === 0 && State.cards.all.length > 0) {
                                 const sampleSize = Math.ceil(State.cards.all.length * 0.3);
                                 const shuffledCards = [...State.cards.all].sort(() => Math.random() - 0.5);
-                                State.phase.queues[i] = shuffledCards.slice(0, sampleSize);
+                                this.setQueue(i, shuffledCards.slice(0, sampleSize));
                             }
                         }
                         
                         // Shuffle all queues
-                        State.phase.queues.forEach(queue => ScholarSRS.Utils.shuffleArray(queue));
+                        State.phase.queues.forEach(queue => queue.shuffle());
                         
                     } catch (error) {
                         // Fallback: all cards in all phases
-                        State.phase.queues = Array(CONFIG.PHASES.length).fill(null).map(() => [...State.cards.all]);
-                        State.phase.queues.forEach(queue => ScholarSRS.Utils.shuffleArray(queue));
+                        State.phase.queues = Array(CONFIG.PHASES.length).fill(null).map(() => CardQueue.create(State.cards.all));
+                        State.phase.membership = new Uint8Array(State.cards.all.length);
+                        State.phase.queues.forEach((queue, i) => this.setQueue(i, State.cards.all));
+                        State.phase.queues.forEach(queue => queue.shuffle());
                     }
                 },
                 
+                // Queue helpers: every change to a phase queue's contents goes
+                // through these so membership stays exact
+                isQueued(phaseIndex, card) {
+                    return (State.phase.membership[card.id] & (1 << phaseIndex)) !== 0;
+                },
+                
+                enqueue(phaseIndex, card) {
+                    State.phase.queues[phaseIndex].pushBack(card);
+                    State.phase.membership[card.id] |= 1 << phaseIndex;
+                },
+                
+                insertAt(phaseIndex, position, card) {
+                    State.phase.queues[phaseIndex].insertAt(position, card);
+                    State.phase.membership[card.id] |= 1 << phaseIndex;
+                },
+                
+                dequeue(phaseIndex) {
+                    const card = State.phase.queues[phaseIndex].popFront();
+                    if (card) State.phase.membership[card.id] &= ~(1 << phaseIndex);
+                    return card;
+                },
+                
+                // Replace a queue wholesale from an array of cards (e.g. a reorder that may drop cards)
+                setQueue(phaseIndex, cards) {
+                    const bit = 1 << phaseIndex;
+                    (State.phase.queues[phaseIndex] || []).forEach(card => { State.phase.membership[card.id] &= ~bit; });
+                    cards.forEach(card => { State.phase.membership[card.id] |= bit; });
+                    State.phase.queues[phaseIndex] = CardQueue.from(State.cards.all, cards);
+                },
+                
                 start(phaseIndex) {
                     try {
                         if (phaseIndex >= CONFIG.PHASES.length) {
@@ -3888,8 +6219,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                         this.prepareQueue();
                         
                         // Start timer
-                        if (State.timing.timerInterval) clearInterval(State.timing.timerInterval);
-                        State.timing.timerInterval = setInterval(() => ScholarSRS.Timer.update(), CONFIG.PROGRESS_UPDATE_INTERVAL);
+                        ScholarSRS.Timer.start();
                         
                         // Trigger memory systems
                         MemoryEnhancement.orchestrate('phaseStart');
@@ -3911,12 +6241,17 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 
                 prepareQueue() {
                     try {
+                        State.phase.unseenCount = 0;
                         if (!State.phase.queues[State.phase.current]) {
-                            State.phase.queues[State.phase.current] = [];
+                            State.phase.queues[State.phase.current] = CardQueue.create(State.cards.all);
                             return;
                         }
                         
-                        ScholarSRS.Utils.shuffleArray(State.phase.queues[State.phase.current]);
+                        State.phase.queues[State.phase.current].forEach(card => {
+                            if (card.totalSeen === 0) State.phase.unseenCount++;
+                        });
+                        State.phase.queues[State.phase.current].shuffle();
+                        if (State.scheduling.mode === 'due') this.prepareDueQueue();
                         ScholarSRS.Stats.updateRemaining();
                         
                     } catch (error) {
@@ -3924,6 +6259,26 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     }
                 },
                 
+                // Unseen cards have no due time yet: spread them evenly over this phase's
+                // share of the session, then order the whole queue by due time
+                prepareDueQueue() {
+                    const queue = State.phase.queues[State.phase.current];
+                    const now = (performance.now() - State.session.preciseStartTime) / 60000;
+                    const phaseMinutes = State.session.totalHours * 60 * CONFIG.PHASES[State.phase.current].percentage;
+                    const spacing = phaseMinutes / Math.max(1, State.phase.unseenCount);
+                    
+                    let introduced = 0;
+                    queue.forEach(card => {
+                        if (card.totalSeen === 0) card.due = now + spacing * introduced++;
+                    });
+                    const { REKEY_SCALE_STEP, REKEY_FRACTION, REKEY_MIN_OPS } = CONFIG.SCHEDULING;
+                    State.phase.queues[State.phase.current] = DueHeap.from(State.cards.all, queue.slice(), {
+                        key: card => ScholarSRS.Card.dueAt(card),
+                        epoch: () => Math.round(State.scheduling.logScale / Math.log(REKEY_SCALE_STEP)),
+                        rekeyAfter: Math.max(REKEY_MIN_OPS, Math.ceil(queue.length * REKEY_FRACTION))
+                    });
+                },
+                
                 complete() {
                     try {
                         if (State.phase.current < CONFIG.PHASES.length - 1) {
@@ -3956,7 +6311,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                         }
                         
                         // Get next card
-                        State.cards.current = State.phase.queues[State.phase.current].shift();
+                        State.cards.current = ScholarSRS.Phase.dequeue(State.phase.current);
                         if (!State.cards.current) {
                             ScholarSRS.Phase.complete();
                             return;
@@ -3979,9 +6334,52 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     }
                 },
                 
+                // Effective review time, with System 2's scaling applied since it was set
+                nextReview(card) {
+                    return card.nextReview * Math.exp(State.scheduling.logScale - card.reviewLogBase);
+                },
+                
+                setNextReview(card, value) {
+                    card.nextReview = value;
+                    card.reviewLogBase = State.scheduling.logScale;
+                },
+                
+                // Session minute the card comes due ('due' scheduling): card.due is when
+                // its interval started, so System 2 rescaling the interval moves it
+                dueAt(card) {
+                    return card.due + this.nextReview(card);
+                },
+                
+                // Sets the card's review interval from the answer and starts it now. A
+                // correct answer advances through the System 8 quantum schedule (the
+                // card's own, once System 8 has tailored one); a wrong answer starts it
+                // over. A skip brings the card back after a fixed, unscaled delay.
+                scheduleReview(card, outcome) {
+                    const now = (performance.now() - State.session.preciseStartTime) / 60000;
+                    if (outcome === 'skip') {
+                        this.setNextReview(card, 0);
+                        card.due = now + CONFIG.SCHEDULING.SKIP_INTERVAL;
+                        return;
+                    }
+                    
+                    if (outcome === 'correct') {
+                        const stats = State.cards.stats.get(card.id);
+                        const schedule = (stats && stats.quantumSchedule) || State.memoryEnhancement.quantumSchedule;
+                        this.setNextReview(card, schedule[Math.min(card.reviewStep, schedule.length - 1)]);
+                        card.reviewStep++;
+                    } else {
+                        this.setNextReview(card, CONFIG.SCHEDULING.RELEARN_INTERVAL);
+                        card.reviewStep = 0;
+                    }
+                    card.due = now;
+                },
+                
                 updateCardState() {
                     const now = performance.now();
                     State.cards.current.lastSeen = (now - State.session.preciseStartTime) / (1000 * 60);
+                    // The card was just taken from the current queue. Skipped and
+                    // rescheduled cards go back already seen, so only this changes the count.
+                    if (State.cards.current.totalSeen === 0) State.phase.unseenCount--;
                     State.cards.current.totalSeen++;
                     State.cards.current.lastResponseTime = now;
                     State.performance.cardsSeenInSession++;
@@ -4064,6 +6462,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                         this.updateCardStats(true);
                         this.categorizeCard(true);
                         this.recordResponse(true);
+                        this.scheduleReview(State.cards.current, 'correct');
                         this.checkAchievements();
                         
                         // Trigger memory systems with correct response
@@ -4087,6 +6486,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                         this.updateCardStats(false);
                         this.categorizeCard(false);
                         this.recordResponse(false);
+                        this.scheduleReview(State.cards.current, 'wrong');
                         this.rescheduleCard();
                         
                         // Trigger memory systems with incorrect response
@@ -4106,7 +6506,9 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     try {
                         if (!State.cards.current || !State.phase.queues[State.phase.current]) return;
                         
-                        State.phase.queues[State.phase.current].push(State.cards.current);
+                        this.scheduleReview(State.cards.current, 'skip');
+                        ScholarSRS.Phase.enqueue(State.phase.current, State.cards.current);
+                        ScholarSRS.Sync.record(State.cards.current, 'skip');
                         ScholarSRS.Stats.update();
                         this.showNext();
                         
@@ -4123,9 +6525,6 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     // Track response time
                     const responseTime = performance.now() - State.timing.cardDisplayStartTime;
                     State.performance.last50ResponseTimes.push(responseTime);
-                    if (State.performance.last50ResponseTimes.length > 50) {
-                        State.performance.last50ResponseTimes.shift();
-                    }
                     
                     if (isCorrect) {
                         State.performance.totalCorrect++;
@@ -4180,24 +6579,24 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 },
                 
                 recordResponse(isCorrect) {
-                    const stats = State.cards.stats.get(State.cards.current.id);
-                    if (stats) {
-                        stats.responses.push(isCorrect);
-                        stats.timestamps.push(performance.now());
-                    }
+                    const stats = CardStore.stats(State.cards.current.id);
+                    stats.responses.push(isCorrect);
+                    stats.timestamps.push(performance.now());
+                    ScholarSRS.Sync.record(State.cards.current, isCorrect ? 'correct' : 'wrong');
+                    Log.debugEvery(25, 'response', () => `Response ${State.performance.totalAttempts}: card ${State.cards.current.id} ${isCorrect ? 'correct' : 'wrong'}, phase ${State.phase.current + 1}`);
                 },
                 
                 rescheduleCard() {
                     // Add back to current phase queue
                     if (State.phase.queues[State.phase.current]) {
                         const insertPosition = Math.min(3, Math.floor(State.phase.queues[State.phase.current].length / 2));
-                        State.phase.queues[State.phase.current].splice(insertPosition, 0, State.cards.current);
+                        ScholarSRS.Phase.insertAt(State.phase.current, insertPosition, State.cards.current);
                     }
                     
                     // Add to future phases
                     for (let i = State.phase.current + 1; i < CONFIG.PHASES.length; i++) {
-                        if (State.phase.queues[i] && !State.phase.queues[i].some(card => card.id === State.cards.current.id)) {
-                            State.phase.queues[i].push(State.cards.current);
+                        if (State.phase.queues[i] && !ScholarSRS.Phase.isQueued(i, State.cards.current)) {
+                            ScholarSRS.Phase.enqueue(i, State.cards.current);
                         }
                     }
                 },
@@ -4221,15 +6620,10 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 start() {
                     try {
                         State.session.isBreak = true;
-                        clearInterval(State.timing.timerInterval);
+                        ScholarSRS.Timer.stop();
                         
-                        // Clear quantum cycling during break
-                        State.memoryEnhancement.quantumCyclingInterval.forEach(clearInterval);
-                        State.memoryEnhancement.quantumCyclingInterval = [];
-                        
-                        // Clear quantum vibration during break
-                        State.memoryEnhancement.quantumVibrationIntervals.forEach(clearInterval);
-                        State.memoryEnhancement.quantumVibrationIntervals = [];
+                        // End card effects during break
+                        Effects.cancelScope('card', 'session');
                         
                         ScholarSRS.UI.switchToBreakScreen();
                         ScholarSRS.Audio.playBreak();
@@ -4275,35 +6669,20 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                         State.session.isBreak = false;
                         if (State.timing.breakInterval) clearInterval(State.timing.breakInterval);
                         
-                        // Clean up delta wave systems
-                        if (State.memoryEnhancement.deltaWaveInterval) {
-                            clearInterval(State.memoryEnhancement.deltaWaveInterval);
-                            State.memoryEnhancement.deltaWaveInterval = null;
-                            State.memoryEnhancement.deltaWavePulseActive = false;
-                        }
-                        if (State.memoryEnhancement.schumannResonanceOscillator) {
-                            State.memoryEnhancement.schumannGainNode.gain.exponentialRampToValueAtTime(
-                                0.001, State.settings.audioContext.currentTime + 0.5
-                            );
-                            setTimeout(() => {
-                                State.memoryEnhancement.schumannResonanceOscillator.stop();
-                                State.memoryEnhancement.schumannResonanceOscillator.disconnect();
-                                State.memoryEnhancement.schumannResonanceOscillator = null;
-                                State.memoryEnhancement.schumannGainNode = null;
-                            }, 500);
-                        }
+                        // Clean up delta wave systems (fades out the Schumann tone too)
+                        Effects.cancelScope('break');
                         
                         ScholarSRS.UI.switchToStudyScreen();
                         ScholarSRS.Audio.playSuccess();
                         ScholarSRS.Achievement.show('Session Resumed', 'Continue your path to mastery');
                         
-                        State.timing.timerInterval = setInterval(() => ScholarSRS.Timer.update(), CONFIG.PROGRESS_UPDATE_INTERVAL);
+                        ScholarSRS.Timer.start();
                         ScholarSRS.Card.showNext();
                         
                     } catch (error) {
                         ScholarSRS.Error.handle('breakEnd', error);
                         ScholarSRS.UI.switchToStudyScreen();
-                        State.timing.timerInterval = setInterval(() => ScholarSRS.Timer.update(), CONFIG.PROGRESS_UPDATE_INTERVAL);
+                        ScholarSRS.Timer.start();
                     }
                 },
                 
@@ -4326,67 +6705,113 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
             // =====================================
             // TIMER MODULE
             // =====================================
+            // The phase clock only wakes when something it shows will change: the
+            // next second of the countdown or the next 0.1% of the progress bar.
+            // Writes are skipped when unchanged and applied together in one frame.
             Timer: {
+                timeout: null,
+                frameHandle: null,
+                phaseDuration: 0,
+                widthStep: 0,
+                shown: {},
+                pending: [],
+                
+                start() {
+                    this.stop();
+                    this.phaseDuration = State.session.totalHours * 3600 * CONFIG.PHASES[State.phase.current].percentage * 1000;
+                    this.widthStep = Math.max(this.phaseDuration / 1000, 100);
+                    this.shown = {};
+                    this.update();
+                },
+                
+                stop() {
+                    clearTimeout(this.timeout);
+                    if (this.frameHandle !== null) cancelAnimationFrame(this.frameHandle);
+                    this.timeout = null;
+                    this.frameHandle = null;
+                    this.pending = [];
+                },
+                
                 update() {
+                    this.timeout = null;
                     if (State.session.isPaused) return;
                     
                     try {
-                        this.updatePhaseTimer();
-                        this.updateProgress();
-                        ScholarSRS.Stats.updateRate();
-                        this.checkPhaseCompletion();
+                        const elapsed = performance.now() - State.phase.preciseStartTime;
+                        this.updatePhaseTimer(elapsed);
+                        this.updateProgress(elapsed);
+                        this.requestFrame();
+                        
+                        // Schedule first: completing the phase restarts the timer for the next one
+                        this.timeout = setTimeout(() => this.update(), this.untilNextChange(elapsed));
+                        this.checkPhaseCompletion(elapsed);
                         
                     } catch (error) {
                         ScholarSRS.Error.handle('timerUpdate', error);
                     }
                 },
                 
-                updatePhaseTimer() {
-                    const now = performance.now();
-                    const phaseElapsed = now - State.phase.preciseStartTime;
-                    const phaseDuration = State.session.totalHours * 3600 * CONFIG.PHASES[State.phase.current].percentage * 1000;
+                untilNextChange(elapsed) {
+                    const remaining = this.phaseDuration - elapsed;
+                    if (remaining <= 0) return CONFIG.PHASE_OVERTIME_CHECK_INTERVAL;
                     
-                    const phaseRemaining = Math.max(0, phaseDuration - phaseElapsed);
+                    const untilSecond = remaining % 1000 || 1000;
+                    const untilWidthStep = this.widthStep - (elapsed % this.widthStep);
+                    // Land just past the boundary rather than just before it
+                    return Math.min(untilSecond, untilWidthStep, remaining) + 1;
+                },
+                
+                updatePhaseTimer(elapsed) {
+                    const phaseRemaining = Math.max(0, this.phaseDuration - elapsed);
                     const phaseHours = Math.floor(phaseRemaining / (3600 * 1000));
                     const phaseMinutes = Math.floor((phaseRemaining % (3600 * 1000)) / (60 * 1000));
                     const phaseSeconds = Math.floor((phaseRemaining % (60 * 1000)) / 1000);
                     
-                    const timerElement = document.getElementById('timer');
-                    if (timerElement) {
-                        timerElement.textContent = 
-                            `${phaseHours.toString().padStart(2, '0')}:${phaseMinutes.toString().padStart(2, '0')}:${phaseSeconds.toString().padStart(2, '0')}`;
-                    }
+                    this.write('timer', 
+                        `${phaseHours.toString().padStart(2, '0')}:${phaseMinutes.toString().padStart(2, '0')}:${phaseSeconds.toString().padStart(2, '0')}`);
                 },
                 
-                updateProgress() {
-                    const now = performance.now();
-                    const phaseElapsed = now - State.phase.preciseStartTime;
-                    const phaseDuration = State.session.totalHours * 3600 * CONFIG.PHASES[State.phase.current].percentage * 1000;
-                    
-                    const phaseProgress = Math.min(100, (phaseElapsed / phaseDuration) * 100);
-                    const phaseProgressBar = document.getElementById('phase-progress');
-                    const phaseProgressText = document.getElementById('phase-progress-text');
-                    
-                    if (phaseProgressBar) {
-                        phaseProgressBar.style.width = Math.max(0, phaseProgress) + '%';
+                updateProgress(elapsed) {
+                    const phaseProgress = Math.max(0, Math.min(100, (elapsed / this.phaseDuration) * 100));
+                    this.write('phase-progress', Math.floor(phaseProgress * 10) / 10 + '%', 'width');
+                    this.write('phase-progress-text', Math.floor(phaseProgress) + '%');
+                },
+                
+                write(id, value, styleProperty) {
+                    const key = styleProperty ? `${id}.${styleProperty}` : id;
+                    if (this.shown[key] === value) return;
+                    this.shown[key] = value;
+                    this.pending.push([id, value, styleProperty]);
+                },
+                
+                requestFrame() {
+                    if (this.frameHandle === null) {
+                        this.frameHandle = requestAnimationFrame(() => this.flush());
                     }
-                    if (phaseProgressText) {
-                        phaseProgressText.textContent = Math.floor(Math.max(0, Math.min(100, phaseProgress))) + '%';
+                },
+                
+                flush() {
+                    this.frameHandle = null;
+                    try {
+                        this.pending.forEach(([id, value, styleProperty]) => {
+                            const element = document.getElementById(id);
+                            if (!element) return;
+                            if (styleProperty) element.style[styleProperty] = value;
+                            else element.textContent = value;
+                        });
+                        this.pending = [];
+                        ScholarSRS.Stats.updateRate();
+                    } catch (error) {
+                        ScholarSRS.Error.handle('timerUpdate', error);
                     }
                 },
                 
-                checkPhaseCompletion() {
-                    const now = performance.now();
-                    const phaseElapsed = now - State.phase.preciseStartTime;
-                    const phaseDuration = State.session.totalHours * 3600 * CONFIG.PHASES[State.phase.current].percentage * 1000;
-                    
-                    if (phaseElapsed >= phaseDuration && 
-                        State.phase.queues[State.phase.current] && 
-                        State.phase.queues[State.phase.current].length > 0) {
-                        const unseenCards = State.phase.queues[State.phase.current].filter(card => card.totalSeen === 0);
-                        if (unseenCards.length === 0) {
-                            ScholarSRS.Phase.complete();
-                        }
+                checkPhaseCompletion(elapsed) {
+                    if (elapsed < this.phaseDuration) return;
+                    
+                    const queue = State.phase.queues[State.phase.current];
+                    if (queue && queue.length > 0 && State.phase.unseenCount === 0) {
+                        ScholarSRS.Phase.complete();
                     }
                 }
             },
@@ -4488,12 +6913,15 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     
                     const instantaneousRate = State.performance.cardsCompletedForRate / actualStudyTimeMinutes;
                     
-                    State.performance.rateHistory.push(instantaneousRate);
-                    if (State.performance.rateHistory.length > CONFIG.MOVING_AVERAGE_WINDOW) {
-                        State.performance.rateHistory.shift();
-                    }
+                    // The timer calls this at irregular intervals; one sample per
+                    // RATE_SAMPLE_INTERVAL elapsed keeps the moving average time-weighted
+                    const periods = Math.floor((now - State.timing.lastRateSample) / CONFIG.RATE_SAMPLE_INTERVAL);
+                    const samples = Math.min(periods, CONFIG.MOVING_AVERAGE_WINDOW);
+                    for (let i = 0; i < samples; i++) State.performance.rateHistory.push(instantaneousRate);
+                    State.timing.lastRateSample += periods * CONFIG.RATE_SAMPLE_INTERVAL;
+                    if (State.performance.rateHistory.count === 0) return;
                     
-                    const smoothedRate = State.performance.rateHistory.reduce((sum, rate) => sum + rate, 0) / State.performance.rateHistory.length;
+                    const smoothedRate = State.performance.rateHistory.mean();
                     const displayRate = Math.max(0, smoothedRate);
                     document.getElementById('cards-per-minute').textContent = displayRate.toFixed(1);
                 }
@@ -4533,24 +6961,16 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 },
                 
                 pauseTimers() {
-                    if (State.timing.timerInterval) clearInterval(State.timing.timerInterval);
+                    ScholarSRS.Timer.stop();
                     if (State.timing.breakInterval) clearInterval(State.timing.breakInterval);
                     
-                    // Pause quantum cycling
-                    State.memoryEnhancement.quantumCyclingInterval.forEach(clearInterval);
-                    State.memoryEnhancement.quantumCyclingInterval = [];
-                    
-                    // Pause quantum vibration
-                    State.memoryEnhancement.quantumVibrationIntervals.forEach(clearInterval);
-                    State.memoryEnhancement.quantumVibrationIntervals = [];
-                    
-                    // Pause delta wave systems
-                    if (State.memoryEnhancement.deltaWaveInterval) {
-                        clearInterval(State.memoryEnhancement.deltaWaveInterval);
-                    }
+                    // End card effects; freeze break effects (delta wave) until resume
+                    Effects.cancelScope('card', 'session');
+                    Effects.pause();
                 },
                 
                 resumeTimers() {
+                    Effects.resume();
                     if (State.session.isBreak) {
                         State.timing.breakInterval = setInterval(() => {
                             if (!State.session.isPaused) {
@@ -4562,13 +6982,8 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                                 }
                             }
                         }, 1000);
-                        
-                        // Resume delta wave systems if they were active
-                        if (State.memoryEnhancement.deltaWavePulseActive) {
-                            MemoryEnhancement.System40_DeltaWaveMemoryConsolidation();
-                        }
                     } else {
-                        State.timing.timerInterval = setInterval(() => ScholarSRS.Timer.update(), CONFIG.PROGRESS_UPDATE_INTERVAL);
+                        ScholarSRS.Timer.start();
                     }
                 },
                 
@@ -4579,6 +6994,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     State.phase.startTime = Date.now() - (performance.now() - State.phase.preciseStartTime);
                     State.timing.nextBreakTime += pauseDuration;
                     State.timing.rateCalculationStartTime += pauseDuration;
+                    State.timing.lastRateSample += pauseDuration;
                 },
                 
                 updatePauseUI(isPaused) {
@@ -4612,6 +7028,69 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 }
             },
             
+            // =====================================
+            // PAGE LIFECYCLE MODULE
+            // =====================================
+            // A hidden, frozen or bfcached tab is an implicit pause: the timer loop
+            // stops, effects are parked, audio is suspended, and on return the time
+            // away is accounted exactly like a pause. If the learner had already
+            // paused, that pause does the accounting and only audio is touched.
+            Lifecycle: {
+                suspendedAt: null,
+                suspendedPause: false,
+                
+                init() {
+                    document.addEventListener('visibilitychange', () => {
+                        if (document.visibilityState === 'hidden') this.suspend();
+                        else this.resume();
+                    });
+                    document.addEventListener('freeze', () => this.suspend());
+                    document.addEventListener('resume', () => {
+                        if (document.visibilityState === 'visible') this.resume();
+                    });
+                    window.addEventListener('pagehide', () => this.suspend());
+                    window.addEventListener('pageshow', (e) => {
+                        if (e.persisted) this.resume();
+                    });
+                },
+                
+                suspend() {
+                    if (!State.session.isActive || this.suspendedAt !== null) return;
+                    this.suspendedAt = performance.now();
+                    this.suspendedPause = State.session.isPaused;
+                    
+                    if (!this.suspendedPause) {
+                        ScholarSRS.Timer.stop();
+                        if (State.timing.breakInterval) clearInterval(State.timing.breakInterval);
+                        // Park card effects too, so they pick up where they left off
+                        Effects.pause();
+                    }
+                    
+                    const audioContext = State.settings.audioContext;
+                    if (audioContext && audioContext.state === 'running') {
+                        audioContext.suspend().catch(() => {});
+                    }
+                    Log.debug(`Session suspended (${document.visibilityState})`);
+                },
+                
+                resume() {
+                    if (this.suspendedAt === null) return;
+                    const hiddenFor = performance.now() - this.suspendedAt;
+                    this.suspendedAt = null;
+                    
+                    const audioContext = State.settings.audioContext;
+                    if (audioContext && audioContext.state === 'suspended') {
+                        audioContext.resume().catch(() => {});
+                    }
+                    
+                    if (!State.session.isActive || this.suspendedPause) return;
+                    State.timing.totalPausedTime += hiddenFor;
+                    ScholarSRS.Controls.adjustTimingsForPause(hiddenFor);
+                    ScholarSRS.Controls.resumeTimers();
+                    Log.debug(`Session resumed after ${Math.round(hiddenFor)}ms away`);
+                }
+            },
+            
             // =====================================
             // AUDIO MODULE
             // =====================================
@@ -4729,6 +7208,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                     document.querySelector('.study-screen').classList.remove('active');
                     document.querySelector('.break-screen').classList.remove('active');
                     document.querySelector('.setup-screen').classList.add('active');
+                    Governor.calibrate();
                 }
             },
             
@@ -4749,6 +7229,416 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 }
             },
             
+            // =====================================
+            // PERSISTENCE MODULE
+            // =====================================
+            Persistence: {
+                STORAGE_KEY: 'scholarSRS.lastDeckId',
+                PAGE_SIZE: 5000,
+                
+                SOURCE_STORAGE_KEY: 'scholarSRS.lastDeckSource',
+                
+                // The last saved deck, known by its summary until its cards are needed:
+                // { id, source, name, cardCount }. source is the key Input or DeckFile
+                // gave the material, so the same text or file is recognized again.
+                lastDeck: null,
+                // Its cards once fetched: { id, source, cardIds, questions, answers,
+                // progress }, where progress[i] has card i's correctCount, wrongCount
+                // and totalSeen
+                loadedDeck: null,
+                loading: null, // Promise of loadedDeck
+                
+                init() {
+                    const link = document.getElementById('deck-restore-link');
+                    if (link) {
+                        link.addEventListener('click', (event) => {
+                            event.preventDefault();
+                            this.restore();
+                        });
+                    }
+                    this.offerLastDeck();
+                },
+                
+                // Only the summary is fetched at startup; the cards load when the learner
+                // restores the deck or picks the same material again
+                async offerLastDeck() {
+                    try {
+                        const deckId = parseInt(localStorage.getItem(this.STORAGE_KEY), 10);
+                        if (!deckId) return;
+                        
+                        const response = await fetch(`/api/decks/${deckId}`);
+                        if (response.status === 404) {
+                            // Deleted, or the server database was reset
+                            this.forget();
+                            return;
+                        }
+                        if (!response.ok) throw new Error(`Loading deck ${deckId} failed: HTTP ${response.status}`);
+                        
+                        const deck = await response.json();
+                        this.lastDeck = {
+                            id: deckId,
+                            source: localStorage.getItem(this.SOURCE_STORAGE_KEY) || `deck:${deckId}`,
+                            name: deck.name,
+                            cardCount: deck.card_count
+                        };
+                        this.showOffer(true);
+                    } catch (error) {
+                        ScholarSRS.Error.handle('restoreDeck', error);
+                    }
+                },
+                
+                showOffer(visible) {
+                    const offer = document.getElementById('deck-restore');
+                    const label = document.getElementById('deck-restore-label');
+                    if (!offer || !label) return;
+                    offer.hidden = !visible || !this.lastDeck;
+                    if (this.lastDeck) {
+                        label.textContent = `Last deck: ${this.lastDeck.name} (${this.lastDeck.cardCount.toLocaleString()} items).`;
+                    }
+                },
+                
+                forget() {
+                    localStorage.removeItem(this.STORAGE_KEY);
+                    localStorage.removeItem(this.SOURCE_STORAGE_KEY);
+                    this.lastDeck = null;
+                    this.loadedDeck = null;
+                    this.loading = null;
+                    this.showOffer(false);
+                },
+                
+                async restore() {
+                    try {
+                        const deck = await this.load();
+                        if (!deck) return;
+                        this.showOffer(false);
+                        ScholarSRS.DeckFile.use({
+                            name: this.lastDeck.name,
+                            source: deck.source,
+                            questions: deck.questions,
+                            answers: deck.answers,
+                            ready: true
+                        });
+                    } catch (error) {
+                        ScholarSRS.Error.handle('restoreDeck', error);
+                    }
+                },
+                
+                // Fetches the last deck's cards once; resolves to loadedDeck, or to null
+                // if there is no last deck or the server no longer has it
+                load() {
+                    if (!this.lastDeck) return Promise.resolve(null);
+                    if (!this.loading) {
+                        const { id, source } = this.lastDeck;
+                        this.loading = this.fetchDeck(id).then(cards => {
+                            if (!cards) {
+                                this.forget();
+                                return null;
+                            }
+                            this.loadedDeck = {
+                                id,
+                                source,
+                                cardIds: cards.map(card => card.id),
+                                questions: cards.map(card => card.question),
+                                answers: cards.map(card => card.answer),
+                                progress: cards.map(card => ({
+                                    correctCount: card.correct_count,
+                                    wrongCount: card.wrong_count,
+                                    totalSeen: card.total_seen
+                                }))
+                            };
+                            return this.loadedDeck;
+                        });
+                        // A failed fetch can be retried
+                        this.loading.catch(() => { this.loading = null; });
+                    }
+                    return this.loading;
+                },
+                
+                // The learner picked material; if it is the last deck's, fetch its server
+                // ids and progress now so they are ready when the session starts
+                recognize(source) {
+                    const loaded = this.loadedDeck;
+                    if (!this.lastDeck || this.lastDeck.source !== source || (loaded && loaded.source === source)) {
+                        return Promise.resolve();
+                    }
+                    return this.load().catch(error => ScholarSRS.Error.handle('restoreDeck', error));
+                },
+                
+                // Resolves to null if the server has no such deck
+                async fetchDeck(deckId) {
+                    const cards = [];
+                    let after = -1;
+                    while (after !== null) {
+                        const response = await fetch(`/api/decks/${deckId}/cards?after=${after}&limit=${this.PAGE_SIZE}`);
+                        if (response.status === 404 && after === -1) return null;
+                        if (!response.ok) throw new Error(`Loading deck ${deckId} failed: HTTP ${response.status}`);
+                        const page = await response.json();
+                        cards.push(...page.cards);
+                        after = page.next_after;
+                    }
+                    return cards;
+                },
+                
+                // Carries the restored deck's study counters over to an unchanged deck's
+                // cards. Must run before Session.initialize so queues see them.
+                restoreProgress(cards, source) {
+                    const loaded = this.loadedDeck;
+                    if (!loaded || loaded.source !== source || loaded.cardIds.length !== cards.length) return;
+                    
+                    const { progress } = loaded;
+                    cards.forEach((card, index) => {
+                        card.correctCount = progress[index].correctCount;
+                        card.wrongCount = progress[index].wrongCount;
+                        card.totalSeen = progress[index].totalSeen;
+                    });
+                    // Another session on this deck in the same page continues from this one
+                    loaded.progress = cards;
+                },
+                
+                async saveDeck(cards, source, name) {
+                    try {
+                        // The last deck's material again, restored or not: reuse its server
+                        // ids instead of storing a copy
+                        let loaded = this.loadedDeck;
+                        if ((!loaded || loaded.source !== source) && this.lastDeck && this.lastDeck.source === source) {
+                            loaded = await this.load();
+                        }
+                        if (loaded && loaded.source === source && loaded.cardIds.length === cards.length) {
+                            cards.forEach((card, index) => { card.serverId = loaded.cardIds[index]; });
+                            return;
+                        }
+                        
+                        const deckName = name || `Session ${new Date().toLocaleString()}`;
+                        const response = await fetch('/api/decks', {
+                            method: 'POST',
+                            headers: { 'Content-Type': 'application/json' },
+                            body: JSON.stringify({
+                                name: deckName,
+                                cards: cards.map(card => ({ question: card.question, answer: card.answer }))
+                            })
+                        });
+                        if (!response.ok) throw new Error(`Saving deck failed: HTTP ${response.status}`);
+                        
+                        const deck = await response.json();
+                        cards.forEach((card, index) => { card.serverId = deck.card_ids[index]; });
+                        this.loadedDeck = { id: deck.id, source, cardIds: deck.card_ids, progress: cards };
+                        this.loading = null;
+                        this.lastDeck = { id: deck.id, source, name: deckName, cardCount: deck.card_count };
+                        localStorage.setItem(this.STORAGE_KEY, String(deck.id));
+                        localStorage.setItem(this.SOURCE_STORAGE_KEY, source);
+                    } catch (error) {
+                        // Studying works offline; the deck just isn't persisted
+                        ScholarSRS.Error.handle('saveDeck', error);
+                    }
+                }
+            },
+            
+            // =====================================
+            // REVIEW SYNC MODULE
+            // =====================================
+            // Answers only append to an in-memory outbox (mirrored to IndexedDB so a
+            // crash or reload loses nothing). Batches go to the server on a timer, when
+            // the tab is hidden, and by beacon on unload; event ids make resends harmless.
+            Sync: {
+                outbox: [],
+                db: null,
+                flushing: false,
+                retryAt: 0, // After a failed flush, wait for the next timed one
+                
+                init() {
+                    this.openStore().then(db => {
+                        this.db = db;
+                        this.restorePending();
+                    });
+                    
+                    setInterval(() => this.flush(), CONFIG.SYNC.FLUSH_INTERVAL);
+                    document.addEventListener('visibilitychange', () => {
+                        if (document.visibilityState === 'hidden') this.flush({ keepalive: true });
+                    });
+                    window.addEventListener('pagehide', () => this.beacon());
+                },
+                
+                record(card, outcome) {
+                    const event = {
+                        event_id: this.newEventId(),
+                        card_id: card.serverId !== undefined ? card.serverId : null,
+                        correct: outcome === 'correct',
+                        skipped: outcome === 'skip',
+                        response_ms: Math.round(performance.now() - State.timing.cardDisplayStartTime),
+                        phase: State.phase.current,
+                        reviewed_at: Date.now() / 1000,
+                        // Lets a card saved after the answer still be resolved to its server id
+                        local_id: card.id,
+                        session: State.session.startTime
+                    };
+                    
+                    this.outbox.push(event);
+                    this.persist([event]);
+                    if (this.outbox.length >= CONFIG.SYNC.MAX_BATCH && navigator.onLine !== false &&
+                        Date.now() >= this.retryAt) {
+                        this.flush();
+                    }
+                },
+                
+                newEventId() {
+                    if (window.crypto && typeof crypto.randomUUID === 'function') {
+                        return crypto.randomUUID();
+                    }
+                    return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+                },
+                
+                // Resolves pending server ids and returns up to MAX_BATCH sendable events
+                takeBatch() {
+                    const batch = [];
+                    const orphaned = [];
+                    const expired = Date.now() / 1000 - CONFIG.SYNC.UNRESOLVED_TTL;
+                    
+                    for (const event of this.outbox) {
+                        if (event.card_id === null) {
+                            const card = event.session === State.session.startTime ? State.cards.all[event.local_id] : null;
+                            if (card && card.serverId !== undefined) {
+                                event.card_id = card.serverId;
+                            } else if (!card || event.reviewed_at < expired) {
+                                // From an earlier session, or this session's deck save failed:
+                                // either way the card will never get a server id
+                                orphaned.push(event);
+                                continue;
+                            } else {
+                                continue;
+                            }
+                        }
+                        batch.push(event);
+                        if (batch.length >= CONFIG.SYNC.MAX_BATCH) break;
+                    }
+                    
+                    if (orphaned.length) this.remove(orphaned);
+                    return batch;
+                },
+                
+                serialize(batch) {
+                    return JSON.stringify({
+                        reviews: batch.map(event => ({
+                            event_id: event.event_id,
+                            card_id: event.card_id,
+                            correct: event.correct,
+                            skipped: event.skipped,
+                            response_ms: event.response_ms,
+                            phase: event.phase,
+                            reviewed_at: event.reviewed_at
+                        }))
+                    });
+                },
+                
+                async flush({ keepalive = false } = {}) {
+                    if (this.flushing || this.outbox.length === 0) return;
+                    this.flushing = true;
+                    
+                    try {
+                        const batch = this.takeBatch();
+                        if (batch.length === 0) return;
+                        
+                        const headers = { 'Content-Type': 'application/json' };
+                        let body = this.serialize(batch);
+                        if (typeof CompressionStream !== 'undefined') {
+                            const gzipped = new Blob([body]).stream().pipeThrough(new CompressionStream('gzip'));
+                            body = await new Response(gzipped).blob();
+                            headers['Content-Encoding'] = 'gzip';
+                        }
+                        
+                        const response = await fetch('/api/reviews', {
+                            method: 'POST',
+                            headers,
+                            body,
+                            keepalive: keepalive && (body.size || body.length) < CONFIG.SYNC.BODY_LIMIT
+                        });
+                        if (!response.ok) {
+                            // Other client errors reject this batch for good; resending it
+                            // would block every later event behind it
+                            if (response.status >= 400 && response.status < 500 &&
+                                response.status !== 408 && response.status !== 429) {
+                                this.remove(batch);
+                            }
+                            throw new Error(`Review sync failed: HTTP ${response.status}`);
+                        }
+                        
+                        this.remove(batch);
+                        this.retryAt = 0;
+                    } catch (error) {
+                        this.retryAt = Date.now() + CONFIG.SYNC.FLUSH_INTERVAL;
+                        // Unless rejected above, events stay queued and go out with the next flush
+                        ScholarSRS.Error.handle('reviewSync', error);
+                    } finally {
+                        this.flushing = false;
+                    }
+                },
+                
+                beacon() {
+                    if (!navigator.sendBeacon) return;
+                    let batch = this.takeBatch();
+                    if (batch.length === 0) return;
+                    
+                    // pagehide cannot wait for CompressionStream, so the body goes out as
+                    // plain JSON; halve the batch until it fits the beacon limit
+                    let body = new Blob([this.serialize(batch)], { type: 'application/json' });
+                    while (body.size > CONFIG.SYNC.BODY_LIMIT && batch.length > 1) {
+                        batch = batch.slice(0, batch.length >> 1);
+                        body = new Blob([this.serialize(batch)], { type: 'application/json' });
+                    }
+                    
+                    // Delivery is unconfirmed, so the events stay in IndexedDB and are
+                    // resent next visit; the server ignores the duplicates.
+                    navigator.sendBeacon('/api/reviews', body);
+                },
+                
+                remove(events) {
+                    const sent = new Set(events);
+                    this.outbox = this.outbox.filter(event => !sent.has(event));
+                    this.withStore('readwrite', store => events.forEach(event => store.delete(event.event_id)));
+                },
+                
+                openStore() {
+                    return new Promise(resolve => {
+                        if (!window.indexedDB) return resolve(null);
+                        try {
+                            const request = indexedDB.open('scholar-srs', 1);
+                            request.onupgradeneeded = () => request.result.createObjectStore('outbox', { keyPath: 'event_id' });
+                            request.onsuccess = () => resolve(request.result);
+                            request.onerror = () => resolve(null);
+                        } catch (error) {
+                            resolve(null);
+                        }
+                    });
+                },
+                
+                withStore(mode, callback) {
+                    if (!this.db) return;
+                    try {
+                        callback(this.db.transaction('outbox', mode).objectStore('outbox'));
+                    } catch (error) {
+                        ScholarSRS.Error.handle('reviewOutbox', error);
+                    }
+                },
+                
+                persist(events) {
+                    this.withStore('readwrite', store => events.forEach(event => store.put(event)));
+                },
+                
+                restorePending() {
+                    // Events recorded before the database opened
+                    this.persist(this.outbox);
+                    
+                    this.withStore('readonly', store => {
+                        const request = store.getAll();
+                        request.onsuccess = () => {
+                            const queued = new Set(this.outbox.map(event => event.event_id));
+                            request.result.forEach(event => {
+                                if (!queued.has(event.event_id)) this.outbox.push(event);
+                            });
+                        };
+                    });
+                }
+            },
+            
             // =====================================
             // UTILITY MODULE
             // =====================================
@@ -4773,6 +7663,7 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
                 handle(context, error) {
                     // Graceful error handling without user disruption
                     try {
+                        Log.warn(`${context}:`, error);
                         if (context === 'critical') {
                             // For critical errors, try to maintain basic functionality
                             ScholarSRS.Achievement.show('System Notice', 'Continuing with basic functionality');
@@ -4810,24 +7701,283 @@ What is the speed of light?::299,792,458 meters per second"></textarea>
 </body>
 </html>'''
 
+def render_page():
+    with app.app_context():
+        return render_template_string(HTML_TEMPLATE)
+
+def build_pages():
+    """Render HTML_TEMPLATE once so requests never touch Jinja.
+
+    The page shell is revalidated on every load; the CSS and JS it references are
+    fingerprinted and cached forever, so a repeat visit only re-fetches the shell.
+    The production bundle has its debug logging stripped.
+    """
+    shell, assets = build_static_assets(strip_debug_logging(render_page()))
+    return PrecompiledResponse(shell.encode('utf-8'), 'text/html', 'no-cache'), assets
+
+@functools.lru_cache(maxsize=None)
+def build_debug_page():
+    """Build the ?log=debug page (full logging bundle) the first time it is asked for."""
+    shell, assets = build_static_assets(render_page())
+    STATIC_ASSETS.update(assets)
+    return PrecompiledResponse(shell.encode('utf-8'), 'text/html', 'no-cache')
+
+INDEX_PAGE, STATIC_ASSETS = build_pages()
+mark_startup_phase('app build')
+
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    if request.args.get('log') in ('debug', 'trace'):
+        return build_debug_page().send()
+    return INDEX_PAGE.send()
+
+@app.route('/static/<filename>')
+def static_asset(filename):
+    asset = STATIC_ASSETS.get(filename)
+    if asset is None:
+        # May belong to the debug bundle, which each worker builds on demand
+        build_debug_page()
+        asset = STATIC_ASSETS.get(filename)
+    if asset is None:
+        abort(404)
+    return asset.send()
+
+@app.route('/healthz')
+def healthz():
+    response = jsonify(status='ok', startup_ms=STARTUP_PHASES)
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+def api_error(message, status=400):
+    return jsonify(error=message), status
+
+# Upper bound on a decompressed request body
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+def read_json_body():
+    """Decode a JSON request body, gunzipping it if needed.
+
+    navigator.sendBeacon cannot set Content-Encoding, so gzip is also recognised by
+    its magic bytes.
+    """
+    data = request.get_data(cache=False)
+    if request.content_encoding == 'gzip' or data[:2] == b'\x1f\x8b':
+        decompressor = zlib.decompressobj(wbits=31)
+        data = decompressor.decompress(data, MAX_REQUEST_BYTES)
+        if decompressor.unconsumed_tail:
+            raise ValueError('Request body too large')
+    return json.loads(data)
+
+SQLITE_INTEGER_RANGE = range(-2 ** 63, 2 ** 63)
+
+def sqlite_int(value):
+    number = int(value)
+    if number not in SQLITE_INTEGER_RANGE:
+        raise ValueError(f'{value!r} does not fit a 64-bit integer')
+    return number
+
+def finite_float(value):
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f'Expected a finite number, got {value!r}')
+    return number
+
+def parse_review(review):
+    if not isinstance(review, dict):
+        raise TypeError(f'Expected a review object, got {type(review).__name__}')
+    return {
+        'event_id': None if review.get('event_id') is None else str(review['event_id']),
+        'card_id': sqlite_int(review['card_id']),
+        'correct': 1 if review.get('correct') else 0,
+        'skipped': 1 if review.get('skipped') else 0,
+        'response_ms': None if review.get('response_ms') is None else finite_float(review['response_ms']),
+        'phase': None if review.get('phase') is None else sqlite_int(review['phase']),
+        'reviewed_at': finite_float(review.get('reviewed_at') or time.time()),
+    }
+
+@app.route('/api/decks', methods=['GET'])
+def api_list_decks():
+    return jsonify(decks=list_decks(get_db()))
+
+@app.route('/api/decks', methods=['POST'])
+def api_create_deck():
+    payload = request.get_json(silent=True) or {}
+    try:
+        cards = [(str(card['question']), str(card['answer'])) for card in payload['cards']]
+    except (KeyError, TypeError):
+        return api_error('Expected {"name": ..., "cards": [{"question": ..., "answer": ...}, ...]}')
+    if not cards:
+        return api_error('A deck needs at least one card')
+
+    deck_id, card_ids = create_deck(get_db(), str(payload.get('name') or 'Untitled deck'), cards)
+    return jsonify(id=deck_id, card_count=len(card_ids), card_ids=card_ids), 201
+
+@app.route('/api/decks/import', methods=['POST'])
+def api_import_deck():
+    """Create a deck from a (possibly chunked, possibly gzipped) Question::Answer text upload."""
+    stream = request.stream
+    if request.content_encoding == 'gzip':
+        stream = gzip.GzipFile(fileobj=stream, mode='rb')
+    name = request.args.get('name') or 'Imported deck'
+    try:
+        report = import_deck(get_db(), name, stream)
+    except (OSError, EOFError):
+        return api_error('Upload was truncated or is not valid gzip')
+    if report['id'] is None:
+        return jsonify(error='No valid Question::Answer lines found', **report), 400
+    return jsonify(report), 201
+
+@app.route('/api/decks/<int:deck_id>')
+def api_deck(deck_id):
+    deck = get_deck(get_db(), deck_id)
+    if deck is None:
+        return api_error(f'Deck {deck_id} not found', 404)
+    return jsonify(deck)
+
+@app.route('/api/decks/<int:deck_id>/cards')
+def api_deck_cards(deck_id):
+    after = request.args.get('after', -1, type=int)
+    limit = max(1, min(request.args.get('limit', 1000, type=int), 5000))
+    cards = fetch_cards(get_db(), deck_id, after, limit)
+    if not cards and after < 0:
+        return api_error(f'Deck {deck_id} not found', 404)
+    next_after = cards[-1]['position'] if len(cards) == limit else None
+    return jsonify(deck_id=deck_id, cards=cards, next_after=next_after)
+
+@app.route('/api/reviews', methods=['POST'])
+def api_record_reviews():
+    try:
+        reviews = [parse_review(review) for review in read_json_body()['reviews']]
+    except (KeyError, TypeError, ValueError, OverflowError, zlib.error):
+        return api_error('Expected {"reviews": [{"event_id": ..., "card_id": ..., "correct": ..., ...}, ...]}')
+
+    recorded, unknown_card_ids = record_reviews(get_db(), reviews)
+    return jsonify(accepted=len(reviews), recorded=recorded, unknown_card_ids=unknown_card_ids)
+
+@app.after_request
+def record_first_request(response):
+    if 'first request' not in STARTUP_PHASES and request.path != '/healthz':
+        mark_startup_phase('first request')
+        print(f"⏱️  Cold start: {format_startup_phases(STARTUP_PHASES)}")
+    return response
+
+def bind_server(host, port, strict_port):
+    """Bind the HTTP server; once this returns the socket is already accepting connections."""
+    try:
+        return make_server(host, port, app, threaded=True)
+    except OSError:
+        if strict_port:
+            raise
+    server = make_server(host, 0, app, threaded=True)
+    print(f"⚠️  Port {port} is already in use, using port {server.server_port} instead")
+    return server
+
+def choose_wsgi_server(requested):
+    if requested != 'auto':
+        return requested
+    if os.name != 'nt' and importlib.util.find_spec('gunicorn') is not None:
+        return 'gunicorn'
+    if importlib.util.find_spec('waitress') is None:
+        install_dependencies('waitress')
+    return 'waitress'
+
+def serve_with_gunicorn(args):
+    """Run `app` under gunicorn's pre-fork master; SIGTERM drains workers gracefully."""
+    from gunicorn.app.base import BaseApplication
+
+    options = {
+        'bind': f'{args.host}:{args.port}',
+        'workers': args.workers,
+        'threads': args.threads,
+        'worker_class': 'gthread' if args.threads > 1 else 'sync',
+        'keepalive': args.keep_alive,
+        'graceful_timeout': args.graceful_timeout,
+        # Pages are built at import time; share them with the workers copy-on-write
+        'preload_app': True,
+    }
+
+    class ScholarApplication(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    ScholarApplication().run()
+
+def serve_with_waitress(args):
+    """Run `app` on waitress' thread pool; SIGINT/SIGTERM stop accepting and drain the pool."""
+    from waitress.server import create_server
+
+    if args.workers > 1:
+        print(f"ℹ️  waitress runs a single process; ignoring --workers {args.workers}")
+    server = create_server(app, host=args.host, port=args.port, threads=args.threads,
+                           channel_timeout=args.keep_alive)
+    # server.run() drains the thread pool on KeyboardInterrupt; give it our timeout
+    server.task_dispatcher.shutdown = functools.partial(server.task_dispatcher.shutdown,
+                                                        timeout=args.graceful_timeout)
+
+    def request_shutdown(signum, frame):
+        print("\n🛑 Shutting down, letting in-flight requests finish...")
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGINT, request_shutdown)
+    signal.signal(signal.SIGTERM, request_shutdown)
+    try:
+        server.run()
+    finally:
+        server.close()
+
+def serve_production(args):
+    server = choose_wsgi_server(args.server)
+    print(f"🏭 Serving with {server} on http://{args.host}:{args.port} "
+          f"(workers={args.workers if server == 'gunicorn' else 1}, threads={args.threads}, "
+          f"keep-alive={args.keep_alive}s)")
+    if server == 'gunicorn':
+        serve_with_gunicorn(args)
+    else:
+        serve_with_waitress(args)
 
 if __name__ == "__main__":
+    args = parse_args()
+    DB_PATH = args.db
+    
+    if args.bench_startup:
+        benchmark_startup(args.bench_startup)
+        sys.exit(0)
+    
+    if args.bench_import:
+        benchmark_import(args.bench_import)
+        sys.exit(0)
+    
+    if args.load_test:
+        load_test(args.load_test, [int(n) for n in args.concurrency.split(',')], args.duration)
+        sys.exit(0)
+    
+    if args.serve:
+        serve_production(args)
+        sys.exit(0)
+    
     print("🎓 Scholar's Spaced Repetition System v2.0 - COMPLETE & FIXED")
     print("📚 Launching with ALL 42 Subliminal Memory Enhancement Systems")
     print()
     
-    if not check_port_availability():
+    print("🚀 Starting server...")
+    try:
+        server = bind_server(args.host, args.port, args.strict_port)
+    except OSError as e:
+        print(f"❌ Cannot bind {args.host}:{args.port}: {e}")
         input("Press Enter to exit...")
         sys.exit(1)
+    mark_startup_phase('bind')
+    url = f'http://{args.host}:{server.server_port}'
     
-    # Start browser after a small delay
-    Timer(1.0, open_browser).start()
+    # The socket is listening, so the browser can connect right away
+    if not args.no_browser:
+        threading.Thread(target=open_browser, args=[url], daemon=True).start()
     
-    print("🚀 Starting server...")
-    print("🌐 Access your learning system at: http://127.0.0.1:5000")
+    print(f"🌐 Access your learning system at: {url}")
     print()
     print("📖 Features:")
     print("   • Seven-phase progressive learning system")
@@ -4851,7 +8001,8 @@ if __name__ == "__main__":
     print("=" * 50)
     
     try:
-        app.run(debug=False, host='127.0.0.1', port=5000)
+        server.serve_forever()
     except KeyboardInterrupt:
+        server.server_close()
         print("\n\n✨ Thank you for using Scholar's SRS!")
         print("📚 Your knowledge journey continues!")
\ No newline at end of file
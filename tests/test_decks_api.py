@@ -0,0 +1,34 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import FCV1  # noqa: E402
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(FCV1, 'DB_PATH', str(tmp_path / 'scholar_srs.db'))
+    monkeypatch.setattr(FCV1, '_db_local', FCV1.threading.local())
+    return FCV1.app.test_client()
+
+
+def test_deck_summary_does_not_ship_cards(client):
+    created = client.post('/api/decks', json={'name': 'Biology', 'cards': [
+        {'question': 'q1', 'answer': 'a1'},
+        {'question': 'q2', 'answer': 'a2'},
+    ]}).get_json()
+    response = client.get('/api/decks/%d' % created['id'])
+    assert response.status_code == 200
+    summary = response.get_json()
+    assert summary['id'] == created['id']
+    assert summary['name'] == 'Biology'
+    assert summary['card_count'] == 2
+    assert 'cards' not in summary
+
+
+def test_missing_deck_summary_is_404(client):
+    response = client.get('/api/decks/12345')
+    assert response.status_code == 404
+    assert 'error' in response.get_json()
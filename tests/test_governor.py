@@ -0,0 +1,80 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import FCV1  # noqa: E402
+
+pytestmark = pytest.mark.skipif(shutil.which('node') is None, reason='needs node')
+
+# Runs the page's Governor against a fake clock: each requestAnimationFrame
+# callback fires one frame interval after the last
+HARNESS = r'''
+let now = 0;
+let frameMs = 1000 / 60;
+let pending = null;
+const performance = { now: () => now };
+const requestAnimationFrame = (callback) => { pending = callback; return 1; };
+const cancelAnimationFrame = () => { pending = null; };
+const PerformanceObserver = class { observe() { throw new Error('unsupported'); } };
+const Log = { info() {} };
+const Effects = { cancel() {} };
+const MemoryEnhancement = { SYSTEMS: [], rebuildSubscribers() {} };
+const State = {
+    session: { isActive: false, isPaused: false, preciseStartTime: 0 },
+    memoryEnhancement: { governed: new Set() },
+    performance: { qualityChanges: [] }
+};
+const run = (ms, fps) => {
+    frameMs = 1000 / fps;
+    const end = now + ms;
+    while (pending && now < end) {
+        now += frameMs;
+        const callback = pending;
+        pending = null;
+        callback(now);
+    }
+};
+%(governor)s
+const scenario = %(scenario)s;
+if (scenario.idleFps) {
+    Governor.calibrate();
+    run(Governor.WINDOW_MS * 2, scenario.idleFps);
+}
+State.session.isActive = true;
+Governor.start();
+run(Governor.WINDOW_MS * 10, scenario.sessionFps);
+console.log(JSON.stringify({ level: Governor.level, refreshRate: Governor.refreshRate }));
+'''
+
+
+def governor_source():
+    script = '\n'.join(re.findall(r'<script>(.*?)</script>', FCV1.HTML_TEMPLATE, re.S))
+    start = script.index('const Governor = {')
+    end = script.index('\n        };', start) + len('\n        };')
+    return script[start:end]
+
+
+def run_governor(**scenario):
+    code = HARNESS % {'governor': governor_source(), 'scenario': json.dumps(scenario)}
+    result = subprocess.run(['node', '-e', code], capture_output=True, text=True, timeout=30, check=True)
+    return json.loads(result.stdout)
+
+
+def test_device_slow_from_the_first_frame_sheds():
+    assert run_governor(sessionFps=20)['level'] > 0
+
+
+def test_session_slower_than_the_idle_setup_screen_sheds():
+    assert run_governor(idleFps=60, sessionFps=20)['level'] > 0
+
+
+def test_slow_screen_measured_idle_is_judged_against_itself():
+    result = run_governor(idleFps=30, sessionFps=30)
+    assert result['level'] == 0
+    assert result['refreshRate'] == pytest.approx(30, rel=0.05)
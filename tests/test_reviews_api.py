@@ -0,0 +1,43 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import FCV1  # noqa: E402
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(FCV1, 'DB_PATH', str(tmp_path / 'scholar_srs.db'))
+    monkeypatch.setattr(FCV1, '_db_local', FCV1.threading.local())
+    return FCV1.app.test_client()
+
+
+def post_reviews(client, body):
+    return client.post('/api/reviews', data=body, content_type='application/json')
+
+
+@pytest.mark.parametrize('body', [
+    '{"reviews": [{"card_id": 1e400}]}',
+    '{"reviews": [{"card_id": 1, "phase": 1e400}]}',
+    '{"reviews": [{"card_id": %d}]}' % 2 ** 70,
+    '{"reviews": [{"card_id": 1, "phase": %d}]}' % -2 ** 70,
+    '{"reviews": [5]}',
+    '{"reviews": [{"card_id": 1, "reviewed_at": "nan"}]}',
+])
+def test_out_of_range_or_malformed_reviews_are_rejected(client, body):
+    response = post_reviews(client, body)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_unknown_card_ids_are_skipped_and_reported(client):
+    deck = client.post('/api/decks', json={'cards': [{'question': 'q', 'answer': 'a'}]}).get_json()
+    card_id = deck['card_ids'][0]
+    response = client.post('/api/reviews', json={'reviews': [
+        {'event_id': 'known', 'card_id': card_id, 'correct': True},
+        {'event_id': 'unknown', 'card_id': card_id + 1000, 'correct': True},
+    ]})
+    assert response.status_code == 200
+    assert response.get_json() == {'accepted': 2, 'recorded': 1, 'unknown_card_ids': [card_id + 1000]}